@@ -4,19 +4,61 @@ from __future__ import annotations
 
 import logging
 
+import voluptuous as vol
+
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
-from homeassistant.const import Platform
+from homeassistant.const import CONF_NAME, Platform
+import homeassistant.helpers.config_validation as cv
+from homeassistant.helpers.discovery import async_load_platform
+
+from .const import (
+    CONF_MAINS,
+    CONF_SITE_METERS,
+    CONF_SUBMETERS,
+    CONF_TOLERANCE,
+    DEFAULT_TOLERANCE,
+)
+from .views import ZapDataView
+from .websocket_api import async_register_websocket_commands
 
 _LOGGER = logging.getLogger(__name__)
 
 DOMAIN = "sourceful_zap"
 PLATFORMS = [Platform.SENSOR]
 
+SITE_METER_SCHEMA = vol.Schema(
+    {
+        vol.Required(CONF_NAME): cv.string,
+        vol.Required(CONF_MAINS): vol.All(cv.ensure_list, [cv.string]),
+        vol.Optional(CONF_SUBMETERS, default=[]): vol.All(cv.ensure_list, [cv.string]),
+        vol.Optional(CONF_TOLERANCE, default=DEFAULT_TOLERANCE): cv.time_period,
+    }
+)
+
+CONFIG_SCHEMA = vol.Schema(
+    {
+        vol.Optional(DOMAIN): vol.Schema(
+            {vol.Optional(CONF_SITE_METERS, default=[]): [SITE_METER_SCHEMA]}
+        )
+    },
+    extra=vol.ALLOW_EXTRA,
+)
+
 
 async def async_setup(hass: HomeAssistant, config: dict) -> bool:
     """Set up the P1 Reader component."""
     _LOGGER.debug("Setting up P1 Reader integration")
+
+    async_register_websocket_commands(hass)
+    hass.http.register_view(ZapDataView())
+
+    # Virtual site meters aggregating several Zaps
+    for site_config in config.get(DOMAIN, {}).get(CONF_SITE_METERS, []):
+        hass.async_create_task(
+            async_load_platform(hass, Platform.SENSOR, DOMAIN, site_config, config)
+        )
+
     return True
 
 
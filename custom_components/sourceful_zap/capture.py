@@ -0,0 +1,204 @@
+"""Compressed capture log of raw P1 telegrams."""
+
+from __future__ import annotations
+
+import asyncio
+from datetime import date, datetime, time as dt_time, timedelta, tzinfo
+import gzip
+import json
+import logging
+import mmap
+from pathlib import Path
+import time
+from typing import Any, Iterator
+
+from homeassistant.core import Event, HomeAssistant
+
+_LOGGER = logging.getLogger(__name__)
+
+SEGMENT_SUFFIX = ".jsonl.gz"
+INDEX_SUFFIX = ".idx"
+
+
+class TelegramCapture:
+    """Batch raw telegrams in memory and append them to compressed segments.
+
+    Every flush writes one gzip member to the active segment and one line to
+    the segment's index (first ts, last ts, offset, length), so a reader can
+    decompress only the blocks covering the requested time range.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        path: str,
+        max_segment_bytes: int,
+        max_segment_age: timedelta,
+        max_total_bytes: int,
+        batch_size: int = 60,
+        flush_interval: timedelta = timedelta(minutes=1),
+    ) -> None:
+        """Initialize the capture sink."""
+        self.hass = hass
+        self.path = Path(path)
+        self.max_segment_bytes = max_segment_bytes
+        self.max_segment_age_ms = int(max_segment_age.total_seconds() * 1000)
+        self.max_total_bytes = max_total_bytes
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval.total_seconds()
+        self._buffer: list[tuple[int, list[str]]] = []
+        self._last_flush = time.monotonic()
+        self._flush_lock = asyncio.Lock()
+        self._segment: Path | None = None
+        self._segment_start = 0
+
+    def append(self, timestamp: int | None, data_lines: list[str]) -> None:
+        """Queue a telegram, flushing in the background when a batch is due."""
+        if timestamp is None:
+            timestamp = int(time.time() * 1000)
+        self._buffer.append((int(timestamp), list(data_lines)))
+
+        if (
+            len(self._buffer) >= self.batch_size
+            or time.monotonic() - self._last_flush >= self.flush_interval
+        ):
+            self.hass.async_create_task(self.async_flush())
+
+    async def async_flush(self, _event: Event | None = None) -> None:
+        """Write buffered telegrams to disk in the executor."""
+        async with self._flush_lock:
+            if not self._buffer:
+                return
+            batch, self._buffer = self._buffer, []
+            self._last_flush = time.monotonic()
+            try:
+                await self.hass.async_add_executor_job(self._write_batch, batch)
+            except OSError as err:
+                _LOGGER.error("Error writing telegram capture: %s", err)
+
+    def _write_batch(self, batch: list[tuple[int, list[str]]]) -> None:
+        """Append one compressed block and its index entry (runs in executor)."""
+        self.path.mkdir(parents=True, exist_ok=True)
+        first_ts = batch[0][0]
+        last_ts = batch[-1][0]
+
+        if self._segment is None or self._should_rotate(first_ts):
+            self._segment = self.path / f"{first_ts}{SEGMENT_SUFFIX}"
+            self._segment_start = first_ts
+            _LOGGER.debug("Starting capture segment %s", self._segment)
+
+        payload = "".join(
+            json.dumps({"ts": ts, "data": lines}, separators=(",", ":")) + "\n"
+            for ts, lines in batch
+        ).encode()
+        block = gzip.compress(payload)
+
+        with open(self._segment, "ab") as segment_file:
+            offset = segment_file.tell()
+            segment_file.write(block)
+        with open(_index_path(self._segment), "a", encoding="ascii") as index_file:
+            index_file.write(f"{first_ts} {last_ts} {offset} {len(block)}\n")
+
+        self._enforce_disk_limit()
+
+    def _should_rotate(self, timestamp: int) -> bool:
+        """Return True when the active segment is too large or too old."""
+        if timestamp - self._segment_start >= self.max_segment_age_ms:
+            return True
+        try:
+            return self._segment.stat().st_size >= self.max_segment_bytes
+        except OSError:
+            return False
+
+    def _enforce_disk_limit(self) -> None:
+        """Delete the oldest segments until the capture fits its budget."""
+        segments = _list_segments(self.path)
+        sizes = {
+            segment: segment.stat().st_size + _index_path(segment).stat().st_size
+            for segment in segments
+        }
+        total = sum(sizes.values())
+
+        for segment in segments:
+            if total <= self.max_total_bytes or segment == self._segment:
+                break
+            _LOGGER.debug("Removing capture segment %s", segment)
+            segment.unlink(missing_ok=True)
+            _index_path(segment).unlink(missing_ok=True)
+            total -= sizes[segment]
+
+
+class CaptureReader:
+    """Read telegrams back from a capture directory."""
+
+    def __init__(self, path: str) -> None:
+        """Initialize the reader."""
+        self.path = Path(path)
+
+    def read_day(
+        self, day: date, time_zone: tzinfo | None = None
+    ) -> Iterator[dict[str, Any]]:
+        """Yield all telegrams captured on a calendar day.
+
+        The day runs from midnight to midnight in time_zone, or in the host's
+        local time zone when it is None, which need not be the time zone
+        configured in Home Assistant.
+        """
+        return self.read(
+            datetime.combine(day, dt_time.min, time_zone),
+            datetime.combine(day + timedelta(days=1), dt_time.min, time_zone),
+        )
+
+    def read(self, start: datetime, end: datetime) -> Iterator[dict[str, Any]]:
+        """Yield telegrams with start <= ts < end in capture order.
+
+        Naive datetimes are taken as host local time.
+        """
+        start_ms = int(start.timestamp() * 1000)
+        end_ms = int(end.timestamp() * 1000)
+
+        for segment in _list_segments(self.path):
+            blocks = [
+                block
+                for block in _read_index(_index_path(segment))
+                if block[0] < end_ms and block[1] >= start_ms
+            ]
+            if not blocks:
+                continue
+
+            with open(segment, "rb") as segment_file, mmap.mmap(
+                segment_file.fileno(), 0, access=mmap.ACCESS_READ
+            ) as mapped:
+                for _, _, offset, length in blocks:
+                    payload = gzip.decompress(mapped[offset : offset + length])
+                    for line in payload.splitlines():
+                        record = json.loads(line)
+                        if start_ms <= record["ts"] < end_ms:
+                            yield record
+
+
+def _index_path(segment: Path) -> Path:
+    """Return the index file belonging to a segment."""
+    return segment.with_name(segment.name[: -len(SEGMENT_SUFFIX)] + INDEX_SUFFIX)
+
+
+def _list_segments(path: Path) -> list[Path]:
+    """Return non-empty segments ordered by their first timestamp."""
+    if not path.is_dir():
+        return []
+    segments = [
+        segment
+        for segment in path.glob(f"*{SEGMENT_SUFFIX}")
+        if segment.stat().st_size and _index_path(segment).exists()
+    ]
+    return sorted(segments, key=lambda segment: int(segment.name.split(".")[0]))
+
+
+def _read_index(index: Path) -> list[tuple[int, int, int, int]]:
+    """Parse a segment index into (first ts, last ts, offset, length) tuples."""
+    with open(index, encoding="ascii") as index_file:
+        return [
+            tuple(int(field) for field in line.split())
+            for line in index_file
+            if line.strip()
+        ]
@@ -9,3 +9,87 @@ DEFAULT_SCAN_INTERVAL = timedelta(seconds=10)
 
 CONF_ENDPOINT = "endpoint"
 CONF_SYSTEM_ENDPOINT = "system_endpoint"
+
+# Entity update classes: fast entities publish on every telegram, normal
+# and low entities at most once per publish interval. Low entities are the
+# first to be slowed down under load.
+UPDATE_CLASS_FAST = "fast"
+UPDATE_CLASS_NORMAL = "normal"
+UPDATE_CLASS_LOW = "low"
+CONF_PUBLISH_INTERVAL = "publish_interval"
+DEFAULT_PUBLISH_INTERVAL = timedelta(seconds=10)
+
+# Raw telegram capture
+CONF_CAPTURE_PATH = "capture_path"
+CONF_CAPTURE_SEGMENT_SIZE = "capture_segment_size"
+CONF_CAPTURE_SEGMENT_AGE = "capture_segment_age"
+CONF_CAPTURE_MAX_SIZE = "capture_max_size"
+DEFAULT_CAPTURE_SEGMENT_SIZE = 16  # MB
+DEFAULT_CAPTURE_SEGMENT_AGE = timedelta(days=1)
+DEFAULT_CAPTURE_MAX_SIZE = 512  # MB
+
+# Time-series export
+CONF_EXPORT = "export"
+CONF_TOPIC = "topic"
+CONF_MEASUREMENT = "measurement"
+CONF_BATCH_SIZE = "batch_size"
+CONF_FLUSH_INTERVAL = "flush_interval"
+PROTOCOL_UDP = "udp"
+PROTOCOL_TCP = "tcp"
+PROTOCOL_MQTT = "mqtt"
+DEFAULT_EXPORT_PORT = 8089
+DEFAULT_EXPORT_TOPIC = "zap/telegram"
+DEFAULT_MEASUREMENT = "zap"
+DEFAULT_BATCH_SIZE = 10
+DEFAULT_FLUSH_INTERVAL = timedelta(seconds=10)
+
+# Snapshot fan-out, formatted with the configured name
+SIGNAL_SNAPSHOT = "sourceful_zap_snapshot_{}"
+SIGNAL_SNAPSHOT_THROTTLED = "sourceful_zap_snapshot_throttled_{}"
+EVENT_SNAPSHOT = "sourceful_zap_snapshot"
+CONF_SNAPSHOT_THROTTLE = "snapshot_throttle"
+CONF_SNAPSHOT_EVENT = "snapshot_event"
+
+# Event loop guardrails
+TIER_SYSTEM = "system"
+TIER_POLL = "poll"
+CONF_MAX_LOOP_LAG = "max_loop_lag"
+DEFAULT_MAX_LOOP_LAG = timedelta(milliseconds=200)
+
+# Encrypted meters
+CONF_DECRYPTION_KEY = "decryption_key"
+CONF_AUTHENTICATION_KEY = "authentication_key"
+
+# Reading sanity filter
+CONF_FILTER_READINGS = "filter_readings"
+CONF_MAX_POWER = "max_power"
+DEFAULT_MAX_POWER = 100.0  # kW
+
+# Virtual site meters
+CONF_SITE_METERS = "site_meters"
+CONF_MAINS = "mains"
+CONF_SUBMETERS = "submeters"
+CONF_TOLERANCE = "tolerance"
+DEFAULT_TOLERANCE = timedelta(seconds=2)
+
+# Threshold triggers
+CONF_THRESHOLDS = "thresholds"
+CONF_OBIS = "obis"
+CONF_DURATION = "duration"
+CONF_HYSTERESIS = "hysteresis"
+EVENT_THRESHOLD = "sourceful_zap_threshold"
+
+# Coordinators by configured name, shared with the websocket API and HTTP view
+DATA_COORDINATORS = "sourceful_zap_coordinators"
+DEFAULT_LONG_POLL = 30  # seconds
+MAX_LONG_POLL = 60  # seconds
+WS_TYPE_SUBSCRIBE = "sourceful_zap/subscribe"
+CONF_OBIS_CODES = "obis_codes"
+CONF_MIN_INTERVAL = "min_interval"
+DEFAULT_MIN_INTERVAL = 0.25  # seconds
+MAX_MIN_INTERVAL = 60  # seconds
+
+# Energy cost
+CONF_COST = "cost"
+CONF_PRICE_ENTITY = "price_entity"
+CONF_EXPORT_PRICE_ENTITY = "export_price_entity"
@@ -0,0 +1,124 @@
+"""Listener and polling plumbing shared by the coordinators."""
+
+from __future__ import annotations
+
+from datetime import datetime, timedelta
+from typing import Callable
+
+from homeassistant.core import CALLBACK_TYPE, Event, HomeAssistant, callback
+from homeassistant.helpers.event import async_call_later
+from homeassistant.util import dt as dt_util
+
+from .const import UPDATE_CLASS_NORMAL
+from .load_guard import LoadGuard
+
+
+class ZapCoordinator:
+    """Keep listeners per update class and notify them."""
+
+    def __init__(
+        self, hass: HomeAssistant, update_classes: tuple[str, ...] = ()
+    ) -> None:
+        """Initialize the coordinator."""
+        self.hass = hass
+        self._listeners: dict[str, list[CALLBACK_TYPE]] = {
+            update_class: [] for update_class in (UPDATE_CLASS_NORMAL, *update_classes)
+        }
+
+    @callback
+    def async_add_listener(
+        self, update_callback: CALLBACK_TYPE, update_class: str = UPDATE_CLASS_NORMAL
+    ) -> Callable[[], None]:
+        """Listen for new data on the cadence of an update class."""
+        listeners = self._listeners[update_class]
+        listeners.append(update_callback)
+
+        @callback
+        def remove_listener() -> None:
+            listeners.remove(update_callback)
+
+        return remove_listener
+
+    @callback
+    def _notify(self, update_class: str = UPDATE_CLASS_NORMAL) -> None:
+        """Call the listeners of an update class."""
+        for update_callback in list(self._listeners[update_class]):
+            update_callback()
+
+
+class PollingCoordinator(ZapCoordinator):
+    """Poll a Zap endpoint on a self-scheduled interval.
+
+    The next poll is scheduled once the previous one completed, so a slow
+    Zap never has overlapping requests. The interval is stretched by the
+    load guard for the coordinator's tier.
+    """
+
+    tier: str
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        scan_interval: timedelta,
+        load_guard: LoadGuard | None = None,
+        update_classes: tuple[str, ...] = (),
+    ) -> None:
+        """Initialize the coordinator."""
+        super().__init__(hass, update_classes)
+        self.scan_interval = scan_interval
+        self.load_guard = load_guard
+        self._unsub_refresh: CALLBACK_TYPE | None = None
+        self._running = False
+
+    @property
+    def effective_scan_interval(self) -> timedelta:
+        """Return the poll interval after any slowdown under load."""
+        if self.load_guard is None:
+            return self.scan_interval
+        return self.scan_interval * self.load_guard.factor(self.tier)
+
+    async def async_update(self) -> None:
+        """Poll the Zap once."""
+        raise NotImplementedError
+
+    @callback
+    def async_start(self) -> None:
+        """Start polling the Zap every scan interval."""
+        self._running = True
+        self._schedule_refresh()
+
+    @callback
+    def async_stop(self, _event: Event | None = None) -> None:
+        """Stop polling."""
+        self._running = False
+        if self._unsub_refresh is not None:
+            self._unsub_refresh()
+            self._unsub_refresh = None
+
+    @callback
+    def async_request_refresh(self) -> None:
+        """Poll now and restart the schedule from this poll.
+
+        Does nothing while stopped or while a poll is in progress.
+        """
+        if self._unsub_refresh is None:
+            return
+        self._unsub_refresh()
+        self._unsub_refresh = None
+        self.hass.async_create_task(self._async_scheduled_update(dt_util.utcnow()))
+
+    @callback
+    def _schedule_refresh(self) -> None:
+        """Schedule the next poll."""
+        self._unsub_refresh = async_call_later(
+            self.hass, self.effective_scan_interval, self._async_scheduled_update
+        )
+
+    async def _async_scheduled_update(self, _now: datetime) -> None:
+        """Poll once and schedule the next poll after it completes."""
+        self._unsub_refresh = None
+        try:
+            await self.async_update()
+        finally:
+            if self._running:
+                self._schedule_refresh()
@@ -0,0 +1,312 @@
+"""Running energy cost from counter deltas and spot prices."""
+
+from __future__ import annotations
+
+from bisect import bisect_right
+from datetime import datetime, timedelta
+import logging
+from typing import Any, Iterator
+
+from homeassistant.core import (
+    CALLBACK_TYPE,
+    Event,
+    HomeAssistant,
+    State,
+    callback,
+)
+from homeassistant.helpers.event import async_track_state_change_event
+from homeassistant.helpers.storage import Store
+from homeassistant.util import dt as dt_util
+
+from .const import DOMAIN
+
+_LOGGER = logging.getLogger(__name__)
+
+STORAGE_VERSION = 1
+SAVE_DELAY = 30
+
+DIRECTION_IMPORT = "import"
+DIRECTION_EXPORT = "export"
+PERIOD_DAY = "day"
+PERIOD_MONTH = "month"
+
+COUNTERS = {DIRECTION_IMPORT: "1-0:1.8.0", DIRECTION_EXPORT: "1-0:2.8.0"}
+
+# Price table attributes, as provided by the Nordpool integration
+TABLE_ATTRIBUTES = ("raw_today", "raw_tomorrow")
+
+
+def _timestamp(value: Any) -> float | None:
+    """Return a table start or end as a timestamp."""
+    if isinstance(value, str):
+        value = dt_util.parse_datetime(value)
+    if isinstance(value, datetime):
+        return dt_util.as_utc(value).timestamp()
+    return None
+
+
+def _price(value: Any) -> float | None:
+    """Return a price, or None when it is unknown."""
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def _next_day(timestamp: float) -> float:
+    """Return the next local midnight after timestamp."""
+    day = dt_util.as_local(dt_util.utc_from_timestamp(timestamp)).date()
+    return dt_util.start_of_local_day(day + timedelta(days=1)).timestamp()
+
+
+def _next_month(timestamp: float) -> float:
+    """Return the start of the next local month after timestamp."""
+    first = (
+        dt_util.as_local(dt_util.utc_from_timestamp(timestamp)).date().replace(day=1)
+    )
+    return dt_util.start_of_local_day(
+        (first + timedelta(days=32)).replace(day=1)
+    ).timestamp()
+
+
+class PriceSource:
+    """Price per kWh over time, from a price entity.
+
+    The price is a step function. When the entity carries a price table it
+    is used as is, otherwise every state change of the entity starts a new
+    step, so a price change between two telegrams still splits the delta.
+    """
+
+    def __init__(self, hass: HomeAssistant, entity_id: str) -> None:
+        """Initialize the price source."""
+        self.hass = hass
+        self.entity_id = entity_id
+        self._starts: list[float] = []
+        self._prices: list[float | None] = []
+        self._has_table = False
+
+    @callback
+    def async_start(self) -> CALLBACK_TYPE:
+        """Follow the price entity."""
+        if (state := self.hass.states.get(self.entity_id)) is not None:
+            self._update(state)
+        return async_track_state_change_event(
+            self.hass, [self.entity_id], self._handle_state_change
+        )
+
+    @callback
+    def _handle_state_change(self, event: Event) -> None:
+        """Take over a new price or price table."""
+        if (state := event.data["new_state"]) is not None:
+            self._update(state)
+
+    def _update(self, state: State) -> None:
+        """Rebuild the steps from the entity's table, or add its state."""
+        steps = []
+        for attribute in TABLE_ATTRIBUTES:
+            for entry in state.attributes.get(attribute) or ():
+                start = _timestamp(entry.get("start"))
+                end = _timestamp(entry.get("end"))
+                if start is not None and end is not None:
+                    steps.append((start, end, _price(entry.get("value"))))
+
+        if steps:
+            steps.sort()
+            self._starts, self._prices = [], []
+            for index, (start, end, price) in enumerate(steps):
+                self._starts.append(start)
+                self._prices.append(price)
+                # Past the table (or in a gap) the price is unknown
+                if index + 1 == len(steps) or steps[index + 1][0] > end:
+                    self._starts.append(end)
+                    self._prices.append(None)
+            self._has_table = True
+            return
+
+        if self._has_table:
+            self._starts, self._prices = [], []
+            self._has_table = False
+        self._starts.append(state.last_changed.timestamp())
+        self._prices.append(_price(state.state))
+
+    def segments(
+        self, start: float, end: float
+    ) -> Iterator[tuple[float, float, float | None]]:
+        """Yield (start, end, price) pieces covering start to end."""
+        index = bisect_right(self._starts, start) - 1
+        while start < end:
+            price = self._prices[index] if index >= 0 else None
+            index += 1
+            next_start = self._starts[index] if index < len(self._starts) else end
+            piece_end = min(max(next_start, start), end)
+            yield start, piece_end, price
+            start = piece_end
+
+    def prune(self, before: float) -> None:
+        """Drop state steps no longer needed for deltas starting at before."""
+        if self._has_table:
+            return
+        if (index := bisect_right(self._starts, before) - 1) > 0:
+            del self._starts[:index]
+            del self._prices[:index]
+
+
+class CostAccumulator:
+    """Accumulate import cost and export revenue per day and month.
+
+    Each telegram adds the counter delta since the previous one, spread
+    evenly over the time between them and split wherever the price or the
+    day changes. Totals are persisted, so they survive restarts.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        name: str,
+        price_entity: str,
+        export_price_entity: str | None = None,
+    ) -> None:
+        """Initialize the accumulator."""
+        self.hass = hass
+        self.name = name
+        self.currency = hass.config.currency
+        import_source = PriceSource(hass, price_entity)
+        self._sources = {
+            DIRECTION_IMPORT: import_source,
+            DIRECTION_EXPORT: (
+                PriceSource(hass, export_price_entity)
+                if export_price_entity
+                else import_source
+            ),
+        }
+        self.totals = {
+            PERIOD_DAY: dict.fromkeys(COUNTERS, 0.0),
+            PERIOD_MONTH: dict.fromkeys(COUNTERS, 0.0),
+        }
+        self.period_start: dict[str, float] = {}
+        self._period_end: dict[str, float] = {}
+        self._last: dict[str, tuple[float, float]] = {}
+        self._store: Store[dict[str, Any]] = Store(
+            hass,
+            STORAGE_VERSION,
+            f"{DOMAIN}.cost_{name.lower().replace(' ', '_')}",
+        )
+        self._unsubs: list[CALLBACK_TYPE] = []
+
+    async def async_load(self) -> None:
+        """Restore totals from storage."""
+        self._set_periods(
+            dt_util.start_of_local_day().timestamp(),
+            dt_util.start_of_local_day(dt_util.now().date().replace(day=1)).timestamp(),
+        )
+
+        if (stored := await self._store.async_load()) is None:
+            return
+        try:
+            day_start = float(stored["day_start"])
+            month_start = float(stored["month_start"])
+            totals = {
+                period: {
+                    direction: float(stored["totals"][period][direction])
+                    for direction in COUNTERS
+                }
+                for period in self.totals
+            }
+            last = {
+                direction: (float(value[0]), float(value[1]))
+                for direction, value in stored["last"].items()
+            }
+        except (KeyError, TypeError, ValueError, IndexError) as err:
+            _LOGGER.warning("Ignoring invalid stored costs for %s: %s", self.name, err)
+            return
+
+        self._set_periods(day_start, month_start)
+        self.totals = totals
+        self._last = last
+        self._roll_periods(dt_util.utcnow().timestamp())
+
+    @callback
+    def async_start(self) -> None:
+        """Follow the price entities."""
+        for source in set(self._sources.values()):
+            self._unsubs.append(source.async_start())
+
+    @callback
+    def async_stop(self, _event: Event | None = None) -> None:
+        """Stop following the price entities."""
+        while self._unsubs:
+            self._unsubs.pop()()
+
+    @callback
+    def add(self, data: dict[str, dict[str, Any]], now: float) -> None:
+        """Add the counter deltas of one telegram."""
+        spans = []
+        for direction, obis_code in COUNTERS.items():
+            if (reading := data.get(obis_code)) is None:
+                continue
+            value = reading["value"]
+            last = self._last.get(direction)
+            self._last[direction] = (now, value)
+            # A decreasing counter is a meter swap or glitch, nothing to add
+            if last is not None and now > last[0] and value > last[1]:
+                spans.append((direction, last[0], (value - last[1]) / (now - last[0])))
+
+        # Close periods in order, so a delta across midnight lands on both days
+        cursor = float("-inf")
+        while True:
+            end = min(now, self._period_end[PERIOD_DAY])
+            for direction, start, rate in spans:
+                if (start := max(start, cursor)) < end:
+                    self._add_cost(direction, start, end, rate)
+            if now < self._period_end[PERIOD_DAY]:
+                break
+            cursor = self._period_end[PERIOD_DAY]
+            self._roll_periods(cursor)
+
+        for direction, start, _rate in spans:
+            self._sources[direction].prune(start)
+        self._store.async_delay_save(self._data_to_store, SAVE_DELAY)
+
+    def _add_cost(self, direction: str, start: float, end: float, rate: float) -> None:
+        """Add the cost of consuming rate kWh/s from start to end."""
+        cost = 0.0
+        for piece_start, piece_end, price in self._sources[direction].segments(
+            start, end
+        ):
+            if price is not None:
+                cost += rate * (piece_end - piece_start) * price
+        self.totals[PERIOD_DAY][direction] += cost
+        self.totals[PERIOD_MONTH][direction] += cost
+
+    def _roll_periods(self, now: float) -> None:
+        """Start new periods once their end has passed."""
+        while now >= self._period_end[PERIOD_DAY]:
+            day_start = self._period_end[PERIOD_DAY]
+            month_start = self.period_start[PERIOD_MONTH]
+            self._reset(PERIOD_DAY)
+            if day_start >= self._period_end[PERIOD_MONTH]:
+                month_start = self._period_end[PERIOD_MONTH]
+                self._reset(PERIOD_MONTH)
+            self._set_periods(day_start, month_start)
+
+    def _reset(self, period: str) -> None:
+        """Zero the totals of a period."""
+        self.totals[period] = dict.fromkeys(COUNTERS, 0.0)
+
+    def _set_periods(self, day_start: float, month_start: float) -> None:
+        """Set the current periods and when they end."""
+        self.period_start = {PERIOD_DAY: day_start, PERIOD_MONTH: month_start}
+        self._period_end = {
+            PERIOD_DAY: _next_day(day_start),
+            PERIOD_MONTH: _next_month(month_start),
+        }
+
+    @callback
+    def _data_to_store(self) -> dict[str, Any]:
+        """Return the state to persist."""
+        return {
+            "day_start": self.period_start[PERIOD_DAY],
+            "month_start": self.period_start[PERIOD_MONTH],
+            "totals": self.totals,
+            "last": self._last,
+        }
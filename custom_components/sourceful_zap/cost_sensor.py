@@ -0,0 +1,96 @@
+"""Cost Sensor."""
+
+from __future__ import annotations
+
+from datetime import datetime
+from typing import Any
+
+from homeassistant.components.sensor import (
+    SensorDeviceClass,
+    SensorEntity,
+    SensorStateClass,
+)
+from homeassistant.core import callback
+from homeassistant.util import dt as dt_util
+
+from .const import DEFAULT_NAME, UPDATE_CLASS_NORMAL
+from .cost_accumulator import (
+    DIRECTION_EXPORT,
+    DIRECTION_IMPORT,
+    PERIOD_DAY,
+    PERIOD_MONTH,
+    CostAccumulator,
+)
+from .p1_coordinator import P1DataCoordinator
+from .system_data_coordinator import SystemDataCoordinator
+
+SENSOR_NAMES = {
+    (DIRECTION_IMPORT, PERIOD_DAY): "Import Cost Today",
+    (DIRECTION_IMPORT, PERIOD_MONTH): "Import Cost This Month",
+    (DIRECTION_EXPORT, PERIOD_DAY): "Export Revenue Today",
+    (DIRECTION_EXPORT, PERIOD_MONTH): "Export Revenue This Month",
+}
+
+
+class CostSensor(SensorEntity):
+    """Running import cost or export revenue of a day or month."""
+
+    _attr_should_poll = False
+    _attr_device_class = SensorDeviceClass.MONETARY
+    _attr_state_class = SensorStateClass.TOTAL
+
+    def __init__(
+        self,
+        coordinator: P1DataCoordinator,
+        system_coordinator: SystemDataCoordinator,
+        accumulator: CostAccumulator,
+        direction: str,
+        period: str,
+        name_prefix: str = DEFAULT_NAME,
+    ) -> None:
+        """Initialize the sensor."""
+        self.coordinator = coordinator
+        self.system_coordinator = system_coordinator
+        self.accumulator = accumulator
+        self.direction = direction
+        self.period = period
+        self._attr_name = f"{name_prefix} {SENSOR_NAMES[direction, period]}"
+        self._attr_unique_id = (
+            f"{name_prefix.lower().replace(' ', '_')}_cost_{direction}_{period}"
+        )
+        self._attr_native_unit_of_measurement = accumulator.currency
+        self._attr_icon = (
+            "mdi:cash-minus" if direction == DIRECTION_IMPORT else "mdi:cash-plus"
+        )
+        self._attr_native_value = None
+
+    @property
+    def device_info(self) -> dict[str, Any]:
+        """Return device information."""
+        return self.system_coordinator.zap_device_info
+
+    @property
+    def last_reset(self) -> datetime:
+        """Return the start of the current period."""
+        return dt_util.utc_from_timestamp(self.accumulator.period_start[self.period])
+
+    async def async_added_to_hass(self) -> None:
+        """Subscribe to the normal publish cadence."""
+        self._update_from_coordinator()
+        self.async_on_remove(
+            self.coordinator.async_add_listener(
+                self._handle_coordinator_update, UPDATE_CLASS_NORMAL
+            )
+        )
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Publish the running total."""
+        self._update_from_coordinator()
+        self.async_write_ha_state()
+
+    def _update_from_coordinator(self) -> None:
+        """Update the sensor."""
+        self._attr_native_value = round(
+            self.accumulator.totals[self.period][self.direction], 4
+        )
@@ -0,0 +1,259 @@
+"""Batched export of P1 telegrams to a time-series sink."""
+
+from __future__ import annotations
+
+import asyncio
+from collections import deque
+from datetime import datetime, timedelta
+import json
+import logging
+import time
+from typing import Any, Callable
+
+import async_timeout
+
+from homeassistant.core import Event, HomeAssistant
+from homeassistant.exceptions import HomeAssistantError
+from homeassistant.helpers.event import async_track_time_interval
+
+from .const import PROTOCOL_MQTT, PROTOCOL_UDP
+
+_LOGGER = logging.getLogger(__name__)
+
+MAX_DATAGRAM_SIZE = 8192
+MAX_RETRY_DELAY = 300
+# Upper bound for connecting and writing one batch to a socket sink
+SEND_TIMEOUT = 10
+
+
+def _escape(key: str) -> str:
+    """Escape a line protocol tag or field key."""
+    return key.replace(",", r"\,").replace("=", r"\=").replace(" ", r"\ ")
+
+
+def format_line_protocol(
+    measurement: str,
+    device: str,
+    timestamp: int,
+    data: dict[str, dict[str, Any]],
+) -> str:
+    """Format one telegram as a single line protocol point."""
+    fields = ",".join(
+        f"{_escape(obis_code)}={reading['value']}"
+        for obis_code, reading in data.items()
+    )
+    return (
+        f"{_escape(measurement)},device={_escape(device)} "
+        f"{fields} {timestamp * 1_000_000}"
+    )
+
+
+def format_json(device: str, timestamp: int, data: dict[str, dict[str, Any]]) -> str:
+    """Format one telegram as a single JSON payload."""
+    return json.dumps(
+        {
+            "device": device,
+            "ts": timestamp,
+            "values": {
+                obis_code: reading["value"] for obis_code, reading in data.items()
+            },
+        },
+        separators=(",", ":"),
+    )
+
+
+class _SocketSink:
+    """Send line protocol batches to a TCP or UDP listener."""
+
+    def __init__(self, host: str, port: int, protocol: str) -> None:
+        """Initialize the socket sink."""
+        self.host = host
+        self.port = port
+        self.protocol = protocol
+        self._transport: asyncio.DatagramTransport | None = None
+        self._writer: asyncio.StreamWriter | None = None
+
+    async def async_send(self, records: list[str]) -> None:
+        """Send a batch of records, raising OSError or TimeoutError when down."""
+        loop = asyncio.get_running_loop()
+
+        if self.protocol == PROTOCOL_UDP:
+            if self._transport is None or self._transport.is_closing():
+                self._transport, _ = await loop.create_datagram_endpoint(
+                    asyncio.DatagramProtocol, remote_addr=(self.host, self.port)
+                )
+            for datagram in _chunk(records, MAX_DATAGRAM_SIZE):
+                self._transport.sendto(datagram)
+            return
+
+        try:
+            # A blackholed sink must not hold the flush lock for the OS timeout
+            async with async_timeout.timeout(SEND_TIMEOUT):
+                if self._writer is None or self._writer.is_closing():
+                    _, self._writer = await asyncio.open_connection(
+                        self.host, self.port
+                    )
+                self._writer.write(
+                    "".join(f"{record}\n" for record in records).encode()
+                )
+                await self._writer.drain()
+        except (OSError, asyncio.TimeoutError):
+            if self._writer is not None:
+                self._writer.close()
+                self._writer = None
+            raise
+
+    def close(self) -> None:
+        """Close any open socket."""
+        if self._transport is not None:
+            self._transport.close()
+            self._transport = None
+        if self._writer is not None:
+            self._writer.close()
+            self._writer = None
+
+
+class _MqttSink:
+    """Publish JSON payloads through the Home Assistant MQTT integration."""
+
+    def __init__(self, hass: HomeAssistant, topic: str) -> None:
+        """Initialize the MQTT sink."""
+        self.hass = hass
+        self.topic = topic
+
+    async def async_send(self, records: list[str]) -> None:
+        """Publish a batch of records, raising HomeAssistantError when down."""
+        # pylint: disable-next=import-outside-toplevel
+        from homeassistant.components import mqtt
+
+        for record in records:
+            await mqtt.async_publish(self.hass, self.topic, record)
+
+    def close(self) -> None:
+        """Nothing to close, the MQTT client is owned by Home Assistant."""
+
+
+def _chunk(records: list[str], size: int) -> list[bytes]:
+    """Pack newline separated records into datagrams of at most size bytes."""
+    datagrams = []
+    current = b""
+    for record in records:
+        line = f"{record}\n".encode()
+        if current and len(current) + len(line) > size:
+            datagrams.append(current)
+            current = b""
+        current += line
+    if current:
+        datagrams.append(current)
+    return datagrams
+
+
+class SnapshotExporter:
+    """Buffer one record per telegram and flush them to a sink in batches.
+
+    The buffer is bounded; when the sink is down the oldest records are
+    dropped and flushing is retried with exponential backoff.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        device: str,
+        protocol: str,
+        host: str | None = None,
+        port: int | None = None,
+        topic: str | None = None,
+        measurement: str = "zap",
+        batch_size: int = 10,
+        flush_interval: timedelta = timedelta(seconds=10),
+        max_buffer: int = 3600,
+    ) -> None:
+        """Initialize the exporter."""
+        self.hass = hass
+        self.device = device
+        self.protocol = protocol
+        self.measurement = measurement
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.dropped = 0
+        self._buffer: deque[str] = deque(maxlen=max_buffer)
+        self._flush_lock = asyncio.Lock()
+        self._retry_delay = 0.0
+        self._retry_at = 0.0
+        self._unsub_interval: Callable[[], None] | None = None
+
+        if protocol == PROTOCOL_MQTT:
+            self._sink = _MqttSink(hass, topic)
+        else:
+            self._sink = _SocketSink(host, port, protocol)
+
+    def add(self, timestamp: int | None, data: dict[str, dict[str, Any]]) -> None:
+        """Queue one record for a telegram."""
+        if not data:
+            return
+        if timestamp is None:
+            timestamp = int(time.time() * 1000)
+
+        if self.protocol == PROTOCOL_MQTT:
+            record = format_json(self.device, timestamp, data)
+        else:
+            record = format_line_protocol(
+                self.measurement, self.device, timestamp, data
+            )
+
+        if len(self._buffer) == self._buffer.maxlen:
+            self.dropped += 1
+        self._buffer.append(record)
+
+        if len(self._buffer) >= self.batch_size and not self._flush_lock.locked():
+            self.hass.async_create_task(self.async_flush())
+
+    def async_start(self) -> None:
+        """Start the periodic flush."""
+        self._unsub_interval = async_track_time_interval(
+            self.hass, self._async_interval_flush, self.flush_interval
+        )
+
+    async def async_stop(self, _event: Event | None = None) -> None:
+        """Flush what is left and release the sink."""
+        if self._unsub_interval is not None:
+            self._unsub_interval()
+            self._unsub_interval = None
+        self._retry_at = 0.0
+        await self.async_flush()
+        self._sink.close()
+
+    async def _async_interval_flush(self, _now: datetime) -> None:
+        """Flush on the time based schedule."""
+        await self.async_flush()
+
+    async def async_flush(self) -> None:
+        """Send buffered records, keeping them for a retry on failure."""
+        async with self._flush_lock:
+            if not self._buffer or time.monotonic() < self._retry_at:
+                return
+
+            records = list(self._buffer)
+            dropped = self.dropped
+            try:
+                await self._sink.async_send(records)
+            except (OSError, asyncio.TimeoutError, HomeAssistantError) as err:
+                self._retry_delay = min(
+                    max(self._retry_delay * 2, self.flush_interval.total_seconds()),
+                    MAX_RETRY_DELAY,
+                )
+                self._retry_at = time.monotonic() + self._retry_delay
+                _LOGGER.warning(
+                    "Error exporting %d records, retrying in %.0f s: %s",
+                    len(records),
+                    self._retry_delay,
+                    err,
+                )
+                return
+
+            # Records dropped from a full buffer while sending were sent ones
+            for _ in range(len(records) - (self.dropped - dropped)):
+                self._buffer.popleft()
+            self._retry_delay = 0.0
+            self._retry_at = 0.0
+            _LOGGER.debug("Exported %d records", len(records))
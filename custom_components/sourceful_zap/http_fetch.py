@@ -0,0 +1,71 @@
+"""Conditional and compressed HTTP fetches from the Zap."""
+
+from __future__ import annotations
+
+import logging
+from typing import Any
+
+import aiohttp
+from aiohttp import hdrs
+
+from homeassistant.util.json import json_loads
+
+_LOGGER = logging.getLogger(__name__)
+
+HTTP_NOT_MODIFIED = 304
+
+
+class ConditionalFetcher:
+    """Fetch a JSON endpoint, skipping the download when it is unchanged.
+
+    Validators (ETag / Last-Modified) are only sent back when the firmware
+    provided them, so endpoints without support keep working as before.
+    """
+
+    def __init__(self, session: aiohttp.ClientSession, url: str) -> None:
+        """Initialize the fetcher."""
+        self.session = session
+        self.url = url
+        self.etag: str | None = None
+        self.last_modified: str | None = None
+        # Raw body of the last 200 response, decompressed
+        self.body: bytes | None = None
+        self.requests = 0
+        self.not_modified = 0
+        self.bytes_received = 0
+        self.bytes_saved = 0
+        self._last_size = 0
+
+    @property
+    def decodes_skipped(self) -> int:
+        """Return how many JSON decodes were skipped by 304 responses."""
+        return self.not_modified
+
+    async def async_fetch_json(self) -> Any | None:
+        """Return the decoded body, or None when the endpoint is unchanged."""
+        headers = {hdrs.ACCEPT_ENCODING: "gzip, deflate"}
+        if self.etag is not None:
+            headers[hdrs.IF_NONE_MATCH] = self.etag
+        if self.last_modified is not None:
+            headers[hdrs.IF_MODIFIED_SINCE] = self.last_modified
+
+        self.requests += 1
+        async with self.session.get(self.url, headers=headers) as response:
+            if response.status == HTTP_NOT_MODIFIED:
+                self.not_modified += 1
+                self.bytes_saved += self._last_size
+                _LOGGER.debug("%s not modified", self.url)
+                return None
+
+            response.raise_for_status()
+            self.etag = response.headers.get(hdrs.ETAG)
+            self.last_modified = response.headers.get(hdrs.LAST_MODIFIED)
+            body = await response.read()
+
+        # Content-Length is the size on the wire, before decompression
+        wire_size = response.content_length or len(body)
+        self.bytes_received += wire_size
+        self.bytes_saved += len(body) - wire_size
+        self._last_size = wire_size
+        self.body = body
+        return json_loads(body)
@@ -0,0 +1,131 @@
+"""Adaptive slowdown of a Zap's polling under event loop lag."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+
+from homeassistant.core import Event, HomeAssistant, callback
+
+from .const import TIER_POLL, TIER_SYSTEM, UPDATE_CLASS_LOW, UPDATE_CLASS_NORMAL
+
+_LOGGER = logging.getLogger(__name__)
+
+PROBE_INTERVAL = 1.0
+# Share of event loop time this Zap's update cycles may take, averaged over
+# DUTY_CYCLE_WINDOW seconds
+DUTY_CYCLE_BUDGET = 0.05
+DUTY_CYCLE_WINDOW = 30.0
+ESCALATE_HOLD = 5.0
+RECOVER_SAMPLES = 30
+LAG_DECAY = 0.8
+COST_SMOOTHING = 0.2
+
+# Interval multipliers per level, lowest priority tiers are stretched first
+STRETCH_LEVELS: tuple[dict[str, float], ...] = (
+    {},
+    {TIER_SYSTEM: 4},
+    {TIER_SYSTEM: 4, UPDATE_CLASS_LOW: 4},
+    {TIER_SYSTEM: 6, UPDATE_CLASS_LOW: 6, UPDATE_CLASS_NORMAL: 3},
+    {TIER_SYSTEM: 8, UPDATE_CLASS_LOW: 8, UPDATE_CLASS_NORMAL: 4, TIER_POLL: 2},
+    {TIER_SYSTEM: 8, UPDATE_CLASS_LOW: 8, UPDATE_CLASS_NORMAL: 6, TIER_POLL: 4},
+)
+
+
+class LoadGuard:
+    """Track event loop lag and per-cycle cost for one Zap.
+
+    When the loop falls behind, or the Zap's update cycles take more than
+    their share of loop time, the guard steps up one level at a time,
+    stretching poll and publish intervals for the lowest priority tiers
+    first. It steps back down one level per quiet period.
+    """
+
+    def __init__(self, hass: HomeAssistant, max_loop_lag: float) -> None:
+        """Initialize the load guard."""
+        self.hass = hass
+        self.max_loop_lag = max_loop_lag
+        self.level = 0
+        self.loop_lag = 0.0
+        self.cycle_cost = 0.0
+        self.duty_cycle = 0.0
+        self._busy = 0.0
+        self._healthy_samples = 0
+        self._last_escalation = float("-inf")
+        self._expected = 0.0
+        self._probe_handle: asyncio.TimerHandle | None = None
+
+    def factor(self, tier: str) -> float:
+        """Return the current interval multiplier for a tier."""
+        return STRETCH_LEVELS[self.level].get(tier, 1)
+
+    @callback
+    def record_cycle(self, cost: float) -> None:
+        """Record how long one update cycle held the event loop."""
+        self.cycle_cost += COST_SMOOTHING * (cost - self.cycle_cost)
+        self._busy += cost
+
+    @callback
+    def async_start(self) -> None:
+        """Start probing event loop lag."""
+        self._schedule_probe()
+
+    @callback
+    def async_stop(self, _event: Event | None = None) -> None:
+        """Stop probing."""
+        if self._probe_handle is not None:
+            self._probe_handle.cancel()
+            self._probe_handle = None
+
+    @callback
+    def _schedule_probe(self) -> None:
+        """Schedule the next lag probe."""
+        self._expected = self.hass.loop.time() + PROBE_INTERVAL
+        self._probe_handle = self.hass.loop.call_later(PROBE_INTERVAL, self._probe)
+
+    @callback
+    def _probe(self) -> None:
+        """Measure how late the probe ran and adjust the level."""
+        now = self.hass.loop.time()
+        lag = max(now - self._expected, 0.0)
+        self.loop_lag = max(lag, self.loop_lag * LAG_DECAY)
+        # Busy time since the previous probe, which ran PROBE_INTERVAL + lag ago
+        elapsed = PROBE_INTERVAL + lag
+        self.duty_cycle += min(elapsed / DUTY_CYCLE_WINDOW, 1.0) * (
+            self._busy / elapsed - self.duty_cycle
+        )
+        self._busy = 0.0
+        self._schedule_probe()
+
+        if self.loop_lag > self.max_loop_lag or self.duty_cycle > DUTY_CYCLE_BUDGET:
+            self._healthy_samples = 0
+            if (
+                self.level < len(STRETCH_LEVELS) - 1
+                and now - self._last_escalation >= ESCALATE_HOLD
+            ):
+                self._last_escalation = now
+                self._set_level(self.level + 1)
+            return
+
+        if (
+            self.level
+            and self.loop_lag < self.max_loop_lag / 2
+            and self.duty_cycle < DUTY_CYCLE_BUDGET / 2
+        ):
+            self._healthy_samples += 1
+            if self._healthy_samples >= RECOVER_SAMPLES:
+                self._healthy_samples = 0
+                self._set_level(self.level - 1)
+
+    @callback
+    def _set_level(self, level: int) -> None:
+        """Switch to a new stretch level."""
+        _LOGGER.log(
+            logging.WARNING if level > self.level else logging.INFO,
+            "Event loop lag %.0f ms, duty cycle %.1f %%: slowdown level %d -> %d",
+            self.loop_lag * 1000,
+            self.duty_cycle * 100,
+            self.level,
+            level,
+        )
+        self.level = level
@@ -1,6 +1,14 @@
 """OBIS mappings."""
 
-from homeassistant.components.sensor import SensorDeviceClass, SensorStateClass
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+from homeassistant.components.sensor import (
+    SensorDeviceClass,
+    SensorEntityDescription,
+    SensorStateClass,
+)
 from homeassistant.const import (
     UnitOfElectricCurrent,
     UnitOfElectricPotential,
@@ -10,6 +18,8 @@ from homeassistant.const import (
     UnitOfPower,
 )
 
+from .const import UPDATE_CLASS_FAST, UPDATE_CLASS_LOW, UPDATE_CLASS_NORMAL
+
 SENSOR_DEFINITIONS = {
     "1-0:1.8.0": {
         "name": "Total Energy Import",
@@ -31,6 +41,7 @@ SENSOR_DEFINITIONS = {
         "device_class": SensorDeviceClass.POWER,
         "state_class": SensorStateClass.MEASUREMENT,
         "icon": "mdi:flash",
+        "update_class": UPDATE_CLASS_FAST,
     },
     "1-0:2.7.0": {
         "name": "Current Power Export",
@@ -38,6 +49,7 @@ SENSOR_DEFINITIONS = {
         "device_class": SensorDeviceClass.POWER,
         "state_class": SensorStateClass.MEASUREMENT,
         "icon": "mdi:solar-power",
+        "update_class": UPDATE_CLASS_FAST,
     },
     "1-0:3.8.0": {
         "name": "Total Reactive Energy Import",
@@ -74,6 +86,7 @@ SENSOR_DEFINITIONS = {
         "device_class": SensorDeviceClass.VOLTAGE,
         "state_class": SensorStateClass.MEASUREMENT,
         "icon": "mdi:flash",
+        "update_class": UPDATE_CLASS_LOW,
     },
     "1-0:52.7.0": {
         "name": "Voltage L2",
@@ -81,6 +94,7 @@ SENSOR_DEFINITIONS = {
         "device_class": SensorDeviceClass.VOLTAGE,
         "state_class": SensorStateClass.MEASUREMENT,
         "icon": "mdi:flash",
+        "update_class": UPDATE_CLASS_LOW,
     },
     "1-0:72.7.0": {
         "name": "Voltage L3",
@@ -88,6 +102,7 @@ SENSOR_DEFINITIONS = {
         "device_class": SensorDeviceClass.VOLTAGE,
         "state_class": SensorStateClass.MEASUREMENT,
         "icon": "mdi:flash",
+        "update_class": UPDATE_CLASS_LOW,
     },
     # Phase currents
     "1-0:31.7.0": {
@@ -96,6 +111,7 @@ SENSOR_DEFINITIONS = {
         "device_class": SensorDeviceClass.CURRENT,
         "state_class": SensorStateClass.MEASUREMENT,
         "icon": "mdi:current-ac",
+        "update_class": UPDATE_CLASS_FAST,
     },
     "1-0:51.7.0": {
         "name": "Current L2",
@@ -103,6 +119,7 @@ SENSOR_DEFINITIONS = {
         "device_class": SensorDeviceClass.CURRENT,
         "state_class": SensorStateClass.MEASUREMENT,
         "icon": "mdi:current-ac",
+        "update_class": UPDATE_CLASS_FAST,
     },
     "1-0:71.7.0": {
         "name": "Current L3",
@@ -110,6 +127,7 @@ SENSOR_DEFINITIONS = {
         "device_class": SensorDeviceClass.CURRENT,
         "state_class": SensorStateClass.MEASUREMENT,
         "icon": "mdi:current-ac",
+        "update_class": UPDATE_CLASS_FAST,
     },
     # Phase power import
     "1-0:21.7.0": {
@@ -200,3 +218,26 @@ SENSOR_DEFINITIONS = {
         "icon": "mdi:sine-wave",
     },
 }
+
+
+@dataclass(frozen=True, kw_only=True)
+class P1SensorEntityDescription(SensorEntityDescription):
+    """Describes a P1 sensor, shared by the entities of every Zap."""
+
+    update_class: str = UPDATE_CLASS_NORMAL
+    unique_id_suffix: str
+
+
+SENSOR_DESCRIPTIONS: tuple[P1SensorEntityDescription, ...] = tuple(
+    P1SensorEntityDescription(
+        key=obis_code,
+        name=definition["name"],
+        native_unit_of_measurement=definition["unit"],
+        device_class=definition.get("device_class"),
+        state_class=definition.get("state_class"),
+        icon=definition.get("icon"),
+        update_class=definition.get("update_class", UPDATE_CLASS_NORMAL),
+        unique_id_suffix=obis_code.replace(":", "_").replace("-", "_"),
+    )
+    for obis_code, definition in SENSOR_DEFINITIONS.items()
+)
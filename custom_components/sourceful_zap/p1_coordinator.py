@@ -1,46 +1,141 @@
 """P1 Data Coordinator."""
 
+from __future__ import annotations
+
+import asyncio
 from datetime import timedelta
 import logging
 import re
-from typing import Any
+import time
+from typing import TYPE_CHECKING, Any
 
 import aiohttp
 import async_timeout
 
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.aiohttp_client import async_get_clientsession
-from homeassistant.util import Throttle
+from homeassistant.helpers.dispatcher import async_dispatcher_send
+
+from .const import (
+    DEFAULT_NAME,
+    DEFAULT_PUBLISH_INTERVAL,
+    EVENT_SNAPSHOT,
+    SIGNAL_SNAPSHOT,
+    SIGNAL_SNAPSHOT_THROTTLED,
+    TIER_POLL,
+    UPDATE_CLASS_FAST,
+    UPDATE_CLASS_LOW,
+    UPDATE_CLASS_NORMAL,
+)
+from .coordinator import PollingCoordinator
+from .http_fetch import ConditionalFetcher
+from .load_guard import LoadGuard
+from .reading_filter import ReadingFilter
+from .snapshot import P1Snapshot
+from .system_data_coordinator import SystemDataCoordinator
+from .threshold_engine import ThresholdEngine
 
-from .const import DEFAULT_SCAN_INTERVAL
+if TYPE_CHECKING:
+    from .capture import TelegramCapture
+    from .cost_accumulator import CostAccumulator
+    from .exporter import SnapshotExporter
+    from .p1_decryption import FrameDecryptor
 
 _LOGGER = logging.getLogger(__name__)
 
+METER_TIME_PREFIX = "0-0:1.0.0("
+
 
-class P1DataCoordinator:
+class P1DataCoordinator(PollingCoordinator):
     """Coordinate data fetching for all P1 sensors."""
 
-    def __init__(self, hass: HomeAssistant, url: str, scan_interval: timedelta) -> None:
+    tier = TIER_POLL
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        url: str,
+        scan_interval: timedelta,
+        name: str = DEFAULT_NAME,
+        system_coordinator: SystemDataCoordinator | None = None,
+        capture: TelegramCapture | None = None,
+        exporter: SnapshotExporter | None = None,
+        snapshot_throttle: timedelta | None = None,
+        snapshot_event: bool = False,
+        publish_interval: timedelta = DEFAULT_PUBLISH_INTERVAL,
+        load_guard: LoadGuard | None = None,
+        decryptor: FrameDecryptor | None = None,
+        reading_filter: ReadingFilter | None = None,
+        threshold_engine: ThresholdEngine | None = None,
+        cost_accumulator: CostAccumulator | None = None,
+    ) -> None:
         """Initialize the data coordinator."""
-        self.hass = hass
+        super().__init__(
+            hass,
+            scan_interval,
+            load_guard,
+            update_classes=(UPDATE_CLASS_FAST, UPDATE_CLASS_LOW),
+        )
         self.url = url
+        self.name = name
+        self.system_coordinator = system_coordinator
         self.data = {}
+        self.timestamp = None
+        self.meter_time = None
+        self.snapshot: P1Snapshot | None = None
+        # Raw payload as served by the Zap, for the read-through HTTP view
+        self.raw_payload: bytes | None = None
+        self.payload_version = 0
+        self._payload_waiter: asyncio.Future[None] | None = None
         self.session = async_get_clientsession(hass)
-        self.scan_interval = scan_interval
+        self.fetcher = ConditionalFetcher(self.session, url)
+        self.capture = capture
+        self.exporter = exporter
+        self.snapshot_throttle = snapshot_throttle
+        self.snapshot_event = snapshot_event
+        self.publish_interval = publish_interval
+        self.decryptor = decryptor
+        self.reading_filter = reading_filter
+        self.threshold_engine = threshold_engine
+        self.cost_accumulator = cost_accumulator
         self._last_update = None
+        self._last_throttled_snapshot = 0.0
+        self._last_publish = {UPDATE_CLASS_NORMAL: 0.0, UPDATE_CLASS_LOW: 0.0}
 
-    @Throttle(DEFAULT_SCAN_INTERVAL)
     async def async_update(self) -> None:
         """Fetch data from API."""
         try:
             async with async_timeout.timeout(10):
                 _LOGGER.debug("Fetching data from %s", self.url)
-                response = await self.session.get(self.url)
-                response.raise_for_status()
-                json_data = await response.json()
+                json_data = await self.fetcher.async_fetch_json()
+                if json_data is None:
+                    # Unchanged since the last poll, nothing to decode or publish
+                    return
 
                 if json_data.get("status") == "success":
-                    self.data = self._parse_obis_data(json_data.get("data", []))
+                    cycle_start = time.perf_counter()
+                    self._set_raw_payload(self.fetcher.body)
+                    data_lines = self._decode_data(json_data.get("data", []))
+                    if data_lines is None:
+                        return
+                    self.data = self._parse_obis_data(data_lines)
+                    if self.threshold_engine is not None:
+                        # On the raw values and before any other fan-out: the
+                        # filter would hold back a real step for a few telegrams
+                        self.threshold_engine.evaluate(self.data, cycle_start)
+                    if self.reading_filter is not None:
+                        self.reading_filter.apply(self.data)
+                    self.timestamp = json_data.get("ts")
+                    if self.cost_accumulator is not None:
+                        self.cost_accumulator.add(self.data, time.time())
+                    if self.capture is not None:
+                        self.capture.append(self.timestamp, data_lines)
+                    if self.exporter is not None:
+                        self.exporter.add(self.timestamp, self.data)
+                    self._publish_snapshot()
+                    self._notify_listeners()
+                    if self.load_guard is not None:
+                        self.load_guard.record_cycle(time.perf_counter() - cycle_start)
                     _LOGGER.debug("Successfully parsed %d OBIS codes", len(self.data))
                 else:
                     _LOGGER.error(
@@ -52,14 +147,70 @@ class P1DataCoordinator:
         except Exception as err:
             _LOGGER.error("Unexpected error fetching P1 data: %s", err)
 
+    async def async_wait_for_payload(self, timeout: float) -> bool:
+        """Wait for the next telegram, returning False on timeout."""
+        if self._payload_waiter is None:
+            self._payload_waiter = self.hass.loop.create_future()
+        try:
+            async with async_timeout.timeout(timeout):
+                # Shielded, the future is shared by all waiting requests
+                await asyncio.shield(self._payload_waiter)
+        except asyncio.TimeoutError:
+            return False
+        return True
+
+    @callback
+    def _set_raw_payload(self, payload: bytes | None) -> None:
+        """Store the raw payload and wake requests waiting for it."""
+        self.raw_payload = payload
+        self.payload_version += 1
+        if self._payload_waiter is not None:
+            self._payload_waiter.set_result(None)
+            self._payload_waiter = None
+
+    def _decode_data(self, data: list[str] | str) -> list[str] | None:
+        """Return telegram lines, decrypting a hex encoded frame if needed.
+
+        Logs the reason and returns None when an encrypted frame cannot be
+        decrypted. The decryption module is only loaded for encrypted meters.
+        """
+        if isinstance(data, list):
+            return data
+        if self.decryptor is None:
+            _LOGGER.error("Encrypted frame received but no key configured")
+            return None
+
+        # pylint: disable-next=import-outside-toplevel
+        from .p1_decryption import P1DecryptionError
+
+        try:
+            frame = bytes.fromhex(data)
+        except ValueError:
+            _LOGGER.error("Error decrypting P1 data: Frame is not hex encoded")
+            return None
+        try:
+            plaintext = self.decryptor.decrypt(frame)
+        except P1DecryptionError as err:
+            _LOGGER.error("Error decrypting P1 data: %s", err)
+            return None
+        return plaintext.decode("ascii", "replace").splitlines()
+
     def _parse_obis_data(self, data_lines: list[str]) -> dict[str, dict[str, Any]]:
         """Parse OBIS data lines into dictionary."""
         parsed = {}
+        self.meter_time = None
 
         # Pattern to match OBIS codes: code(value*unit) or code(value)
         pattern = r"(\d+-\d+:\d+\.\d+\.\d+)\(([0-9.-]+)\*?([^)]*)\)"
 
         for line in data_lines:
+            # Timestamp (YYMMDDhhmmssX), which the value pattern would also
+            # match as a number with unit X: 0-0:1.0.0(250705142950W)
+            if line.startswith(METER_TIME_PREFIX) and line.endswith(")"):
+                _LOGGER.debug("Timestamp: %s", line)
+                self.meter_time = line[len(METER_TIME_PREFIX) : -1]
+                continue
+
             match = re.match(pattern, line)
             if match:
                 obis_code = match.group(1)
@@ -70,10 +221,47 @@ class P1DataCoordinator:
                 except ValueError:
                     _LOGGER.warning("Could not parse value from line: %s", line)
             else:
-                # Handle timestamp format: 0-0:1.0.0(250705142950W)
-                if line.startswith("0-0:1.0.0"):
-                    _LOGGER.debug("Timestamp: %s", line)
-                else:
-                    _LOGGER.debug("Could not parse line: %s", line)
+                _LOGGER.debug("Could not parse line: %s", line)
 
         return parsed
+
+    def _publish_snapshot(self) -> None:
+        """Send the new telegram to snapshot consumers in one go."""
+        device_id = "unknown"
+        if self.system_coordinator is not None:
+            device_id = self.system_coordinator.device_info.get("device_id", device_id)
+
+        snapshot = self.snapshot = P1Snapshot.from_data(
+            self.name, device_id, self.timestamp, self.meter_time, self.data
+        )
+        async_dispatcher_send(self.hass, SIGNAL_SNAPSHOT.format(self.name), snapshot)
+
+        if self.snapshot_throttle is not None:
+            now = time.monotonic()
+            if (
+                now - self._last_throttled_snapshot
+                < self.snapshot_throttle.total_seconds()
+            ):
+                return
+            self._last_throttled_snapshot = now
+            async_dispatcher_send(
+                self.hass, SIGNAL_SNAPSHOT_THROTTLED.format(self.name), snapshot
+            )
+
+        if self.snapshot_event:
+            self.hass.bus.async_fire(EVENT_SNAPSHOT, snapshot.as_dict())
+
+    @callback
+    def _notify_listeners(self) -> None:
+        """Publish to fast entities now and to the slower classes when due."""
+        self._notify(UPDATE_CLASS_FAST)
+
+        now = time.monotonic()
+        for update_class, last_publish in self._last_publish.items():
+            interval = self.publish_interval.total_seconds()
+            if self.load_guard is not None:
+                interval *= self.load_guard.factor(update_class)
+            if now - last_publish < interval:
+                continue
+            self._last_publish[update_class] = now
+            self._notify(update_class)
@@ -0,0 +1,97 @@
+"""Decryption of DLMS general-glo-ciphering P1 frames."""
+
+from __future__ import annotations
+
+TAG_GENERAL_GLO_CIPHERING = 0xDB
+SECURITY_AUTHENTICATED = 0x10
+SECURITY_ENCRYPTED = 0x20
+GCM_TAG_LENGTH = 12
+# The first GCM counter block used for encryption is IV || 00000002
+GCM_FIRST_COUNTER = b"\x00\x00\x00\x02"
+
+
+class P1DecryptionError(ValueError):
+    """Raised when a frame cannot be parsed or authenticated."""
+
+
+class FrameDecryptor:
+    """Decrypt general-glo-ciphering frames with a per-meter key.
+
+    The frame header is parsed over a memoryview and the ciphertext is passed
+    to OpenSSL's AES-GCM without being copied. cryptography is only imported
+    once a decryptor is used, so plain text meters never load it.
+    """
+
+    def __init__(self, key: bytes, authentication_key: bytes | None = None) -> None:
+        """Initialize the decryptor."""
+        self._key = key
+        self._authentication_key = authentication_key or b""
+
+    def decrypt(self, frame: bytes | bytearray | memoryview) -> bytes:
+        """Return the plaintext APDU of one frame."""
+        view = memoryview(frame)
+        try:
+            if view[0] != TAG_GENERAL_GLO_CIPHERING:
+                raise P1DecryptionError(f"Unexpected frame tag 0x{view[0]:02X}")
+
+            title_length = view[1]
+            system_title = view[2 : 2 + title_length]
+            length, position = _read_length(view, 2 + title_length)
+            security = view[position]
+            frame_counter = view[position + 1 : position + 5]
+            payload = view[position + 5 : position + length]
+        except IndexError as err:
+            raise P1DecryptionError("Truncated frame header") from err
+
+        if len(payload) != length - 5:
+            raise P1DecryptionError(
+                f"Frame holds {len(payload) + 5} of {length} announced bytes"
+            )
+        if not security & SECURITY_ENCRYPTED:
+            raise P1DecryptionError(f"Unsupported security control 0x{security:02X}")
+
+        # pylint: disable-next=import-outside-toplevel
+        from cryptography.hazmat.primitives.ciphers import Cipher, algorithms, modes
+
+        iv = bytes(system_title) + bytes(frame_counter)
+
+        if security & SECURITY_AUTHENTICATED:
+            ciphertext = payload[:-GCM_TAG_LENGTH]
+            decryptor = Cipher(
+                algorithms.AES(self._key),
+                modes.GCM(
+                    iv,
+                    bytes(payload[-GCM_TAG_LENGTH:]),
+                    min_tag_length=GCM_TAG_LENGTH,
+                ),
+            ).decryptor()
+            decryptor.authenticate_additional_data(
+                bytes((security,)) + self._authentication_key
+            )
+        else:
+            # Encryption without authentication: GCM without a tag is CTR mode
+            ciphertext = payload
+            decryptor = Cipher(
+                algorithms.AES(self._key), modes.CTR(iv + GCM_FIRST_COUNTER)
+            ).decryptor()
+
+        # pylint: disable-next=import-outside-toplevel
+        from cryptography.exceptions import InvalidTag
+
+        try:
+            return decryptor.update(ciphertext) + decryptor.finalize()
+        except InvalidTag as err:
+            raise P1DecryptionError(
+                "Authentication failed, check the keys for this meter"
+            ) from err
+
+
+def _read_length(view: memoryview, position: int) -> tuple[int, int]:
+    """Read a BER encoded length, returning it and the next position."""
+    first = view[position]
+    if first < 0x80:
+        return first, position + 1
+
+    size = first & 0x7F
+    length = int.from_bytes(view[position + 1 : position + 1 + size], "big")
+    return length, position + 1 + size
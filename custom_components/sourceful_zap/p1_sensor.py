@@ -3,13 +3,11 @@
 import logging
 from typing import Any
 
-from homeassistant.components.sensor import (
-    SensorDeviceClass,
-    SensorEntity,
-    SensorStateClass,
-)
+from homeassistant.components.sensor import SensorEntity
+from homeassistant.core import callback
 
-from .const import DEFAULT_NAME, DOMAIN
+from .const import DEFAULT_NAME
+from .obis_definitions import P1SensorEntityDescription
 from .p1_coordinator import P1DataCoordinator
 from .system_data_coordinator import SystemDataCoordinator
 
@@ -19,55 +17,50 @@ _LOGGER = logging.getLogger(__name__)
 class P1Sensor(SensorEntity):
     """Representation of a P1 meter sensor."""
 
+    _attr_should_poll = False
+    entity_description: P1SensorEntityDescription
+
     def __init__(
         self,
         coordinator: P1DataCoordinator,
         system_coordinator: SystemDataCoordinator,
-        obis_code: str,
-        sensor_name: str,
-        unit: str,
-        device_class: SensorDeviceClass | None = None,
-        state_class: SensorStateClass | None = None,
-        icon: str | None = None,
+        description: P1SensorEntityDescription,
         name_prefix: str = DEFAULT_NAME,
     ) -> None:
         """Initialize the sensor."""
         self.coordinator = coordinator
         self.system_coordinator = system_coordinator
-        self.obis_code = obis_code
-        self._attr_name = f"{name_prefix} {sensor_name}"
+        self.entity_description = description
+        self.obis_code = description.key
+        self._attr_name = f"{name_prefix} {description.name}"
         self._attr_unique_id = (
-            f"{name_prefix.lower().replace(' ', '_')}_"
-            f"{obis_code.replace(':', '_').replace('-', '_')}"
+            f"{name_prefix.lower().replace(' ', '_')}_{description.unique_id_suffix}"
         )
-        self._attr_native_unit_of_measurement = unit
-        self._attr_device_class = device_class
-        self._attr_state_class = state_class
-        self._attr_icon = icon
         self._attr_native_value = None
         self._attr_available = True
 
     @property
     def device_info(self) -> dict[str, Any]:
         """Return device information."""
-        device_id = self.system_coordinator.device_info.get("device_id", "unknown")
-        firmware_version = self.system_coordinator.device_info.get(
-            "firmware_version", "unknown"
+        return self.system_coordinator.zap_device_info
+
+    async def async_added_to_hass(self) -> None:
+        """Subscribe to new telegrams on this sensor's update class."""
+        self._update_from_coordinator()
+        self.async_on_remove(
+            self.coordinator.async_add_listener(
+                self._handle_coordinator_update, self.entity_description.update_class
+            )
         )
 
-        return {
-            "identifiers": {(DOMAIN, device_id)},
-            "name": "Sourceful Energy Zap",
-            "manufacturer": "Sourceful Labs AB",
-            "model": "Zap P1 Reader",
-            "sw_version": firmware_version,
-            "configuration_url": "http://zap.local/",
-        }
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Publish the value from the latest telegram."""
+        self._update_from_coordinator()
+        self.async_write_ha_state()
 
-    async def async_update(self) -> None:
+    def _update_from_coordinator(self) -> None:
         """Update the sensor."""
-        await self.coordinator.async_update()
-
         if self.obis_code in self.coordinator.data:
             self._attr_native_value = self.coordinator.data[self.obis_code]["value"]
             self._attr_available = True
@@ -0,0 +1,246 @@
+"""Streaming sanity filters for P1 readings."""
+
+from __future__ import annotations
+
+import logging
+import time
+from typing import Any
+
+from homeassistant.components.sensor import SensorStateClass
+from homeassistant.const import (
+    UnitOfElectricCurrent,
+    UnitOfElectricPotential,
+    UnitOfPower,
+    UnitOfReactivePower,
+)
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.storage import Store
+
+from .const import DOMAIN
+
+_LOGGER = logging.getLogger(__name__)
+
+WINDOW_SIZE = 7
+HAMPEL_THRESHOLD = 3.0
+# Scale factor making the MAD a consistent estimator of the standard deviation
+MAD_SCALE = 1.4826
+# Allowed counter increase on top of max power, covers rounding in telegrams
+COUNTER_SLACK = 0.01
+# Consecutive rejected counter readings, consistent with each other, after
+# which the new level is accepted (meter swap or reset)
+COUNTER_REANCHOR = 30
+
+STORAGE_VERSION = 1
+SAVE_DELAY = 30
+
+# Units whose magnitude can never exceed the configured max power
+POWER_UNITS = (UnitOfPower.KILO_WATT, UnitOfReactivePower.KILO_VOLT_AMPERE_REACTIVE)
+
+# Deviations from the rolling median below these are never rejected, so
+# normal load steps (kettle, EV charger) pass straight through
+DEVIATION_FLOORS = {
+    UnitOfPower.KILO_WATT: 25.0,
+    UnitOfReactivePower.KILO_VOLT_AMPERE_REACTIVE: 25.0,
+    UnitOfElectricPotential.VOLT: 40.0,
+    UnitOfElectricCurrent.AMPERE: 40.0,
+}
+
+
+def counter_store(hass: HomeAssistant, name: str) -> Store[dict[str, Any]]:
+    """Return the store persisting the counters of a Zap."""
+    return Store(
+        hass, STORAGE_VERSION, f"{DOMAIN}.filter_{name.lower().replace(' ', '_')}"
+    )
+
+
+class _CounterState:
+    """Last accepted reading of a cumulative counter and a candidate new level."""
+
+    __slots__ = ("value", "time", "candidate", "candidate_time", "candidate_count")
+
+    def __init__(self) -> None:
+        """Initialize the counter state."""
+        self.value: float | None = None
+        self.time = 0.0
+        self.candidate: float | None = None
+        self.candidate_time = 0.0
+        self.candidate_count = 0
+
+
+class _HampelWindow:
+    """Fixed-size ring buffer of recent instantaneous readings."""
+
+    __slots__ = ("values", "index", "count", "floor", "bound")
+
+    def __init__(self, size: int, floor: float, bound: float) -> None:
+        """Initialize the window."""
+        self.values = [0.0] * size
+        self.index = 0
+        self.count = 0
+        self.floor = floor
+        self.bound = bound
+
+
+def _median(values: list[float]) -> float:
+    """Return the median of a small list."""
+    ordered = sorted(values)
+    middle = len(ordered) // 2
+    if len(ordered) % 2:
+        return ordered[middle]
+    return (ordered[middle - 1] + ordered[middle]) / 2
+
+
+class ReadingFilter:
+    """Reject glitched readings before they reach entities and statistics.
+
+    Cumulative counters must not decrease or grow faster than max_power
+    allows. Instantaneous values go through a rolling Hampel filter. All
+    windows are allocated up front, so each sample costs the same.
+
+    With a store, the last accepted counter values are persisted, so the
+    first telegram after a restart is checked against them as well.
+    """
+
+    def __init__(
+        self,
+        definitions: dict[str, dict[str, Any]],
+        max_power: float,
+        window_size: int = WINDOW_SIZE,
+        store: Store[dict[str, Any]] | None = None,
+    ) -> None:
+        """Initialize the filter from the OBIS sensor definitions."""
+        self.max_power = max_power
+        self.rejected: dict[str, int] = {}
+        self.total_rejected = 0
+        self._counters: dict[str, _CounterState] = {}
+        self._windows: dict[str, _HampelWindow] = {}
+        self._store = store
+
+        for obis_code, definition in definitions.items():
+            if definition.get("state_class") == SensorStateClass.TOTAL_INCREASING:
+                self._counters[obis_code] = _CounterState()
+            elif (floor := DEVIATION_FLOORS.get(definition["unit"])) is not None:
+                bound = max_power if definition["unit"] in POWER_UNITS else float("inf")
+                self._windows[obis_code] = _HampelWindow(window_size, floor, bound)
+
+    async def async_load(self) -> None:
+        """Seed the counters from storage."""
+        if self._store is None or (stored := await self._store.async_load()) is None:
+            return
+        # Monotonic time of a wall clock time, the time since then is downtime
+        offset = time.monotonic() - time.time()
+        try:
+            for obis_code, (value, stored_time) in stored["counters"].items():
+                if (counter := self._counters.get(obis_code)) is not None:
+                    counter.value = float(value)
+                    counter.time = float(stored_time) + offset
+        except (KeyError, TypeError, ValueError, AttributeError) as err:
+            _LOGGER.warning("Ignoring invalid stored counters: %s", err)
+
+    def apply(self, data: dict[str, dict[str, Any]], now: float | None = None) -> None:
+        """Replace rejected readings in data in place."""
+        if now is None:
+            now = time.monotonic()
+
+        counters_seen = False
+        for obis_code, reading in list(data.items()):
+            if (counter := self._counters.get(obis_code)) is not None:
+                accepted = self._check_counter(counter, reading["value"], now)
+                counters_seen = True
+            elif (window := self._windows.get(obis_code)) is not None:
+                accepted = self._check_instantaneous(window, reading["value"])
+            else:
+                continue
+
+            if accepted == reading["value"]:
+                continue
+            _LOGGER.debug(
+                "Rejected %s reading %s, using %s",
+                obis_code,
+                reading["value"],
+                accepted,
+            )
+            if accepted is None:
+                del data[obis_code]
+            else:
+                data[obis_code] = {"value": accepted, "unit": reading["unit"]}
+            self.rejected[obis_code] = self.rejected.get(obis_code, 0) + 1
+            self.total_rejected += 1
+
+        if counters_seen and self._store is not None:
+            self._store.async_delay_save(self._data_to_store, SAVE_DELAY)
+
+    def _plausible(
+        self, previous: float, since: float, value: float, now: float
+    ) -> bool:
+        """Return whether a counter can move from previous to value since then."""
+        increase = value - previous
+        return 0 <= increase <= self.max_power * (now - since) / 3600 + COUNTER_SLACK
+
+    def _check_counter(self, counter: _CounterState, value: float, now: float) -> float:
+        """Return the value to use for a cumulative counter reading."""
+        if counter.value is not None and not self._plausible(
+            counter.value, counter.time, value, now
+        ):
+            # A new level is only taken over once readings keep following it,
+            # unrelated glitches each start a new candidate
+            if counter.candidate is not None and self._plausible(
+                counter.candidate, counter.candidate_time, value, now
+            ):
+                counter.candidate_count += 1
+            else:
+                counter.candidate_count = 1
+            counter.candidate = value
+            counter.candidate_time = now
+            if counter.candidate_count < COUNTER_REANCHOR:
+                return counter.value
+
+            _LOGGER.warning(
+                "Counter moved from %s to %s and stayed there, accepting it",
+                counter.value,
+                value,
+            )
+
+        counter.value = value
+        counter.time = now
+        counter.candidate = None
+        counter.candidate_count = 0
+        return value
+
+    def _check_instantaneous(self, window: _HampelWindow, value: float) -> float | None:
+        """Return the value to use for an instantaneous reading.
+
+        Returns None for an impossible reading before there is any history.
+        """
+        size = len(window.values)
+        result = value
+
+        if abs(value) > window.bound:
+            # Impossible whatever the history, so never kept in the window
+            if window.count == 0:
+                return None
+            return _median(window.values[: window.count])
+
+        if window.count == size:
+            median = _median(window.values)
+            mad = _median([abs(sample - median) for sample in window.values])
+            limit = max(HAMPEL_THRESHOLD * MAD_SCALE * mad, window.floor)
+            if abs(value - median) > limit:
+                result = median
+
+        window.values[window.index] = value
+        window.index = (window.index + 1) % size
+        window.count = min(window.count + 1, size)
+        return result
+
+    @callback
+    def _data_to_store(self) -> dict[str, Any]:
+        """Return the last accepted counter values with their wall clock time."""
+        offset = time.time() - time.monotonic()
+        return {
+            "counters": {
+                obis_code: (counter.value, counter.time + offset)
+                for obis_code, counter in self._counters.items()
+                if counter.value is not None
+            }
+        }
@@ -13,31 +13,128 @@ from homeassistant.components.sensor import (
     SensorEntity,
     SensorStateClass,
 )
-from homeassistant.const import CONF_HOST, CONF_NAME, CONF_SCAN_INTERVAL, UnitOfPower
-from homeassistant.core import HomeAssistant
+from homeassistant.const import (
+    CONF_ABOVE,
+    CONF_BELOW,
+    CONF_HOST,
+    CONF_NAME,
+    CONF_PORT,
+    CONF_PROTOCOL,
+    CONF_SCAN_INTERVAL,
+    EVENT_HOMEASSISTANT_STOP,
+    EntityCategory,
+    UnitOfPower,
+    UnitOfTime,
+)
+from homeassistant.core import HomeAssistant, callback
 import homeassistant.helpers.config_validation as cv
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.typing import ConfigType, DiscoveryInfoType
 
 from .const import (
+    CONF_AUTHENTICATION_KEY,
+    CONF_BATCH_SIZE,
+    CONF_CAPTURE_MAX_SIZE,
+    CONF_CAPTURE_PATH,
+    CONF_CAPTURE_SEGMENT_AGE,
+    CONF_CAPTURE_SEGMENT_SIZE,
+    CONF_COST,
+    CONF_DURATION,
+    CONF_DECRYPTION_KEY,
     CONF_ENDPOINT,
+    CONF_EXPORT_PRICE_ENTITY,
+    CONF_EXPORT,
+    CONF_FILTER_READINGS,
+    CONF_FLUSH_INTERVAL,
+    CONF_HYSTERESIS,
+    CONF_MAX_LOOP_LAG,
+    CONF_MAX_POWER,
+    CONF_MEASUREMENT,
+    CONF_OBIS,
+    CONF_PRICE_ENTITY,
+    CONF_PUBLISH_INTERVAL,
+    CONF_SNAPSHOT_EVENT,
+    CONF_SNAPSHOT_THROTTLE,
     CONF_SYSTEM_ENDPOINT,
+    CONF_THRESHOLDS,
+    CONF_TOPIC,
+    DATA_COORDINATORS,
+    DEFAULT_BATCH_SIZE,
+    DEFAULT_CAPTURE_MAX_SIZE,
+    DEFAULT_CAPTURE_SEGMENT_AGE,
+    DEFAULT_CAPTURE_SEGMENT_SIZE,
     DEFAULT_ENDPOINT,
+    DEFAULT_EXPORT_PORT,
+    DEFAULT_EXPORT_TOPIC,
+    DEFAULT_FLUSH_INTERVAL,
     DEFAULT_HOST,
+    DEFAULT_MAX_LOOP_LAG,
+    DEFAULT_MAX_POWER,
+    DEFAULT_MEASUREMENT,
     DEFAULT_NAME,
+    DEFAULT_PUBLISH_INTERVAL,
     DEFAULT_SCAN_INTERVAL,
     DEFAULT_SYSTEM_ENDPOINT,
-    DOMAIN,
+    PROTOCOL_MQTT,
+    PROTOCOL_TCP,
+    PROTOCOL_UDP,
+    UPDATE_CLASS_FAST,
+    UPDATE_CLASS_NORMAL,
 )
-from .obis_definitions import SENSOR_DEFINITIONS
+from .load_guard import LoadGuard
+from .obis_definitions import SENSOR_DEFINITIONS, SENSOR_DESCRIPTIONS
 from .p1_coordinator import P1DataCoordinator
 from .p1_sensor import P1Sensor
+from .reading_filter import ReadingFilter, counter_store
+from .site_sensor import async_setup_site_meter
 from .system_data_coordinator import SystemDataCoordinator
 from .system_sensor import SystemSensor
-from .system_sensor_definitions import SYSTEM_SENSOR_DEFINITIONS
+from .system_sensor_definitions import SYSTEM_SENSOR_DESCRIPTIONS
+from .threshold_engine import ThresholdEngine, ThresholdRule
 
 _LOGGER = logging.getLogger(__name__)
 
+METER_KEY = vol.All(cv.string, vol.Match(r"^[0-9A-Fa-f]{32}$"))
+
+EXPORT_SCHEMA = vol.Schema(
+    {
+        vol.Required(CONF_PROTOCOL): vol.In(
+            [PROTOCOL_UDP, PROTOCOL_TCP, PROTOCOL_MQTT]
+        ),
+        vol.Optional(CONF_HOST): cv.string,
+        vol.Optional(CONF_PORT, default=DEFAULT_EXPORT_PORT): cv.port,
+        vol.Optional(CONF_TOPIC, default=DEFAULT_EXPORT_TOPIC): cv.string,
+        vol.Optional(CONF_MEASUREMENT, default=DEFAULT_MEASUREMENT): cv.string,
+        vol.Optional(CONF_BATCH_SIZE, default=DEFAULT_BATCH_SIZE): cv.positive_int,
+        vol.Optional(
+            CONF_FLUSH_INTERVAL, default=DEFAULT_FLUSH_INTERVAL
+        ): cv.time_period,
+    }
+)
+
+COST_SCHEMA = vol.Schema(
+    {
+        vol.Required(CONF_PRICE_ENTITY): cv.entity_id,
+        vol.Optional(CONF_EXPORT_PRICE_ENTITY): cv.entity_id,
+    }
+)
+
+THRESHOLD_SCHEMA = vol.All(
+    vol.Schema(
+        {
+            vol.Required(CONF_NAME): cv.string,
+            vol.Required(CONF_OBIS): vol.In(SENSOR_DEFINITIONS),
+            vol.Exclusive(CONF_ABOVE, "limit"): vol.Coerce(float),
+            vol.Exclusive(CONF_BELOW, "limit"): vol.Coerce(float),
+            vol.Optional(CONF_HYSTERESIS, default=0.0): vol.All(
+                vol.Coerce(float), vol.Range(min=0)
+            ),
+            vol.Optional(CONF_DURATION, default=0): cv.time_period,
+        }
+    ),
+    cv.has_at_least_one_key(CONF_ABOVE, CONF_BELOW),
+)
+
 PLATFORM_SCHEMA = PLATFORM_SCHEMA.extend(
     {
         vol.Required(CONF_HOST, default=DEFAULT_HOST): cv.string,
@@ -45,6 +142,31 @@ PLATFORM_SCHEMA = PLATFORM_SCHEMA.extend(
         vol.Optional(CONF_SYSTEM_ENDPOINT, default=DEFAULT_SYSTEM_ENDPOINT): cv.string,
         vol.Optional(CONF_NAME, default=DEFAULT_NAME): cv.string,
         vol.Optional(CONF_SCAN_INTERVAL, default=DEFAULT_SCAN_INTERVAL): cv.time_period,
+        vol.Optional(CONF_CAPTURE_PATH): cv.string,
+        vol.Optional(
+            CONF_CAPTURE_SEGMENT_SIZE, default=DEFAULT_CAPTURE_SEGMENT_SIZE
+        ): cv.positive_int,
+        vol.Optional(
+            CONF_CAPTURE_SEGMENT_AGE, default=DEFAULT_CAPTURE_SEGMENT_AGE
+        ): cv.time_period,
+        vol.Optional(
+            CONF_CAPTURE_MAX_SIZE, default=DEFAULT_CAPTURE_MAX_SIZE
+        ): cv.positive_int,
+        vol.Optional(CONF_EXPORT): EXPORT_SCHEMA,
+        vol.Optional(CONF_SNAPSHOT_THROTTLE): cv.time_period,
+        vol.Optional(CONF_SNAPSHOT_EVENT, default=False): cv.boolean,
+        vol.Optional(
+            CONF_PUBLISH_INTERVAL, default=DEFAULT_PUBLISH_INTERVAL
+        ): cv.time_period,
+        vol.Optional(CONF_MAX_LOOP_LAG, default=DEFAULT_MAX_LOOP_LAG): cv.time_period,
+        vol.Optional(CONF_DECRYPTION_KEY): METER_KEY,
+        vol.Optional(CONF_AUTHENTICATION_KEY): METER_KEY,
+        vol.Optional(CONF_FILTER_READINGS, default=True): cv.boolean,
+        vol.Optional(CONF_MAX_POWER, default=DEFAULT_MAX_POWER): vol.All(
+            vol.Coerce(float), vol.Range(min=0, min_included=False)
+        ),
+        vol.Optional(CONF_THRESHOLDS): vol.All(cv.ensure_list, [THRESHOLD_SCHEMA]),
+        vol.Optional(CONF_COST): COST_SCHEMA,
     }
 )
 
@@ -56,6 +178,11 @@ async def async_setup_platform(
     discovery_info: DiscoveryInfoType | None = None,
 ) -> None:
     """Set up the P1 Reader sensors."""
+    if discovery_info is not None:
+        # Virtual site meters are set up from the integration's configuration
+        await async_setup_site_meter(hass, discovery_info, async_add_entities)
+        return
+
     _LOGGER.debug("Setting up P1 Reader sensors")
 
     # Get configuration
@@ -68,52 +195,191 @@ async def async_setup_platform(
     p1_url = f"http://{host}{endpoint}"
     system_url = f"http://{host}{system_endpoint}"
 
-    # Create data coordinators
-    p1_coordinator = P1DataCoordinator(hass, p1_url, scan_interval)
-    system_coordinator = SystemDataCoordinator(hass, system_url, scan_interval)
+    # Optional raw telegram capture
+    capture = None
+    if capture_path := config.get(CONF_CAPTURE_PATH):
+        # pylint: disable-next=import-outside-toplevel
+        from .capture import TelegramCapture
 
-    # Create P1 sensors
-    sensors = []
-    for obis_code, definition in SENSOR_DEFINITIONS.items():
-        sensors.append(
-            P1Sensor(
-                p1_coordinator,
-                system_coordinator,
-                obis_code,
-                definition["name"],
-                definition["unit"],
-                definition.get("device_class"),
-                definition.get("state_class"),
-                definition.get("icon"),
+        capture = TelegramCapture(
+            hass,
+            hass.config.path(capture_path),
+            config[CONF_CAPTURE_SEGMENT_SIZE] * 1024 * 1024,
+            config[CONF_CAPTURE_SEGMENT_AGE],
+            config[CONF_CAPTURE_MAX_SIZE] * 1024 * 1024,
+        )
+        hass.bus.async_listen_once(EVENT_HOMEASSISTANT_STOP, capture.async_flush)
+
+    # Optional batched time-series export
+    exporter = None
+    if export_config := config.get(CONF_EXPORT):
+        if export_config[CONF_PROTOCOL] != PROTOCOL_MQTT and not export_config.get(
+            CONF_HOST
+        ):
+            _LOGGER.error(
+                "Export protocol %s requires a host", export_config[CONF_PROTOCOL]
+            )
+        else:
+            # pylint: disable-next=import-outside-toplevel
+            from .exporter import SnapshotExporter
+
+            exporter = SnapshotExporter(
+                hass,
                 name,
+                export_config[CONF_PROTOCOL],
+                export_config.get(CONF_HOST),
+                export_config[CONF_PORT],
+                export_config[CONF_TOPIC],
+                export_config[CONF_MEASUREMENT],
+                export_config[CONF_BATCH_SIZE],
+                export_config[CONF_FLUSH_INTERVAL],
             )
+            exporter.async_start()
+            hass.bus.async_listen_once(EVENT_HOMEASSISTANT_STOP, exporter.async_stop)
+
+    # Optional decryption for meters sending encrypted frames
+    decryptor = None
+    if decryption_key := config.get(CONF_DECRYPTION_KEY):
+        # pylint: disable-next=import-outside-toplevel
+        from .p1_decryption import FrameDecryptor
+
+        authentication_key = config.get(CONF_AUTHENTICATION_KEY)
+        decryptor = FrameDecryptor(
+            bytes.fromhex(decryption_key),
+            bytes.fromhex(authentication_key) if authentication_key else None,
+        )
+
+    # Reject glitched readings before they reach entities and statistics
+    reading_filter = None
+    if config[CONF_FILTER_READINGS]:
+        reading_filter = ReadingFilter(
+            SENSOR_DEFINITIONS,
+            config[CONF_MAX_POWER],
+            store=counter_store(hass, name),
         )
+        # Check the first telegram against the counters before the restart
+        await reading_filter.async_load()
+
+    # Threshold triggers evaluated on every telegram
+    threshold_engine = None
+    if thresholds := config.get(CONF_THRESHOLDS):
+        threshold_engine = ThresholdEngine(
+            hass,
+            name,
+            [
+                ThresholdRule(
+                    threshold[CONF_NAME],
+                    threshold[CONF_OBIS],
+                    threshold.get(CONF_ABOVE, threshold.get(CONF_BELOW)),
+                    CONF_ABOVE in threshold,
+                    threshold[CONF_HYSTERESIS],
+                    threshold[CONF_DURATION].total_seconds(),
+                )
+                for threshold in thresholds
+            ],
+        )
+
+    # Running energy cost from counter deltas and spot prices
+    cost_accumulator = None
+    if cost_config := config.get(CONF_COST):
+        # pylint: disable-next=import-outside-toplevel
+        from .cost_accumulator import CostAccumulator
+
+        cost_accumulator = CostAccumulator(
+            hass,
+            name,
+            cost_config[CONF_PRICE_ENTITY],
+            cost_config.get(CONF_EXPORT_PRICE_ENTITY),
+        )
+        await cost_accumulator.async_load()
+        # Follow prices before the first telegram is accounted
+        cost_accumulator.async_start()
+        hass.bus.async_listen_once(
+            EVENT_HOMEASSISTANT_STOP, cost_accumulator.async_stop
+        )
+
+    # Slow down polling and state writes when the event loop falls behind
+    load_guard = LoadGuard(hass, config[CONF_MAX_LOOP_LAG].total_seconds())
+
+    # Create data coordinators
+    system_coordinator = SystemDataCoordinator(
+        hass, system_url, scan_interval, load_guard
+    )
+    p1_coordinator = P1DataCoordinator(
+        hass,
+        p1_url,
+        scan_interval,
+        name=name,
+        system_coordinator=system_coordinator,
+        capture=capture,
+        exporter=exporter,
+        snapshot_throttle=config.get(CONF_SNAPSHOT_THROTTLE),
+        snapshot_event=config[CONF_SNAPSHOT_EVENT],
+        publish_interval=config[CONF_PUBLISH_INTERVAL],
+        load_guard=load_guard,
+        decryptor=decryptor,
+        reading_filter=reading_filter,
+        threshold_engine=threshold_engine,
+        cost_accumulator=cost_accumulator,
+    )
+    await system_coordinator.async_update()
+    await p1_coordinator.async_update()
+    for component in (load_guard, system_coordinator, p1_coordinator):
+        component.async_start()
+        hass.bus.async_listen_once(EVENT_HOMEASSISTANT_STOP, component.async_stop)
+
+    # Make the coordinator reachable for websocket subscriptions
+    hass.data.setdefault(DATA_COORDINATORS, {})[name] = p1_coordinator
+
+    # Create P1 sensors
+    sensors = [
+        P1Sensor(p1_coordinator, system_coordinator, description, name)
+        for description in SENSOR_DESCRIPTIONS
+    ]
 
     # Add net power sensor (calculated)
     sensors.append(P1NetPowerSensor(p1_coordinator, system_coordinator, name))
 
-    # Create system sensors
-    for sensor_key, definition in SYSTEM_SENSOR_DEFINITIONS.items():
+    # Add effective poll interval diagnostic
+    sensors.append(ZapLoadSensor(p1_coordinator, system_coordinator, name))
+
+    # Add rejected readings diagnostic
+    if reading_filter is not None:
         sensors.append(
-            SystemSensor(
+            ZapRejectedReadingsSensor(p1_coordinator, system_coordinator, name)
+        )
+
+    # Add cost sensors
+    if cost_accumulator is not None:
+        # pylint: disable-next=import-outside-toplevel
+        from .cost_sensor import SENSOR_NAMES, CostSensor
+
+        sensors.extend(
+            CostSensor(
+                p1_coordinator,
                 system_coordinator,
-                sensor_key,
-                definition["name"],
-                definition["unit"],
-                definition.get("device_class"),
-                definition.get("state_class"),
-                definition.get("icon"),
-                definition["path"],
+                cost_accumulator,
+                direction,
+                period,
                 name,
             )
+            for direction, period in SENSOR_NAMES
         )
 
-    async_add_entities(sensors, True)
+    # Create system sensors
+    sensors.extend(
+        SystemSensor(system_coordinator, description, name)
+        for description in SYSTEM_SENSOR_DESCRIPTIONS
+    )
+
+    async_add_entities(sensors)
 
 
 class P1NetPowerSensor(SensorEntity):
     """Calculated net power sensor (import - export)."""
 
+    _attr_should_poll = False
+
     def __init__(
         self,
         coordinator: P1DataCoordinator,
@@ -135,27 +401,157 @@ class P1NetPowerSensor(SensorEntity):
     @property
     def device_info(self) -> dict[str, Any]:
         """Return device information."""
-        device_id = self.system_coordinator.device_info.get("device_id", "unknown")
-        firmware_version = self.system_coordinator.device_info.get(
-            "firmware_version", "unknown"
+        return self.system_coordinator.zap_device_info
+
+    async def async_added_to_hass(self) -> None:
+        """Subscribe to every new telegram."""
+        self._update_from_coordinator()
+        self.async_on_remove(
+            self.coordinator.async_add_listener(
+                self._handle_coordinator_update, UPDATE_CLASS_FAST
+            )
         )
 
-        return {
-            "identifiers": {(DOMAIN, device_id)},
-            "name": "Sourceful Energy Zap",
-            "manufacturer": "Sourceful Labs AB",
-            "model": "Zap P1 Reader",
-            "sw_version": firmware_version,
-            "configuration_url": "http://zap.local/",
-        }
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Publish the value from the latest telegram."""
+        self._update_from_coordinator()
+        self.async_write_ha_state()
 
-    async def async_update(self) -> None:
+    def _update_from_coordinator(self) -> None:
         """Update the sensor."""
-        await self.coordinator.async_update()
-
         import_power = self.coordinator.data.get("1-0:1.7.0", {}).get("value", 0)
         export_power = self.coordinator.data.get("1-0:2.7.0", {}).get("value", 0)
 
         # Net power: positive = importing, negative = exporting
         self._attr_native_value = import_power - export_power
         self._attr_available = True
+
+
+class ZapLoadSensor(SensorEntity):
+    """Diagnostic sensor for the effective poll interval under load."""
+
+    _attr_should_poll = False
+
+    def __init__(
+        self,
+        coordinator: P1DataCoordinator,
+        system_coordinator: SystemDataCoordinator,
+        name_prefix: str = DEFAULT_NAME,
+    ) -> None:
+        """Initialize the sensor."""
+        self.coordinator = coordinator
+        self.system_coordinator = system_coordinator
+        self._attr_name = f"{name_prefix} Effective Poll Interval"
+        self._attr_unique_id = (
+            f"{name_prefix.lower().replace(' ', '_')}_effective_poll_interval"
+        )
+        self._attr_native_unit_of_measurement = UnitOfTime.SECONDS
+        self._attr_device_class = SensorDeviceClass.DURATION
+        self._attr_state_class = SensorStateClass.MEASUREMENT
+        self._attr_entity_category = EntityCategory.DIAGNOSTIC
+        self._attr_icon = "mdi:speedometer-slow"
+        self._attr_native_value = None
+
+    @property
+    def device_info(self) -> dict[str, Any]:
+        """Return device information."""
+        return self.system_coordinator.zap_device_info
+
+    async def async_added_to_hass(self) -> None:
+        """Subscribe to the normal publish cadence."""
+        self._update_from_coordinator()
+        self.async_on_remove(
+            self.coordinator.async_add_listener(
+                self._handle_coordinator_update, UPDATE_CLASS_NORMAL
+            )
+        )
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Publish the current load state."""
+        self._update_from_coordinator()
+        self.async_write_ha_state()
+
+    def _update_from_coordinator(self) -> None:
+        """Update the sensor."""
+        load_guard = self.coordinator.load_guard
+        fetchers = (self.coordinator.fetcher, self.system_coordinator.fetcher)
+        self._attr_native_value = (
+            self.coordinator.effective_scan_interval.total_seconds()
+        )
+        self._attr_extra_state_attributes = {
+            "slowdown_level": load_guard.level,
+            "loop_lag_ms": round(load_guard.loop_lag * 1000, 1),
+            "cycle_cost_ms": round(load_guard.cycle_cost * 1000, 2),
+            "duty_cycle_percent": round(load_guard.duty_cycle * 100, 2),
+            "system_poll_interval": (
+                self.system_coordinator.effective_scan_interval.total_seconds()
+            ),
+            "bytes_received": sum(fetcher.bytes_received for fetcher in fetchers),
+            "bytes_saved": sum(fetcher.bytes_saved for fetcher in fetchers),
+            "decodes_skipped": sum(fetcher.decodes_skipped for fetcher in fetchers),
+        }
+        if (threshold_engine := self.coordinator.threshold_engine) is not None:
+            self._attr_extra_state_attributes.update(
+                {
+                    "threshold_latency_ms": (
+                        None
+                        if threshold_engine.last_latency is None
+                        else round(threshold_engine.last_latency * 1000, 3)
+                    ),
+                    "threshold_max_latency_ms": round(
+                        threshold_engine.max_latency * 1000, 3
+                    ),
+                }
+            )
+
+
+class ZapRejectedReadingsSensor(SensorEntity):
+    """Diagnostic sensor counting readings rejected by the sanity filter."""
+
+    _attr_should_poll = False
+
+    def __init__(
+        self,
+        coordinator: P1DataCoordinator,
+        system_coordinator: SystemDataCoordinator,
+        name_prefix: str = DEFAULT_NAME,
+    ) -> None:
+        """Initialize the sensor."""
+        self.coordinator = coordinator
+        self.system_coordinator = system_coordinator
+        self._attr_name = f"{name_prefix} Rejected Readings"
+        self._attr_unique_id = (
+            f"{name_prefix.lower().replace(' ', '_')}_rejected_readings"
+        )
+        self._attr_state_class = SensorStateClass.TOTAL_INCREASING
+        self._attr_entity_category = EntityCategory.DIAGNOSTIC
+        self._attr_icon = "mdi:filter-remove-outline"
+        self._attr_native_value = None
+
+    @property
+    def device_info(self) -> dict[str, Any]:
+        """Return device information."""
+        return self.system_coordinator.zap_device_info
+
+    async def async_added_to_hass(self) -> None:
+        """Subscribe to the normal publish cadence."""
+        self._update_from_coordinator()
+        self.async_on_remove(
+            self.coordinator.async_add_listener(
+                self._handle_coordinator_update, UPDATE_CLASS_NORMAL
+            )
+        )
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Publish the rejection counts."""
+        self._update_from_coordinator()
+        self.async_write_ha_state()
+
+    def _update_from_coordinator(self) -> None:
+        """Update the sensor."""
+        reading_filter = self.coordinator.reading_filter
+        self._attr_native_value = reading_filter.total_rejected
+        self._attr_extra_state_attributes = dict(reading_filter.rejected)
@@ -0,0 +1,114 @@
+"""Virtual site meter aggregating several Zaps."""
+
+from __future__ import annotations
+
+import logging
+import math
+from operator import sub
+from typing import Iterable
+
+from homeassistant.core import CALLBACK_TYPE, Event, HomeAssistant, callback
+from homeassistant.helpers.dispatcher import async_dispatcher_connect
+
+from .const import DATA_COORDINATORS, SIGNAL_SNAPSHOT
+from .coordinator import ZapCoordinator
+from .snapshot import P1Snapshot
+
+_LOGGER = logging.getLogger(__name__)
+
+# OBIS codes aggregated for a site, in vector order
+SITE_CODES = ("1-0:1.7.0", "1-0:2.7.0", "1-0:1.8.0", "1-0:2.8.0")
+
+
+class SiteMeterCoordinator(ZapCoordinator):
+    """Combine snapshots from several Zaps into site totals.
+
+    The latest snapshot of every meter is kept as a flat value vector. Once
+    all meters have a reading within the tolerance window of each other, the
+    site total (sum of the mains) and the unmetered remainder (total minus
+    the submeters) are computed once for that aligned set.
+
+    Every Zap polls on its own schedule, so a new reading usually finds the
+    other meters' readings too old. Those meters are asked to poll right
+    away, which also brings their schedules in phase with each other.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        mains: list[str],
+        submeters: list[str],
+        tolerance: float,
+    ) -> None:
+        """Initialize the site meter coordinator."""
+        super().__init__(hass)
+        self.mains = mains
+        self.submeters = submeters
+        self.tolerance = tolerance
+        self.total: tuple[float, ...] = (math.nan,) * len(SITE_CODES)
+        self.unmetered: tuple[float, ...] = (math.nan,) * len(SITE_CODES)
+        self._latest: dict[str, tuple[float, tuple[float, ...]]] = {}
+        self._last_aligned = -math.inf
+        self._unsubs: list[CALLBACK_TYPE] = []
+
+    @callback
+    def async_start(self) -> None:
+        """Subscribe to the snapshots of every meter."""
+        self._unsubs = [
+            async_dispatcher_connect(
+                self.hass, SIGNAL_SNAPSHOT.format(name), self._handle_snapshot
+            )
+            for name in (*self.mains, *self.submeters)
+        ]
+
+    @callback
+    def async_stop(self, _event: Event | None = None) -> None:
+        """Unsubscribe from all meters."""
+        for unsub in self._unsubs:
+            unsub()
+        self._unsubs = []
+
+    @callback
+    def _handle_snapshot(self, snapshot: P1Snapshot) -> None:
+        """Store a meter's snapshot and compute the site if a set is aligned."""
+        reading_time = snapshot.reading_time
+        if reading_time is None:
+            return
+        values = snapshot.values
+        self._latest[snapshot.name] = (
+            reading_time,
+            tuple(values.get(code, math.nan) for code in SITE_CODES),
+        )
+
+        self._refresh_lagging(snapshot.name, reading_time)
+
+        if len(self._latest) < len(self.mains) + len(self.submeters):
+            return
+        times = [entry[0] for entry in self._latest.values()]
+        newest = max(times)
+        if newest - min(times) > self.tolerance or newest <= self._last_aligned:
+            return
+        self._last_aligned = newest
+
+        self.total = _sum_vectors(self._latest[name][1] for name in self.mains)
+        submetered = _sum_vectors(self._latest[name][1] for name in self.submeters)
+        self.unmetered = tuple(map(sub, self.total, submetered))
+
+        self._notify()
+
+    @callback
+    def _refresh_lagging(self, name: str, reading_time: float) -> None:
+        """Ask meters whose latest reading is too old to align to poll now."""
+        coordinators = self.hass.data.get(DATA_COORDINATORS, {})
+        for other, (other_time, _values) in self._latest.items():
+            if (
+                other != name
+                and other_time < reading_time - self.tolerance
+                and (coordinator := coordinators.get(other)) is not None
+            ):
+                coordinator.async_request_refresh()
+
+
+def _sum_vectors(vectors: Iterable[tuple[float, ...]]) -> tuple[float, ...]:
+    """Sum value vectors element-wise."""
+    return tuple(map(math.fsum, zip(*vectors))) or (0.0,) * len(SITE_CODES)
@@ -0,0 +1,115 @@
+"""Virtual Site Meter Sensor."""
+
+import logging
+import math
+from typing import Any
+
+from homeassistant.components.sensor import SensorEntity, SensorStateClass
+from homeassistant.const import CONF_NAME, EVENT_HOMEASSISTANT_STOP
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.entity_platform import AddEntitiesCallback
+from homeassistant.helpers.typing import DiscoveryInfoType
+
+from .const import CONF_MAINS, CONF_SUBMETERS, CONF_TOLERANCE, DOMAIN
+from .obis_definitions import SENSOR_DEFINITIONS
+from .site_coordinator import SITE_CODES, SiteMeterCoordinator
+
+_LOGGER = logging.getLogger(__name__)
+
+KIND_TOTAL = "total"
+KIND_UNMETERED = "unmetered"
+
+
+async def async_setup_site_meter(
+    hass: HomeAssistant,
+    site_config: DiscoveryInfoType,
+    async_add_entities: AddEntitiesCallback,
+) -> None:
+    """Set up the sensors of one virtual site meter."""
+    name = site_config[CONF_NAME]
+    _LOGGER.debug("Setting up site meter %s", name)
+
+    coordinator = SiteMeterCoordinator(
+        hass,
+        site_config[CONF_MAINS],
+        site_config[CONF_SUBMETERS],
+        site_config[CONF_TOLERANCE].total_seconds(),
+    )
+    coordinator.async_start()
+    hass.bus.async_listen_once(EVENT_HOMEASSISTANT_STOP, coordinator.async_stop)
+
+    sensors = []
+    for index, obis_code in enumerate(SITE_CODES):
+        sensors.append(SiteSensor(coordinator, name, KIND_TOTAL, index, obis_code))
+        if site_config[CONF_SUBMETERS]:
+            sensors.append(
+                SiteSensor(coordinator, name, KIND_UNMETERED, index, obis_code)
+            )
+
+    async_add_entities(sensors)
+
+
+class SiteSensor(SensorEntity):
+    """Representation of an aggregated site value."""
+
+    _attr_should_poll = False
+
+    def __init__(
+        self,
+        coordinator: SiteMeterCoordinator,
+        site_name: str,
+        kind: str,
+        index: int,
+        obis_code: str,
+    ) -> None:
+        """Initialize the sensor."""
+        definition = SENSOR_DEFINITIONS[obis_code]
+        self.coordinator = coordinator
+        self.site_name = site_name
+        self.kind = kind
+        self.index = index
+        self._site_id = site_name.lower().replace(" ", "_")
+        self._attr_name = f"{site_name} {kind.title()} {definition['name']}"
+        self._attr_unique_id = (
+            f"{self._site_id}_site_{kind}_"
+            f"{obis_code.replace(':', '_').replace('-', '_')}"
+        )
+        self._attr_native_unit_of_measurement = definition["unit"]
+        self._attr_device_class = definition.get("device_class")
+        self._attr_state_class = definition.get("state_class")
+        # A difference of counters is not guaranteed to only increase
+        if (
+            kind == KIND_UNMETERED
+            and self._attr_state_class == SensorStateClass.TOTAL_INCREASING
+        ):
+            self._attr_state_class = SensorStateClass.TOTAL
+        self._attr_icon = definition.get("icon")
+        self._attr_native_value = None
+
+    @property
+    def device_info(self) -> dict[str, Any]:
+        """Return device information."""
+        return {
+            "identifiers": {(DOMAIN, f"site_{self._site_id}")},
+            "name": self.site_name,
+            "manufacturer": "Sourceful Labs AB",
+            "model": "Virtual Site Meter",
+        }
+
+    async def async_added_to_hass(self) -> None:
+        """Subscribe to aligned site values."""
+        self.async_on_remove(
+            self.coordinator.async_add_listener(self._handle_coordinator_update)
+        )
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Publish the value of the latest aligned set."""
+        vector = (
+            self.coordinator.total
+            if self.kind == KIND_TOTAL
+            else self.coordinator.unmetered
+        )
+        value = vector[self.index]
+        self._attr_native_value = None if math.isnan(value) else round(value, 3)
+        self.async_write_ha_state()
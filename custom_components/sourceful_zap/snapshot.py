@@ -0,0 +1,85 @@
+"""Immutable snapshot of one P1 telegram."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import datetime
+from types import MappingProxyType
+from typing import Any, Mapping
+
+from homeassistant.util import dt as dt_util
+
+
+def parse_meter_time(meter_time: str) -> float | None:
+    """Return a DSMR timestamp (YYMMDDhhmmssX) as seconds since the epoch.
+
+    The meter clock runs on local time, X is S while DST is in effect and W
+    otherwise, which tells the two occurrences of the hour apart when the
+    clocks go back.
+    """
+    try:
+        local = datetime.strptime(meter_time[:12], "%y%m%d%H%M%S")
+    except ValueError:
+        return None
+    return local.replace(
+        tzinfo=dt_util.get_default_time_zone(),
+        # fold=1 selects the second, standard time, occurrence of a repeated hour
+        fold=int(meter_time[12:13] == "W"),
+    ).timestamp()
+
+
+@dataclass(frozen=True)
+class P1Snapshot:
+    """All values of one telegram, consistent with each other."""
+
+    name: str
+    device_id: str
+    timestamp: int | None
+    meter_time: str | None
+    values: Mapping[str, float]
+
+    @classmethod
+    def from_data(
+        cls,
+        name: str,
+        device_id: str,
+        timestamp: int | None,
+        meter_time: str | None,
+        data: dict[str, dict[str, Any]],
+    ) -> P1Snapshot:
+        """Build a snapshot from parsed coordinator data."""
+        return cls(
+            name,
+            device_id,
+            timestamp,
+            meter_time,
+            MappingProxyType(
+                {obis_code: reading["value"] for obis_code, reading in data.items()}
+            ),
+        )
+
+    @property
+    def reading_time(self) -> float | None:
+        """Return when the reading was taken, in seconds, for alignment.
+
+        The meter's own clock (0-0:1.0.0) is preferred, the Zap's ts is the
+        fallback.
+        """
+        if (
+            self.meter_time
+            and (reading_time := parse_meter_time(self.meter_time)) is not None
+        ):
+            return reading_time
+        if self.timestamp is not None:
+            return self.timestamp / 1000
+        return None
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the snapshot as JSON serializable event data."""
+        return {
+            "name": self.name,
+            "device_id": self.device_id,
+            "timestamp": self.timestamp,
+            "meter_time": self.meter_time,
+            "values": dict(self.values),
+        }
@@ -2,6 +2,7 @@
 
 from datetime import timedelta
 import logging
+import time
 from typing import Any
 
 import aiohttp
@@ -9,35 +10,68 @@ import async_timeout
 
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.aiohttp_client import async_get_clientsession
-from homeassistant.util import Throttle
 
-from .const import DEFAULT_SCAN_INTERVAL
+from .const import DEFAULT_SCAN_INTERVAL, DOMAIN, TIER_SYSTEM
+from .coordinator import PollingCoordinator
+from .http_fetch import ConditionalFetcher
+from .load_guard import LoadGuard
+from .system_sensor_definitions import COMPILED_SYSTEM_SENSORS, MISSING
 
 _LOGGER = logging.getLogger(__name__)
 
+# Polls with new data after which fields missing from the payload are checked
+# again, some are only reported once the device is up (e.g. WiFi RSSI)
+REPROBE_INTERVAL = 10
 
-class SystemDataCoordinator:
+
+class SystemDataCoordinator(PollingCoordinator):
     """Coordinate system data fetching for Zap device information."""
 
-    def __init__(self, hass: HomeAssistant, url: str, scan_interval: timedelta) -> None:
+    tier = TIER_SYSTEM
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        url: str,
+        scan_interval: timedelta,
+        load_guard: LoadGuard | None = None,
+    ) -> None:
         """Initialize the system data coordinator."""
-        self.hass = hass
+        # System data changes slowly, never poll it faster than the default
+        super().__init__(hass, max(scan_interval, DEFAULT_SCAN_INTERVAL), load_guard)
         self.url = url
         self.data = {}
+        # Raw payload as served by the Zap, for the read-through HTTP view
+        self.raw_payload: bytes | None = None
+        self.payload_version = 0
         self.device_info = {}
+        # Device registry info shared by all entities of this Zap
+        self.zap_device_info = self._build_zap_device_info()
+        # Flat value vector, one slot per compiled system sensor
+        self.sensors = COMPILED_SYSTEM_SENSORS
+        self.slots = {sensor.key: slot for slot, sensor in enumerate(self.sensors)}
+        self.values: list[Any] = [None] * len(self.sensors)
+        self._active_slots: tuple[int, ...] = ()
+        self._missing_slots: tuple[int, ...] = ()
+        self._probed_firmware: str | None = None
+        self._polls_since_probe = 0
         self.session = async_get_clientsession(hass)
-        self.scan_interval = scan_interval
+        self.fetcher = ConditionalFetcher(self.session, url)
         self._last_update = None
 
-    @Throttle(DEFAULT_SCAN_INTERVAL)
     async def async_update(self) -> None:
         """Fetch system data from API."""
         try:
             async with async_timeout.timeout(10):
                 _LOGGER.debug("Fetching system data from %s", self.url)
-                response = await self.session.get(self.url)
-                response.raise_for_status()
-                self.data = await response.json()
+                json_data = await self.fetcher.async_fetch_json()
+                if json_data is None:
+                    # Unchanged since the last poll, nothing to decode or publish
+                    return
+                self.data = json_data
+                self.raw_payload = self.fetcher.body
+                self.payload_version += 1
+                cycle_start = time.perf_counter()
 
                 # Extract device info for Home Assistant device registry
                 if "zap" in self.data:
@@ -51,6 +85,12 @@ class SystemDataCoordinator:
                         .get("network", {})
                         .get("localIP", "unknown"),
                     }
+                    self._refresh_zap_device_info()
+
+                self._extract_values()
+                self._notify()
+                if self.load_guard is not None:
+                    self.load_guard.record_cycle(time.perf_counter() - cycle_start)
 
                 _LOGGER.debug("Successfully fetched system data")
 
@@ -59,12 +99,79 @@ class SystemDataCoordinator:
         except Exception as err:
             _LOGGER.error("Unexpected error fetching system data: %s", err)
 
-    def get_nested_value(self, path: str) -> Any:
-        """Get nested value from data using dot notation."""
-        try:
-            value = self.data
-            for key in path.split("."):
-                value = value[key]
-            return value
-        except (KeyError, TypeError):
-            return None
+    def _build_zap_device_info(self) -> dict[str, Any]:
+        """Return the device registry info for the current device info."""
+        return {
+            "identifiers": {(DOMAIN, self.device_info.get("device_id", "unknown"))},
+            "name": "Sourceful Energy Zap",
+            "manufacturer": "Sourceful Labs AB",
+            "model": "Zap P1 Reader",
+            "sw_version": self.device_info.get("firmware_version", "unknown"),
+            "configuration_url": "http://zap.local/",
+        }
+
+    def _refresh_zap_device_info(self) -> None:
+        """Rebuild the device registry info only when the device or firmware changed."""
+        device_id = self.device_info.get("device_id", "unknown")
+        firmware_version = self.device_info.get("firmware_version", "unknown")
+        if (
+            self.zap_device_info["identifiers"] != {(DOMAIN, device_id)}
+            or self.zap_device_info["sw_version"] != firmware_version
+        ):
+            self.zap_device_info = self._build_zap_device_info()
+
+    def _extract_values(self) -> None:
+        """Fill the value vector in one pass over the payload."""
+        firmware_version = self.device_info.get("firmware_version")
+        if firmware_version != self._probed_firmware:
+            self._probe_fields(firmware_version)
+        elif self._missing_slots:
+            self._polls_since_probe += 1
+            if self._polls_since_probe >= REPROBE_INTERVAL:
+                self._reprobe_missing_fields()
+
+        data = self.data
+        values = self.values
+        for slot in self._active_slots:
+            sensor = self.sensors[slot]
+            value = sensor.accessor(data)
+            values[slot] = None if value is MISSING else sensor.transform(value)
+
+    def _probe_fields(self, firmware_version: str | None) -> None:
+        """Find which fields this firmware reports, once per version."""
+        self._probed_firmware = firmware_version
+        self._polls_since_probe = 0
+        self._active_slots = tuple(
+            slot
+            for slot, sensor in enumerate(self.sensors)
+            if sensor.accessor(self.data) is not MISSING
+        )
+        self._missing_slots = tuple(
+            slot for slot in range(len(self.sensors)) if slot not in self._active_slots
+        )
+        self.values = [None] * len(self.sensors)
+
+        if self._missing_slots:
+            _LOGGER.info(
+                "Firmware %s does not report %s",
+                firmware_version,
+                ", ".join(self.sensors[slot].path for slot in self._missing_slots),
+            )
+
+    def _reprobe_missing_fields(self) -> None:
+        """Start reading missing fields that the payload now carries."""
+        self._polls_since_probe = 0
+        if found := tuple(
+            slot
+            for slot in self._missing_slots
+            if self.sensors[slot].accessor(self.data) is not MISSING
+        ):
+            self._active_slots = tuple(sorted(self._active_slots + found))
+            self._missing_slots = tuple(
+                slot for slot in self._missing_slots if slot not in found
+            )
+            _LOGGER.info(
+                "Firmware %s now reports %s",
+                self._probed_firmware,
+                ", ".join(self.sensors[slot].path for slot in found),
+            )
@@ -3,14 +3,12 @@
 import logging
 from typing import Any
 
-from homeassistant.components.sensor import (
-    SensorDeviceClass,
-    SensorEntity,
-    SensorStateClass,
-)
+from homeassistant.components.sensor import SensorEntity
+from homeassistant.core import callback
 
-from .const import DEFAULT_NAME, DOMAIN
+from .const import DEFAULT_NAME
 from .system_data_coordinator import SystemDataCoordinator
+from .system_sensor_definitions import SystemSensorEntityDescription
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -18,66 +16,55 @@ _LOGGER = logging.getLogger(__name__)
 class SystemSensor(SensorEntity):
     """Representation of a Zap system sensor."""
 
+    _attr_should_poll = False
+    entity_description: SystemSensorEntityDescription
+
     def __init__(
         self,
         coordinator: SystemDataCoordinator,
-        sensor_key: str,
-        sensor_name: str,
-        unit: str | None,
-        device_class: SensorDeviceClass | None = None,
-        state_class: SensorStateClass | None = None,
-        icon: str | None = None,
-        data_path: str = "",
+        description: SystemSensorEntityDescription,
         name_prefix: str = DEFAULT_NAME,
     ) -> None:
         """Initialize the system sensor."""
         self.coordinator = coordinator
-        self.sensor_key = sensor_key
-        self.data_path = data_path
-        self._attr_name = f"{name_prefix} {sensor_name}"
+        self.entity_description = description
+        self.sensor_key = description.key
+        self._slot = coordinator.slots[description.key]
+        self._attr_name = f"{name_prefix} {description.name}"
         self._attr_unique_id = (
-            f"{name_prefix.lower().replace(' ', '_')}_system_{sensor_key}"
+            f"{name_prefix.lower().replace(' ', '_')}_{description.unique_id_suffix}"
         )
-        self._attr_native_unit_of_measurement = unit
-        self._attr_device_class = device_class
-        self._attr_state_class = state_class
-        self._attr_icon = icon
         self._attr_native_value = None
         self._attr_available = True
 
     @property
     def device_info(self) -> dict[str, Any]:
         """Return device information."""
-        device_id = self.coordinator.device_info.get("device_id", "unknown")
-        firmware_version = self.coordinator.device_info.get(
-            "firmware_version", "unknown"
+        return self.coordinator.zap_device_info
+
+    async def async_added_to_hass(self) -> None:
+        """Subscribe to new system data."""
+        self._update_from_coordinator()
+        self.async_on_remove(
+            self.coordinator.async_add_listener(self._handle_coordinator_update)
         )
 
-        return {
-            "identifiers": {(DOMAIN, device_id)},
-            "name": "Sourceful Energy Zap",
-            "manufacturer": "Sourceful Labs AB",
-            "model": "Zap P1 Reader",
-            "sw_version": firmware_version,
-            "configuration_url": "http://zap.local/",
-        }
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Publish the value from the latest system data."""
+        self._update_from_coordinator()
+        self.async_write_ha_state()
 
-    async def async_update(self) -> None:
+    def _update_from_coordinator(self) -> None:
         """Update the sensor."""
-        await self.coordinator.async_update()
-
-        value = self.coordinator.get_nested_value(self.data_path)
+        value = self.coordinator.values[self._slot]
         if value is not None:
-            # Round floating point values to 2 decimal places
-            if isinstance(value, float):
-                self._attr_native_value = round(value, 2)
-            else:
-                self._attr_native_value = value
+            self._attr_native_value = value
             self._attr_available = True
         else:
             self._attr_available = False
             _LOGGER.debug(
                 "System sensor %s: No data found at path %s",
                 self.sensor_key,
-                self.data_path,
+                self.entity_description.path,
             )
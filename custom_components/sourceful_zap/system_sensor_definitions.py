@@ -1,6 +1,20 @@
-"""System sensor definitions for Zap, mapping to the API structure."""
+"""System sensor definitions for Zap, mapping to the API structure.
 
-from homeassistant.components.sensor import SensorDeviceClass, SensorStateClass
+Besides the entity attributes, a definition can carry a value pipeline:
+"scale" multiplies numbers, "precision" rounds floats (default 2) and
+"options" maps raw values to states.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Any, Callable, NamedTuple
+
+from homeassistant.components.sensor import (
+    SensorDeviceClass,
+    SensorEntityDescription,
+    SensorStateClass,
+)
 
 SYSTEM_SENSOR_DEFINITIONS = {
     "uptime": {
@@ -108,3 +122,93 @@ SYSTEM_SENSOR_DEFINITIONS = {
         "path": "zap.deviceId",
     },
 }
+
+
+# Marks a path that is not present in the payload
+MISSING = object()
+
+DEFAULT_PRECISION = 2
+
+
+class CompiledSystemSensor(NamedTuple):
+    """Accessor and transform for one system sensor, built once."""
+
+    key: str
+    path: str
+    accessor: Callable[[Any], Any]
+    transform: Callable[[Any], Any]
+
+
+def _compile_accessor(path: str) -> Callable[[Any], Any]:
+    """Return a function reading a dotted path from a payload."""
+    keys = tuple(path.split("."))
+
+    def accessor(data: Any) -> Any:
+        for key in keys:
+            if not isinstance(data, dict):
+                return MISSING
+            data = data.get(key, MISSING)
+            if data is MISSING:
+                return MISSING
+        return data
+
+    return accessor
+
+
+def _compile_transform(definition: dict[str, Any]) -> Callable[[Any], Any]:
+    """Return a function applying scaling, rounding and enum mapping."""
+    scale = definition.get("scale")
+    precision = definition.get("precision", DEFAULT_PRECISION)
+    options = definition.get("options")
+
+    def transform(value: Any) -> Any:
+        if options is not None:
+            return options.get(value, value)
+        if scale is not None and isinstance(value, (int, float)):
+            value = value * scale
+        if isinstance(value, float):
+            return round(value, precision)
+        return value
+
+    return transform
+
+
+def compile_system_sensors(
+    definitions: dict[str, dict[str, Any]],
+) -> tuple[CompiledSystemSensor, ...]:
+    """Compile definitions into accessor and transform functions."""
+    return tuple(
+        CompiledSystemSensor(
+            key,
+            definition["path"],
+            _compile_accessor(definition["path"]),
+            _compile_transform(definition),
+        )
+        for key, definition in definitions.items()
+    )
+
+
+COMPILED_SYSTEM_SENSORS = compile_system_sensors(SYSTEM_SENSOR_DEFINITIONS)
+
+
+@dataclass(frozen=True, kw_only=True)
+class SystemSensorEntityDescription(SensorEntityDescription):
+    """Describes a system sensor, shared by the entities of every Zap."""
+
+    path: str
+    unique_id_suffix: str
+
+
+SYSTEM_SENSOR_DESCRIPTIONS: tuple[SystemSensorEntityDescription, ...] = tuple(
+    SystemSensorEntityDescription(
+        key=key,
+        name=definition["name"],
+        native_unit_of_measurement=definition["unit"],
+        device_class=definition.get("device_class"),
+        state_class=definition.get("state_class"),
+        icon=definition.get("icon"),
+        path=definition["path"],
+        unique_id_suffix=f"system_{key}",
+    )
+    for key, definition in SYSTEM_SENSOR_DEFINITIONS.items()
+)
@@ -0,0 +1,137 @@
+"""Threshold rules evaluated directly against each telegram."""
+
+from __future__ import annotations
+
+import logging
+import time
+from typing import Any
+
+from homeassistant.core import HomeAssistant, callback
+
+from .const import EVENT_THRESHOLD
+
+_LOGGER = logging.getLogger(__name__)
+
+STATE_TRIGGERED = "triggered"
+STATE_CLEARED = "cleared"
+
+
+class ThresholdRule:
+    """A limit on one OBIS value with hysteresis and a minimum duration."""
+
+    __slots__ = (
+        "name",
+        "obis_code",
+        "limit",
+        "above",
+        "hysteresis",
+        "duration",
+        "active",
+        "pending_since",
+    )
+
+    def __init__(
+        self,
+        name: str,
+        obis_code: str,
+        limit: float,
+        above: bool,
+        hysteresis: float = 0.0,
+        duration: float = 0.0,
+    ) -> None:
+        """Initialize the rule."""
+        self.name = name
+        self.obis_code = obis_code
+        self.limit = limit
+        self.above = above
+        self.hysteresis = hysteresis
+        self.duration = duration
+        self.active = False
+        self.pending_since: float | None = None
+
+    def evaluate(self, value: float, now: float) -> str | None:
+        """Return the new state when the rule changes, else None."""
+        if self.active:
+            if self.above:
+                cleared = value < self.limit - self.hysteresis
+            else:
+                cleared = value > self.limit + self.hysteresis
+            if cleared:
+                self.active = False
+                return STATE_CLEARED
+            return None
+
+        if (value > self.limit) if self.above else (value < self.limit):
+            if self.pending_since is None:
+                self.pending_since = now
+            if now - self.pending_since >= self.duration:
+                self.active = True
+                self.pending_since = None
+                return STATE_TRIGGERED
+        else:
+            self.pending_since = None
+        return None
+
+
+class ThresholdEngine:
+    """Evaluate threshold rules against each new telegram.
+
+    Rules are grouped by OBIS code once, so a telegram costs a dict lookup
+    and a few comparisons per configured code. Events are fired on the bus
+    directly, without going through entity states.
+    """
+
+    def __init__(
+        self, hass: HomeAssistant, device_name: str, rules: list[ThresholdRule]
+    ) -> None:
+        """Initialize the engine."""
+        self.hass = hass
+        self.device_name = device_name
+        self.last_latency: float | None = None
+        self.max_latency = 0.0
+        self._rules_by_code: dict[str, tuple[ThresholdRule, ...]] = {}
+        for rule in rules:
+            self._rules_by_code[rule.obis_code] = (
+                *self._rules_by_code.get(rule.obis_code, ()),
+                rule,
+            )
+
+    @callback
+    def evaluate(self, data: dict[str, dict[str, Any]], arrival: float) -> None:
+        """Check all rules, arrival is the perf_counter when the telegram came in."""
+        now = time.monotonic()
+        for obis_code, rules in self._rules_by_code.items():
+            if (reading := data.get(obis_code)) is None:
+                continue
+            value = reading["value"]
+            for rule in rules:
+                if (state := rule.evaluate(value, now)) is not None:
+                    self._fire(rule, state, value, arrival)
+
+    @callback
+    def _fire(
+        self, rule: ThresholdRule, state: str, value: float, arrival: float
+    ) -> None:
+        """Fire the threshold event and record the arrival-to-fire latency."""
+        latency = time.perf_counter() - arrival
+        self.hass.bus.async_fire(
+            EVENT_THRESHOLD,
+            {
+                "name": self.device_name,
+                "rule": rule.name,
+                "obis_code": rule.obis_code,
+                "state": state,
+                "value": value,
+                "limit": rule.limit,
+                "latency_ms": round(latency * 1000, 3),
+            },
+        )
+        self.last_latency = latency
+        self.max_latency = max(self.max_latency, latency)
+        _LOGGER.debug(
+            "Threshold %s %s at %s (%.3f ms after arrival)",
+            rule.name,
+            state,
+            value,
+            latency * 1000,
+        )
@@ -0,0 +1,85 @@
+"""Read-through HTTP view serving the cached Zap payloads."""
+
+from __future__ import annotations
+
+from http import HTTPStatus
+import math
+import secrets
+from typing import TYPE_CHECKING
+
+from aiohttp import hdrs, web
+
+from homeassistant.components.http import HomeAssistantView
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.http import KEY_HASS
+
+from .const import DATA_COORDINATORS, DEFAULT_LONG_POLL, MAX_LONG_POLL
+
+if TYPE_CHECKING:
+    from .p1_coordinator import P1DataCoordinator
+    from .system_data_coordinator import SystemDataCoordinator
+
+ENDPOINT_P1 = "p1"
+ENDPOINT_SYSTEM = "system"
+
+# Changes on every restart, so ETags from an earlier run never match
+_ETAG_PREFIX = secrets.token_hex(4)
+
+
+def _etag(coordinator: P1DataCoordinator | SystemDataCoordinator) -> str:
+    """Return the ETag of the cached payload."""
+    return f'"{_ETAG_PREFIX}-{coordinator.payload_version}"'
+
+
+class ZapDataView(HomeAssistantView):
+    """Serve the latest telegram or system payload of a Zap.
+
+    Responses carry an ETag; with If-None-Match and a `wait` query parameter
+    the request is held until the next telegram instead of returning 304, so
+    other local tools can follow the Zap without polling the device.
+    """
+
+    url = "/api/sourceful_zap/{name}/{endpoint}"
+    name = "api:sourceful_zap:data"
+
+    async def get(self, request: web.Request, name: str, endpoint: str) -> web.Response:
+        """Return the cached payload."""
+        hass: HomeAssistant = request.app[KEY_HASS]
+        if (p1_coordinator := hass.data.get(DATA_COORDINATORS, {}).get(name)) is None:
+            return self.json_message(f"No Zap named {name}", HTTPStatus.NOT_FOUND)
+
+        if endpoint == ENDPOINT_P1:
+            coordinator = p1_coordinator
+        elif endpoint == ENDPOINT_SYSTEM and p1_coordinator.system_coordinator:
+            coordinator = p1_coordinator.system_coordinator
+        else:
+            return self.json_message(
+                f"Unknown endpoint {endpoint}", HTTPStatus.NOT_FOUND
+            )
+
+        if request.headers.get(hdrs.IF_NONE_MATCH) == _etag(coordinator):
+            if endpoint != ENDPOINT_P1 or "wait" not in request.query:
+                return web.Response(status=HTTPStatus.NOT_MODIFIED)
+            try:
+                timeout = float(request.query["wait"] or DEFAULT_LONG_POLL)
+            except ValueError:
+                timeout = math.nan
+            if not math.isfinite(timeout):
+                return self.json_message(
+                    "wait must be a number of seconds", HTTPStatus.BAD_REQUEST
+                )
+            if not await coordinator.async_wait_for_payload(
+                min(max(timeout, 0), MAX_LONG_POLL)
+            ):
+                return web.Response(status=HTTPStatus.NOT_MODIFIED)
+
+        if coordinator.raw_payload is None:
+            return self.json_message(
+                "No data received from the Zap yet", HTTPStatus.SERVICE_UNAVAILABLE
+            )
+
+        return web.Response(
+            body=coordinator.raw_payload,
+            content_type="application/json",
+            headers={hdrs.ETAG: _etag(coordinator), hdrs.CACHE_CONTROL: "no-cache"},
+        )
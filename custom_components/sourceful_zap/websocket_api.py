@@ -0,0 +1,159 @@
+"""Websocket API streaming P1 snapshots to frontend clients."""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from typing import Any
+
+import voluptuous as vol
+
+from homeassistant.components import websocket_api
+from homeassistant.const import CONF_NAME
+from homeassistant.core import HomeAssistant, callback
+import homeassistant.helpers.config_validation as cv
+from homeassistant.helpers.dispatcher import async_dispatcher_connect
+
+from .const import (
+    CONF_MIN_INTERVAL,
+    CONF_OBIS_CODES,
+    DATA_COORDINATORS,
+    DEFAULT_MIN_INTERVAL,
+    MAX_MIN_INTERVAL,
+    SIGNAL_SNAPSHOT,
+    WS_TYPE_SUBSCRIBE,
+)
+from .snapshot import P1Snapshot
+
+
+@callback
+def async_register_websocket_commands(hass: HomeAssistant) -> None:
+    """Register the websocket commands."""
+    websocket_api.async_register_command(hass, websocket_subscribe)
+
+
+class _SnapshotStream:
+    """Coalesce snapshots for one subscription.
+
+    At most one message is sent per min_interval, chosen by the client.
+    Until the next send only the latest snapshot per Zap is kept, so a slow
+    client skips intermediate telegrams instead of growing a backlog.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        connection: websocket_api.ActiveConnection,
+        msg_id: int,
+        obis_codes: frozenset[str] | None,
+        min_interval: float,
+    ) -> None:
+        """Initialize the stream."""
+        self.hass = hass
+        self.connection = connection
+        self.msg_id = msg_id
+        self.obis_codes = obis_codes
+        self.min_interval = min_interval
+        self.dropped = 0
+        self._pending: dict[str, P1Snapshot] = {}
+        self._send_handle: asyncio.Handle | None = None
+        self._last_send = float("-inf")
+
+    @callback
+    def add(self, snapshot: P1Snapshot) -> None:
+        """Queue a snapshot, replacing an unsent one from the same Zap."""
+        if snapshot.name in self._pending:
+            self.dropped += 1
+        self._pending[snapshot.name] = snapshot
+        if self._send_handle is None:
+            delay = self._last_send + self.min_interval - time.monotonic()
+            if delay > 0:
+                self._send_handle = self.hass.loop.call_later(delay, self._send)
+            else:
+                self._send_handle = self.hass.loop.call_soon(self._send)
+
+    @callback
+    def close(self) -> None:
+        """Stop sending, dropping anything pending."""
+        if self._send_handle is not None:
+            self._send_handle.cancel()
+            self._send_handle = None
+        self._pending.clear()
+
+    @callback
+    def _send(self) -> None:
+        """Send all pending snapshots in one message."""
+        self._send_handle = None
+        if not self._pending:
+            return
+
+        self._last_send = time.monotonic()
+        snapshots = [self._format(snapshot) for snapshot in self._pending.values()]
+        self._pending.clear()
+        self.connection.send_message(
+            websocket_api.event_message(
+                self.msg_id, {"snapshots": snapshots, "dropped": self.dropped}
+            )
+        )
+
+    def _format(self, snapshot: P1Snapshot) -> dict[str, Any]:
+        """Return the snapshot as sent to the client."""
+        data = snapshot.as_dict()
+        if self.obis_codes is not None:
+            data["values"] = {
+                obis_code: value
+                for obis_code, value in snapshot.values.items()
+                if obis_code in self.obis_codes
+            }
+        return data
+
+
+@websocket_api.websocket_command(
+    {
+        vol.Required("type"): WS_TYPE_SUBSCRIBE,
+        vol.Optional(CONF_NAME): cv.string,
+        vol.Optional(CONF_OBIS_CODES): vol.All(cv.ensure_list, [cv.string]),
+        vol.Optional(CONF_MIN_INTERVAL, default=DEFAULT_MIN_INTERVAL): vol.All(
+            vol.Coerce(float), vol.Range(min=0, max=MAX_MIN_INTERVAL)
+        ),
+    }
+)
+@callback
+def websocket_subscribe(
+    hass: HomeAssistant,
+    connection: websocket_api.ActiveConnection,
+    msg: dict[str, Any],
+) -> None:
+    """Stream every new snapshot of one or all Zaps."""
+    coordinators = hass.data.get(DATA_COORDINATORS, {})
+    if (name := msg.get(CONF_NAME)) is not None:
+        if name not in coordinators:
+            connection.send_error(
+                msg["id"], websocket_api.ERR_NOT_FOUND, f"No Zap named {name}"
+            )
+            return
+        names = [name]
+    else:
+        names = list(coordinators)
+
+    obis_codes = msg.get(CONF_OBIS_CODES)
+    stream = _SnapshotStream(
+        hass,
+        connection,
+        msg["id"],
+        frozenset(obis_codes) if obis_codes is not None else None,
+        msg[CONF_MIN_INTERVAL],
+    )
+    unsubs = [
+        async_dispatcher_connect(hass, SIGNAL_SNAPSHOT.format(name), stream.add)
+        for name in names
+    ]
+
+    @callback
+    def unsubscribe() -> None:
+        for unsub in unsubs:
+            unsub()
+        stream.close()
+
+    connection.subscriptions[msg["id"]] = unsubscribe
+    connection.send_result(msg["id"])
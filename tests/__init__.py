@@ -0,0 +1 @@
+"""Tests for the Sourceful Energy Zap integration."""
@@ -0,0 +1,93 @@
+"""Fixtures for Sourceful Energy Zap tests."""
+
+from collections.abc import AsyncGenerator, Callable
+from datetime import timedelta
+import hashlib
+import json
+from typing import Any
+
+from aiohttp import hdrs, web
+import pytest
+
+from homeassistant.core import HomeAssistant
+
+from custom_components.sourceful_zap.p1_coordinator import P1DataCoordinator
+
+P1_PATH = "/api/data/p1/obis"
+SYSTEM_PATH = "/api/system"
+ZAP_URL = "http://zap.local"
+
+P1CoordinatorFactory = Callable[..., P1DataCoordinator]
+
+
+@pytest.fixture(autouse=True)
+def auto_enable_custom_integrations(enable_custom_integrations):
+    """Enable loading the integration from custom_components."""
+    yield
+
+
+class FakeZap:
+    """Local stand-in for a Zap serving the P1 and system endpoints.
+
+    ETags and gzip compression can be switched off to mimic older firmware.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the fake device."""
+        self.payloads: dict[str, Any] = {P1_PATH: {}, SYSTEM_PATH: {}}
+        self.etag = True
+        self.compress = True
+        self.requests = 0
+        self.not_modified = 0
+        self.url = ""
+
+    async def handle(self, request: web.Request) -> web.Response:
+        """Serve the current payload of an endpoint."""
+        self.requests += 1
+        body = json.dumps(self.payloads[request.path]).encode()
+        headers = {}
+        if self.etag:
+            headers[hdrs.ETAG] = f'"{hashlib.sha1(body).hexdigest()}"'
+            if request.headers.get(hdrs.IF_NONE_MATCH) == headers[hdrs.ETAG]:
+                self.not_modified += 1
+                return web.Response(status=304, headers=headers)
+
+        response = web.Response(
+            body=body, content_type="application/json", headers=headers
+        )
+        if self.compress:
+            response.enable_compression()
+        return response
+
+
+@pytest.fixture
+async def fake_zap(socket_enabled) -> AsyncGenerator[FakeZap]:
+    """Run a fake Zap on a local port."""
+    zap = FakeZap()
+    app = web.Application()
+    app.router.add_get(P1_PATH, zap.handle)
+    app.router.add_get(SYSTEM_PATH, zap.handle)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    port = site._server.sockets[0].getsockname()[1]
+    zap.url = f"http://127.0.0.1:{port}"
+    yield zap
+    await runner.cleanup()
+
+
+@pytest.fixture
+def p1_coordinator(hass: HomeAssistant) -> P1CoordinatorFactory:
+    """Return a factory of P1 coordinators that are not started.
+
+    The Zap at url is only contacted when a test polls it, keyword arguments
+    are passed on to the coordinator.
+    """
+
+    def create(url: str = ZAP_URL, **kwargs: Any) -> P1DataCoordinator:
+        return P1DataCoordinator(
+            hass, f"{url}{P1_PATH}", timedelta(seconds=10), **kwargs
+        )
+
+    return create
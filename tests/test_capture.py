@@ -0,0 +1,135 @@
+"""Tests for the raw telegram capture."""
+
+from datetime import UTC, date, datetime, timedelta
+from pathlib import Path
+from zoneinfo import ZoneInfo
+
+from homeassistant.core import HomeAssistant
+
+from custom_components.sourceful_zap.capture import (
+    CaptureReader,
+    TelegramCapture,
+    _index_path,
+    _list_segments,
+    _read_index,
+)
+
+MINUTE = 60_000
+START = int(datetime(2025, 7, 5, 12, tzinfo=UTC).timestamp() * 1000)
+
+
+def _capture(
+    hass: HomeAssistant,
+    path: Path,
+    max_segment_bytes: int = 1_000_000,
+    max_segment_age: timedelta = timedelta(days=1),
+    max_total_bytes: int = 10_000_000,
+) -> TelegramCapture:
+    """Return a capture writing to path."""
+    return TelegramCapture(
+        hass, str(path), max_segment_bytes, max_segment_age, max_total_bytes
+    )
+
+
+def _batch(*timestamps: int) -> list[tuple[int, list[str]]]:
+    """Return a batch of telegrams at the given timestamps."""
+    return [(ts, [f"1-0:1.7.0({ts % 1000:04}.000*kW)"]) for ts in timestamps]
+
+
+def _sizes(segments: list[Path]) -> list[int]:
+    """Return the size on disk of each segment with its index."""
+    return [
+        segment.stat().st_size + _index_path(segment).stat().st_size
+        for segment in segments
+    ]
+
+
+async def test_rotation_by_size(hass: HomeAssistant, tmp_path: Path) -> None:
+    """Test a new segment starts once the active one reaches its size limit."""
+    capture = _capture(hass, tmp_path, max_segment_bytes=1)
+
+    for index in range(3):
+        capture._write_batch(_batch(START + index * MINUTE))
+
+    segments = _list_segments(tmp_path)
+    assert [segment.name for segment in segments] == [
+        f"{START + index * MINUTE}.jsonl.gz" for index in range(3)
+    ]
+    assert all(len(_read_index(_index_path(segment))) == 1 for segment in segments)
+
+
+async def test_rotation_by_age(hass: HomeAssistant, tmp_path: Path) -> None:
+    """Test a new segment starts once the active one reaches its age limit."""
+    capture = _capture(hass, tmp_path, max_segment_age=timedelta(minutes=2))
+
+    capture._write_batch(_batch(START, START + 1000))
+    capture._write_batch(_batch(START + MINUTE))
+    capture._write_batch(_batch(START + 2 * MINUTE))
+
+    first, second = _list_segments(tmp_path)
+    assert first.name == f"{START}.jsonl.gz"
+    assert [block[:2] for block in _read_index(_index_path(first))] == [
+        (START, START + 1000),
+        (START + MINUTE, START + MINUTE),
+    ]
+    assert second.name == f"{START + 2 * MINUTE}.jsonl.gz"
+
+
+async def test_disk_limit(hass: HomeAssistant, tmp_path: Path) -> None:
+    """Test the oldest segments are removed, never the active one."""
+    capture = _capture(hass, tmp_path, max_segment_bytes=1)
+    for index in range(4):
+        capture._write_batch(_batch(START + index * MINUTE))
+    segments = _list_segments(tmp_path)
+    assert len(segments) == 4
+
+    capture.max_total_bytes = sum(_sizes(segments[2:]))
+    capture._enforce_disk_limit()
+    assert _list_segments(tmp_path) == segments[2:]
+    assert not _index_path(segments[1]).exists()
+
+    capture.max_total_bytes = 0
+    capture._enforce_disk_limit()
+    assert _list_segments(tmp_path) == segments[3:]
+
+
+async def test_read_range(hass: HomeAssistant, tmp_path: Path) -> None:
+    """Test a range is read across blocks and segments, end exclusive."""
+    capture = _capture(hass, tmp_path, max_segment_age=timedelta(minutes=2))
+    timestamps = [START + index * 30_000 for index in range(8)]
+    for index in range(0, 8, 2):
+        capture._write_batch(_batch(*timestamps[index : index + 2]))
+    assert len(_list_segments(tmp_path)) == 2
+
+    reader = CaptureReader(str(tmp_path))
+    records = list(
+        reader.read(
+            datetime.fromtimestamp(timestamps[1] / 1000, UTC),
+            datetime.fromtimestamp(timestamps[6] / 1000, UTC),
+        )
+    )
+
+    assert [record["ts"] for record in records] == timestamps[1:6]
+    assert records[0]["data"] == _batch(timestamps[1])[0][1]
+
+
+async def test_read_day_time_zone(hass: HomeAssistant, tmp_path: Path) -> None:
+    """Test a day is read from midnight to midnight in the given time zone."""
+    stockholm = ZoneInfo("Europe/Stockholm")
+    timestamps = [
+        int(moment.timestamp() * 1000)
+        for moment in (
+            datetime(2025, 7, 4, 23, 59, 59, tzinfo=stockholm),
+            datetime(2025, 7, 5, 0, 0, tzinfo=stockholm),
+            datetime(2025, 7, 5, 23, 59, 59, tzinfo=stockholm),
+            datetime(2025, 7, 6, 0, 0, tzinfo=stockholm),
+        )
+    ]
+    _capture(hass, tmp_path)._write_batch(_batch(*timestamps))
+
+    reader = CaptureReader(str(tmp_path))
+    records = reader.read_day(date(2025, 7, 5), stockholm)
+    assert [record["ts"] for record in records] == timestamps[1:3]
+    # The UTC day starts and ends at 02:00 in Stockholm in summer
+    records = reader.read_day(date(2025, 7, 5), UTC)
+    assert [record["ts"] for record in records] == timestamps[2:]
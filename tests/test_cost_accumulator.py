@@ -0,0 +1,201 @@
+"""Tests for the running energy cost."""
+
+from datetime import datetime
+from zoneinfo import ZoneInfo
+
+from freezegun.api import FrozenDateTimeFactory
+import pytest
+
+from homeassistant.core import HomeAssistant
+
+from custom_components.sourceful_zap.cost_accumulator import (
+    DIRECTION_EXPORT,
+    DIRECTION_IMPORT,
+    PERIOD_DAY,
+    PERIOD_MONTH,
+    CostAccumulator,
+)
+
+PRICE_ENTITY = "sensor.price"
+IMPORT_ENERGY = "1-0:1.8.0"
+EXPORT_ENERGY = "1-0:2.8.0"
+STOCKHOLM = ZoneInfo("Europe/Stockholm")
+
+
+@pytest.fixture(autouse=True)
+async def stockholm_time_zone(hass: HomeAssistant) -> None:
+    """Run the tests in a time zone with DST."""
+    await hass.config.async_set_time_zone("Europe/Stockholm")
+
+
+def _local(*args: int) -> datetime:
+    """Return a Stockholm local time."""
+    return datetime(*args, tzinfo=STOCKHOLM)
+
+
+def _telegram(import_kwh: float, export_kwh: float = 0.0) -> dict:
+    """Return the counters of a telegram."""
+    return {
+        IMPORT_ENERGY: {"value": import_kwh, "unit": "kWh"},
+        EXPORT_ENERGY: {"value": export_kwh, "unit": "kWh"},
+    }
+
+
+def _table_entry(start: datetime, end: datetime, value: float | None) -> dict:
+    """Return a Nordpool-style price table entry."""
+    return {"start": start.isoformat(), "end": end.isoformat(), "value": value}
+
+
+async def _accumulator(
+    hass: HomeAssistant, freezer: FrozenDateTimeFactory, now: datetime
+) -> CostAccumulator:
+    """Return a loaded and started accumulator at now."""
+    freezer.move_to(now)
+    accumulator = CostAccumulator(hass, "Zap", PRICE_ENTITY)
+    await accumulator.async_load()
+    accumulator.async_start()
+    return accumulator
+
+
+async def test_delta_split_at_table_boundary(
+    hass: HomeAssistant, freezer: FrozenDateTimeFactory
+) -> None:
+    """Test a delta spanning two table prices is charged at both."""
+    hass.states.async_set(
+        PRICE_ENTITY,
+        "1.0",
+        {
+            "raw_today": [
+                _table_entry(_local(2025, 7, 5, 12), _local(2025, 7, 5, 13), 1.0),
+                _table_entry(_local(2025, 7, 5, 13), _local(2025, 7, 5, 14), 2.0),
+            ]
+        },
+    )
+    accumulator = await _accumulator(hass, freezer, _local(2025, 7, 5, 12))
+
+    accumulator.add(_telegram(1000.0), _local(2025, 7, 5, 12, 30).timestamp())
+    accumulator.add(_telegram(1002.0), _local(2025, 7, 5, 13, 30).timestamp())
+
+    # One kWh before 13:00 at 1.0, one after at 2.0
+    assert accumulator.totals[PERIOD_DAY][DIRECTION_IMPORT] == pytest.approx(3.0)
+    assert accumulator.totals[PERIOD_MONTH][DIRECTION_IMPORT] == pytest.approx(3.0)
+    assert accumulator.totals[PERIOD_DAY][DIRECTION_EXPORT] == 0.0
+    accumulator.async_stop()
+
+
+async def test_delta_across_midnight(
+    hass: HomeAssistant, freezer: FrozenDateTimeFactory
+) -> None:
+    """Test a delta across midnight lands on both days."""
+    accumulator = await _accumulator(hass, freezer, _local(2025, 7, 5, 23))
+    hass.states.async_set(PRICE_ENTITY, "1.0")
+    await hass.async_block_till_done()
+
+    accumulator.add(_telegram(1000.0), _local(2025, 7, 5, 23, 30).timestamp())
+    accumulator.add(_telegram(1002.0), _local(2025, 7, 6, 0, 30).timestamp())
+
+    assert accumulator.period_start[PERIOD_DAY] == _local(2025, 7, 6).timestamp()
+    assert accumulator.totals[PERIOD_DAY][DIRECTION_IMPORT] == pytest.approx(1.0)
+    assert accumulator.totals[PERIOD_MONTH][DIRECTION_IMPORT] == pytest.approx(2.0)
+    accumulator.async_stop()
+
+
+async def test_month_reset(hass: HomeAssistant, freezer: FrozenDateTimeFactory) -> None:
+    """Test the month totals restart at the first of the month."""
+    accumulator = await _accumulator(hass, freezer, _local(2025, 7, 31, 23))
+    hass.states.async_set(PRICE_ENTITY, "1.0")
+    await hass.async_block_till_done()
+
+    accumulator.add(_telegram(1000.0), _local(2025, 7, 31, 23, 30).timestamp())
+    accumulator.add(_telegram(1002.0), _local(2025, 8, 1, 0, 30).timestamp())
+
+    assert accumulator.period_start[PERIOD_MONTH] == _local(2025, 8, 1).timestamp()
+    assert accumulator.totals[PERIOD_DAY][DIRECTION_IMPORT] == pytest.approx(1.0)
+    assert accumulator.totals[PERIOD_MONTH][DIRECTION_IMPORT] == pytest.approx(1.0)
+    accumulator.async_stop()
+
+
+async def test_price_step_between_telegrams(
+    hass: HomeAssistant, freezer: FrozenDateTimeFactory
+) -> None:
+    """Test a price state change between two telegrams splits the delta."""
+    accumulator = await _accumulator(hass, freezer, _local(2025, 7, 5, 12))
+    hass.states.async_set(PRICE_ENTITY, "1.0")
+    accumulator.add(_telegram(1000.0, 50.0), _local(2025, 7, 5, 12).timestamp())
+
+    freezer.move_to(_local(2025, 7, 5, 12, 30))
+    hass.states.async_set(PRICE_ENTITY, "3.0")
+    await hass.async_block_till_done()
+    accumulator.add(_telegram(1002.0, 51.0), _local(2025, 7, 5, 13).timestamp())
+
+    assert accumulator.totals[PERIOD_DAY][DIRECTION_IMPORT] == pytest.approx(4.0)
+    # Export is charged at the import price without an export price entity
+    assert accumulator.totals[PERIOD_DAY][DIRECTION_EXPORT] == pytest.approx(2.0)
+    accumulator.async_stop()
+
+
+async def test_unknown_price_not_counted(
+    hass: HomeAssistant, freezer: FrozenDateTimeFactory
+) -> None:
+    """Test energy used while the price is unknown adds no cost."""
+    hass.states.async_set(
+        PRICE_ENTITY,
+        "1.0",
+        {
+            "raw_today": [
+                _table_entry(_local(2025, 7, 5, 12), _local(2025, 7, 5, 13), 1.0),
+                _table_entry(_local(2025, 7, 5, 13), _local(2025, 7, 5, 14), None),
+            ]
+        },
+    )
+    accumulator = await _accumulator(hass, freezer, _local(2025, 7, 5, 12))
+
+    accumulator.add(_telegram(1000.0), _local(2025, 7, 5, 12, 30).timestamp())
+    accumulator.add(_telegram(1002.0), _local(2025, 7, 5, 14, 30).timestamp())
+
+    # Only the half hour before 13:00 has a price, past the table it is unknown
+    assert accumulator.totals[PERIOD_DAY][DIRECTION_IMPORT] == pytest.approx(0.5)
+    accumulator.async_stop()
+
+
+@pytest.mark.parametrize(
+    ("now", "day_total", "month_total"),
+    [
+        (_local(2025, 7, 5, 23, 45), 2.0, 10.0),
+        (_local(2025, 7, 6, 10), 0.0, 10.0),
+        (_local(2025, 8, 2, 10), 0.0, 0.0),
+    ],
+)
+async def test_restore_rolls_periods(
+    hass: HomeAssistant,
+    hass_storage,
+    freezer: FrozenDateTimeFactory,
+    now: datetime,
+    day_total: float,
+    month_total: float,
+) -> None:
+    """Test restored totals are reset for periods that ended while stopped."""
+    last_import = _local(2025, 7, 5, 23).timestamp()
+    hass_storage["sourceful_zap.cost_zap"] = {
+        "version": 1,
+        "key": "sourceful_zap.cost_zap",
+        "data": {
+            "day_start": _local(2025, 7, 5).timestamp(),
+            "month_start": _local(2025, 7, 1).timestamp(),
+            "totals": {
+                PERIOD_DAY: {DIRECTION_IMPORT: 2.0, DIRECTION_EXPORT: 0.5},
+                PERIOD_MONTH: {DIRECTION_IMPORT: 10.0, DIRECTION_EXPORT: 0.5},
+            },
+            "last": {DIRECTION_IMPORT: [last_import, 1000.0]},
+        },
+    }
+    accumulator = await _accumulator(hass, freezer, now)
+
+    assert accumulator.period_start == {
+        PERIOD_DAY: _local(now.year, now.month, now.day).timestamp(),
+        PERIOD_MONTH: _local(now.year, now.month, 1).timestamp(),
+    }
+    assert accumulator.totals[PERIOD_DAY][DIRECTION_IMPORT] == day_total
+    assert accumulator.totals[PERIOD_MONTH][DIRECTION_IMPORT] == month_total
+    assert accumulator._last == {DIRECTION_IMPORT: (last_import, 1000.0)}
+    accumulator.async_stop()
@@ -0,0 +1,109 @@
+"""Tests for the batched telegram exporter."""
+
+import asyncio
+from unittest.mock import patch
+
+import pytest
+
+from homeassistant.core import HomeAssistant
+
+from custom_components.sourceful_zap import exporter
+from custom_components.sourceful_zap.const import PROTOCOL_TCP, PROTOCOL_UDP
+from custom_components.sourceful_zap.exporter import SnapshotExporter
+
+DATA = {
+    "1-0:1.7.0": {"value": 1.5, "unit": "kW"},
+    "1-0:1.8.0": {"value": 1234.567, "unit": "kWh"},
+}
+
+
+async def _start_tcp_listener() -> tuple[asyncio.AbstractServer, int, asyncio.Queue]:
+    """Start a local TCP listener collecting received lines."""
+    lines: asyncio.Queue[str] = asyncio.Queue()
+
+    async def handle(reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        while line := await reader.readline():
+            lines.put_nowait(line.decode().rstrip("\n"))
+        writer.close()
+
+    server = await asyncio.start_server(handle, "127.0.0.1", 0)
+    return server, server.sockets[0].getsockname()[1], lines
+
+
+@pytest.mark.usefixtures("socket_enabled")
+async def test_tcp_export(hass: HomeAssistant) -> None:
+    """Test batches are sent as line protocol to a TCP listener."""
+    server, port, lines = await _start_tcp_listener()
+    export = SnapshotExporter(hass, "Zap", PROTOCOL_TCP, "127.0.0.1", port)
+    export.add(1000, DATA)
+    export.add(2000, DATA)
+    await export.async_flush()
+
+    received = [await asyncio.wait_for(lines.get(), 5) for _ in range(2)]
+    assert received == [
+        "zap,device=Zap 1-0:1.7.0=1.5,1-0:1.8.0=1234.567 1000000000",
+        "zap,device=Zap 1-0:1.7.0=1.5,1-0:1.8.0=1234.567 2000000000",
+    ]
+
+    await export.async_stop()
+    server.close()
+    await server.wait_closed()
+
+
+@pytest.mark.usefixtures("socket_enabled")
+async def test_udp_export(hass: HomeAssistant) -> None:
+    """Test batches are sent as datagrams to a UDP listener."""
+    datagrams: asyncio.Queue[bytes] = asyncio.Queue()
+
+    class Listener(asyncio.DatagramProtocol):
+        def datagram_received(self, data: bytes, addr) -> None:
+            datagrams.put_nowait(data)
+
+    transport, _ = await hass.loop.create_datagram_endpoint(
+        Listener, local_addr=("127.0.0.1", 0)
+    )
+    port = transport.get_extra_info("sockname")[1]
+    export = SnapshotExporter(hass, "Zap", PROTOCOL_UDP, "127.0.0.1", port)
+    export.add(1000, DATA)
+    await export.async_flush()
+
+    assert await asyncio.wait_for(datagrams.get(), 5) == (
+        b"zap,device=Zap 1-0:1.7.0=1.5,1-0:1.8.0=1234.567 1000000000\n"
+    )
+
+    await export.async_stop()
+    transport.close()
+
+
+@pytest.mark.usefixtures("socket_enabled")
+async def test_sink_down_keeps_records(hass: HomeAssistant) -> None:
+    """Test records are kept and retried later when the listener is down."""
+    server, port, lines = await _start_tcp_listener()
+    server.close()
+    await server.wait_closed()
+
+    export = SnapshotExporter(hass, "Zap", PROTOCOL_TCP, "127.0.0.1", port)
+    export.add(1000, DATA)
+    await export.async_flush()
+
+    assert len(export._buffer) == 1
+    assert export._retry_delay == export.flush_interval.total_seconds()
+
+
+async def test_blackholed_sink_times_out(hass: HomeAssistant) -> None:
+    """Test a connect that never completes does not hold the flush lock."""
+
+    async def never_connect(*args):
+        await asyncio.Event().wait()
+
+    export = SnapshotExporter(hass, "Zap", PROTOCOL_TCP, "192.0.2.1", 8089)
+    export.add(1000, DATA)
+    with (
+        patch.object(exporter, "SEND_TIMEOUT", 0.05),
+        patch.object(exporter.asyncio, "open_connection", never_connect),
+    ):
+        await asyncio.wait_for(export.async_flush(), 5)
+
+    assert not export._flush_lock.locked()
+    assert len(export._buffer) == 1
+    assert export._retry_at > 0
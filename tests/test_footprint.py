@@ -0,0 +1,85 @@
+"""Regression tests for import time and per-entity memory."""
+
+from datetime import timedelta
+from pathlib import Path
+import subprocess
+import sys
+import tracemalloc
+
+from homeassistant.core import HomeAssistant
+
+from custom_components.sourceful_zap.obis_definitions import SENSOR_DESCRIPTIONS
+from custom_components.sourceful_zap.p1_coordinator import P1DataCoordinator
+from custom_components.sourceful_zap.p1_sensor import P1Sensor
+from custom_components.sourceful_zap.system_data_coordinator import (
+    SystemDataCoordinator,
+)
+
+PACKAGE = "custom_components.sourceful_zap"
+# Only imported when the matching option is configured
+OPTIONAL_MODULES = {
+    f"{PACKAGE}.capture",
+    f"{PACKAGE}.cost_accumulator",
+    f"{PACKAGE}.cost_sensor",
+    f"{PACKAGE}.exporter",
+    f"{PACKAGE}.p1_decryption",
+}
+# Generous bounds, a regression is usually a multiple of the current cost
+MAX_IMPORT_TIME = 0.5  # seconds, own modules only
+MAX_ENTITY_MEMORY = 1024  # bytes per P1 sensor
+
+
+def test_platform_import() -> None:
+    """Test the sensor platform loads no optional modules and imports fast."""
+    result = subprocess.run(
+        [
+            sys.executable,
+            "-X",
+            "importtime",
+            "-c",
+            f"import sys, {PACKAGE}.sensor; print(*sys.modules, sep='\\n')",
+        ],
+        capture_output=True,
+        check=True,
+        cwd=Path(__file__).parents[1],
+        text=True,
+    )
+
+    assert not OPTIONAL_MODULES & set(result.stdout.splitlines())
+
+    # importtime lines: "import time: self [us] | cumulative | module"
+    own_time = 0
+    for line in result.stderr.splitlines():
+        fields = line.removeprefix("import time:").split("|")
+        if len(fields) == 3 and fields[2].strip().startswith(PACKAGE):
+            own_time += int(fields[0])
+    assert 0 < own_time / 1_000_000 < MAX_IMPORT_TIME
+
+
+async def test_p1_sensor_memory(hass: HomeAssistant) -> None:
+    """Test P1 sensors share their description and device info."""
+    system_coordinator = SystemDataCoordinator(
+        hass, "http://zap.local/api/system", timedelta(seconds=10)
+    )
+    coordinator = P1DataCoordinator(
+        hass,
+        "http://zap.local/api/data/p1/obis",
+        timedelta(seconds=10),
+        system_coordinator=system_coordinator,
+    )
+
+    tracemalloc.start()
+    try:
+        before = tracemalloc.get_traced_memory()[0]
+        sensors = [
+            P1Sensor(coordinator, system_coordinator, description, "Zap")
+            for description in SENSOR_DESCRIPTIONS
+        ]
+        used = tracemalloc.get_traced_memory()[0] - before
+    finally:
+        tracemalloc.stop()
+
+    assert used / len(sensors) < MAX_ENTITY_MEMORY
+    for sensor, description in zip(sensors, SENSOR_DESCRIPTIONS, strict=True):
+        assert sensor.entity_description is description
+        assert sensor.device_info is sensors[0].device_info
@@ -0,0 +1,91 @@
+"""Tests for conditional and compressed fetches from the Zap."""
+
+import json
+from unittest.mock import patch
+
+import pytest
+
+from homeassistant.core import callback
+
+from custom_components.sourceful_zap.const import UPDATE_CLASS_FAST
+
+from .conftest import P1_PATH, FakeZap, P1CoordinatorFactory
+
+PAYLOAD = {
+    "status": "success",
+    "ts": 1751722190484,
+    "data": [
+        "0-0:1.0.0(250705142950S)",
+        "1-0:1.8.0(00061825.061*kWh)",
+        "1-0:2.8.0(00008702.210*kWh)",
+        *(f"1-0:{index}.7.0(0000.385*kW)" for index in range(21, 81, 20)),
+        *(f"1-0:{index}.7.0(231.2*V)" for index in range(32, 92, 20)),
+        *(f"1-0:{index}.7.0(001.5*A)" for index in range(31, 91, 20)),
+    ],
+}
+RAW_SIZE = len(json.dumps(PAYLOAD).encode())
+
+
+@pytest.mark.parametrize("etag", [True, False])
+@pytest.mark.parametrize("compress", [True, False])
+async def test_unchanged_telegram(
+    p1_coordinator: P1CoordinatorFactory, fake_zap: FakeZap, etag: bool, compress: bool
+) -> None:
+    """Test an unchanged telegram is neither parsed nor published again."""
+    fake_zap.payloads[P1_PATH] = PAYLOAD
+    fake_zap.etag = etag
+    fake_zap.compress = compress
+    coordinator = p1_coordinator(fake_zap.url)
+    fetcher = coordinator.fetcher
+    updates = []
+    coordinator.async_add_listener(
+        callback(lambda: updates.append(1)), UPDATE_CLASS_FAST
+    )
+
+    with patch.object(
+        coordinator, "_parse_obis_data", wraps=coordinator._parse_obis_data
+    ) as parse:
+        await coordinator.async_update()
+        wire_size = fetcher.bytes_received
+        assert (wire_size < RAW_SIZE) is compress
+        assert fetcher.bytes_saved == RAW_SIZE - wire_size
+        assert parse.call_count == 1
+        assert len(updates) == 1
+
+        await coordinator.async_update()
+
+    assert fake_zap.requests == 2
+    assert fetcher.requests == 2
+    if etag:
+        assert fake_zap.not_modified == 1
+        assert fetcher.decodes_skipped == 1
+        assert parse.call_count == 1
+        assert len(updates) == 1
+        assert fetcher.bytes_received == wire_size
+        assert fetcher.bytes_saved == RAW_SIZE
+    else:
+        assert fake_zap.not_modified == 0
+        assert fetcher.decodes_skipped == 0
+        assert parse.call_count == 2
+        assert len(updates) == 2
+        assert fetcher.bytes_received == 2 * wire_size
+        assert fetcher.bytes_saved == 2 * (RAW_SIZE - wire_size)
+    assert coordinator.data["1-0:1.8.0"] == {"value": 61825.061, "unit": "kWh"}
+
+
+async def test_changed_telegram(
+    p1_coordinator: P1CoordinatorFactory, fake_zap: FakeZap
+) -> None:
+    """Test a new telegram is fetched in full after a 304."""
+    fake_zap.payloads[P1_PATH] = PAYLOAD
+    coordinator = p1_coordinator(fake_zap.url)
+
+    await coordinator.async_update()
+    await coordinator.async_update()
+    fake_zap.payloads[P1_PATH] = {**PAYLOAD, "data": ["1-0:1.7.0(0002.000*kW)"]}
+    await coordinator.async_update()
+
+    assert fake_zap.not_modified == 1
+    assert coordinator.fetcher.decodes_skipped == 1
+    assert coordinator.data == {"1-0:1.7.0": {"value": 2.0, "unit": "kW"}}
+    assert coordinator.payload_version == 2
@@ -0,0 +1,111 @@
+"""Tests for the adaptive slowdown under load."""
+
+from unittest.mock import patch
+
+import pytest
+
+from homeassistant.core import HomeAssistant
+
+from custom_components.sourceful_zap.const import TIER_POLL, TIER_SYSTEM
+from custom_components.sourceful_zap.load_guard import (
+    DUTY_CYCLE_BUDGET,
+    ESCALATE_HOLD,
+    PROBE_INTERVAL,
+    RECOVER_SAMPLES,
+    LoadGuard,
+)
+
+MAX_LOOP_LAG = 0.2
+
+
+class _Clock:
+    """Drive the guard's probes on a fake loop clock."""
+
+    def __init__(self, guard: LoadGuard) -> None:
+        """Initialize the clock at the current loop time."""
+        self.guard = guard
+        self.now = guard.hass.loop.time()
+
+    def probe(self, lag: float = 0.0, busy: float = 0.0) -> None:
+        """Run the next probe, lag seconds late after busy seconds of cycles."""
+        self.now += PROBE_INTERVAL + lag
+        self.guard._expected = self.now - lag
+        if busy:
+            self.guard.record_cycle(busy)
+        # Probes are driven here, not by loop timers
+        with (
+            patch.object(self.guard.hass.loop, "time", return_value=self.now),
+            patch.object(self.guard, "_schedule_probe"),
+        ):
+            self.guard._probe()
+
+
+@pytest.fixture
+def clock(hass: HomeAssistant) -> _Clock:
+    """Return a fake clock for a load guard."""
+    return _Clock(LoadGuard(hass, MAX_LOOP_LAG))
+
+
+async def test_lag_escalates_with_hold(clock: _Clock) -> None:
+    """Test lag raises the level one step per hold period."""
+    clock.probe(lag=0.5)
+    assert clock.guard.level == 1
+    assert clock.guard.factor(TIER_SYSTEM) == 4
+    assert clock.guard.factor(TIER_POLL) == 1
+
+    while clock.now < clock.guard._last_escalation + ESCALATE_HOLD - 1:
+        clock.probe(lag=0.5)
+        assert clock.guard.level == 1
+    clock.probe(lag=0.5)
+    assert clock.guard.level == 2
+
+
+async def test_recovers_after_quiet_samples(clock: _Clock) -> None:
+    """Test the level steps down after RECOVER_SAMPLES quiet probes in a row."""
+    clock.probe(lag=0.5)
+    # The lag decays until it is below half the limit, only then it is quiet
+    while clock.guard.loop_lag >= MAX_LOOP_LAG / 2:
+        clock.probe()
+        assert clock.guard.level == 1
+
+    for _ in range(RECOVER_SAMPLES - 2):
+        clock.probe()
+    assert clock.guard.level == 1
+    clock.probe()
+    assert clock.guard.level == 0
+
+
+async def test_lag_resets_recovery(clock: _Clock) -> None:
+    """Test a lagging probe restarts the count of quiet probes."""
+    clock.probe(lag=0.5)
+    while clock.guard.loop_lag >= MAX_LOOP_LAG / 2:
+        clock.probe()
+    for _ in range(RECOVER_SAMPLES - 2):
+        clock.probe()
+
+    clock.probe(lag=0.5)
+    assert clock.guard._healthy_samples == 0
+    assert clock.guard.level == 2
+
+
+async def test_slow_cycles_at_low_rate(clock: _Clock) -> None:
+    """Test a 60 ms cycle every 10 seconds never slows the Zap down."""
+    for index in range(600):
+        clock.probe(busy=0.06 if index % 10 == 0 else 0.0)
+
+    assert clock.guard.level == 0
+    assert clock.guard.cycle_cost > 0.05
+    assert clock.guard.duty_cycle < DUTY_CYCLE_BUDGET / 2
+
+
+async def test_duty_cycle_escalates_and_recovers(clock: _Clock) -> None:
+    """Test cycles taking a large share of loop time raise the level."""
+    while clock.guard.level == 0:
+        clock.probe(busy=0.2)
+    assert clock.guard.duty_cycle > DUTY_CYCLE_BUDGET
+    assert clock.guard.loop_lag == 0
+
+    # Stretched intervals mean fewer cycles, the guard steps back down
+    while clock.guard.level:
+        clock.probe()
+    assert clock.guard.duty_cycle < DUTY_CYCLE_BUDGET / 2
@@ -0,0 +1,103 @@
+"""Tests for the P1 data coordinator."""
+
+from collections import Counter
+from datetime import timedelta
+from unittest.mock import patch
+
+from homeassistant.core import HomeAssistant
+
+from custom_components.sourceful_zap.const import (
+    UPDATE_CLASS_FAST,
+    UPDATE_CLASS_LOW,
+    UPDATE_CLASS_NORMAL,
+)
+from custom_components.sourceful_zap.load_guard import LoadGuard
+
+from .conftest import P1CoordinatorFactory
+
+TELEGRAM = [
+    "0-0:1.0.0(250705142950W)",
+    "1-0:1.8.0(00061825.061*kWh)",
+    "1-0:2.8.0(00008702.210*kWh)",
+    "1-0:1.7.0(0000.000*kW)",
+    "1-0:2.7.0(0000.385*kW)",
+    "1-0:32.7.0(231.2*V)",
+    "1-0:31.7.0(001.5*A)",
+    "1-0:51.7.0(-001.2*A)",
+]
+
+
+async def test_parse_telegram(p1_coordinator: P1CoordinatorFactory) -> None:
+    """Test values are parsed and the meter clock is kept out of the data."""
+    coordinator = p1_coordinator()
+    data = coordinator._parse_obis_data(TELEGRAM)
+
+    assert coordinator.meter_time == "250705142950W"
+    assert "0-0:1.0.0" not in data
+    assert data["1-0:1.8.0"] == {"value": 61825.061, "unit": "kWh"}
+    assert data["1-0:51.7.0"] == {"value": -1.2, "unit": "A"}
+    assert len(data) == len(TELEGRAM) - 1
+
+
+async def test_snapshot_carries_meter_time(
+    p1_coordinator: P1CoordinatorFactory,
+) -> None:
+    """Test the meter clock reaches the snapshot."""
+    coordinator = p1_coordinator()
+    coordinator.data = coordinator._parse_obis_data(TELEGRAM)
+    coordinator.timestamp = 1751722190484
+    coordinator._publish_snapshot()
+
+    assert coordinator.snapshot.meter_time == "250705142950W"
+    assert "0-0:1.0.0" not in coordinator.snapshot.values
+
+
+async def test_telegram_without_meter_time(
+    p1_coordinator: P1CoordinatorFactory,
+) -> None:
+    """Test a telegram without a timestamp clears the previous one."""
+    coordinator = p1_coordinator()
+    coordinator._parse_obis_data(TELEGRAM)
+    coordinator._parse_obis_data(TELEGRAM[1:])
+
+    assert coordinator.meter_time is None
+
+
+async def test_publish_cadence(
+    hass: HomeAssistant, p1_coordinator: P1CoordinatorFactory
+) -> None:
+    """Test slower update classes publish at most once per publish interval."""
+    load_guard = LoadGuard(hass, 0.2)
+    coordinator = p1_coordinator(
+        publish_interval=timedelta(seconds=10), load_guard=load_guard
+    )
+    published: list[str] = []
+    for update_class in (UPDATE_CLASS_FAST, UPDATE_CLASS_NORMAL, UPDATE_CLASS_LOW):
+        coordinator.async_add_listener(
+            lambda update_class=update_class: published.append(update_class),
+            update_class,
+        )
+
+    def telegrams(start: int, count: int) -> Counter[str]:
+        """Notify for a telegram every second and count the updates per class."""
+        published.clear()
+        for now in range(start, start + count):
+            with patch("time.monotonic", return_value=float(now)):
+                coordinator._notify_listeners()
+        return Counter(published)
+
+    assert telegrams(1000, 30) == {
+        UPDATE_CLASS_FAST: 30,
+        UPDATE_CLASS_NORMAL: 3,
+        UPDATE_CLASS_LOW: 3,
+    }
+
+    # Under load normal entities publish every 30 and low every 60 seconds
+    load_guard.level = 3
+    assert load_guard.factor(UPDATE_CLASS_NORMAL) == 3
+    assert load_guard.factor(UPDATE_CLASS_LOW) == 6
+    assert telegrams(1030, 60) == {
+        UPDATE_CLASS_FAST: 60,
+        UPDATE_CLASS_NORMAL: 2,
+        UPDATE_CLASS_LOW: 1,
+    }
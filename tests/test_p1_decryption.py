@@ -0,0 +1,145 @@
+"""Tests for encrypted P1 frames."""
+
+from cryptography.hazmat.primitives.ciphers.aead import AESGCM
+import pytest
+
+from custom_components.sourceful_zap.p1_decryption import (
+    GCM_TAG_LENGTH,
+    SECURITY_AUTHENTICATED,
+    SECURITY_ENCRYPTED,
+    TAG_GENERAL_GLO_CIPHERING,
+    FrameDecryptor,
+)
+
+from .conftest import P1_PATH, FakeZap, P1CoordinatorFactory
+
+KEY = bytes.fromhex("000102030405060708090A0B0C0D0E0F")
+AUTHENTICATION_KEY = bytes.fromhex("D0D1D2D3D4D5D6D7D8D9DADBDCDDDEDF")
+SYSTEM_TITLE = b"SAG\x05\x00\x11\x22\x33"
+TELEGRAM = "\r\n".join(
+    [
+        "0-0:1.0.0(250705142950S)",
+        "1-0:1.8.0(00061825.061*kWh)",
+        "1-0:1.7.0(0001.250*kW)",
+        # Long enough for a multi-byte frame length
+        *(f"1-0:{index}.7.0(0000.000*kW)" for index in range(21, 31)),
+    ]
+)
+
+
+def _encrypt_frame(
+    plaintext: bytes,
+    security: int = SECURITY_ENCRYPTED | SECURITY_AUTHENTICATED,
+    key: bytes = KEY,
+    frame_counter: int = 1,
+) -> bytes:
+    """Return a general-glo-ciphering frame as sent by an encrypting meter."""
+    counter = frame_counter.to_bytes(4, "big")
+    aad = bytes((security,)) + AUTHENTICATION_KEY
+    sealed = AESGCM(key).encrypt(SYSTEM_TITLE + counter, plaintext, aad)
+    if security & SECURITY_AUTHENTICATED:
+        # Meters send the GCM tag truncated to 12 bytes
+        payload = sealed[: len(plaintext) + GCM_TAG_LENGTH]
+    else:
+        # The GCM keystream is the same with or without authentication
+        payload = sealed[: len(plaintext)]
+
+    length = 5 + len(payload)
+    encoded_length = (
+        bytes((length,)) if length < 0x80 else b"\x82" + length.to_bytes(2, "big")
+    )
+    return (
+        bytes((TAG_GENERAL_GLO_CIPHERING, len(SYSTEM_TITLE)))
+        + SYSTEM_TITLE
+        + encoded_length
+        + bytes((security,))
+        + counter
+        + payload
+    )
+
+
+def _decryptor() -> FrameDecryptor:
+    """Return a decryptor with the test keys."""
+    return FrameDecryptor(KEY, AUTHENTICATION_KEY)
+
+
+async def test_authenticated_frame(p1_coordinator: P1CoordinatorFactory) -> None:
+    """Test an encrypted and authenticated (0x30) frame is decrypted."""
+    frame = _encrypt_frame(TELEGRAM.encode())
+    assert frame[2 + len(SYSTEM_TITLE)] == 0x82
+
+    lines = p1_coordinator(decryptor=_decryptor())._decode_data(frame.hex())
+    assert lines == TELEGRAM.split("\r\n")
+
+
+async def test_encryption_only_frame(p1_coordinator: P1CoordinatorFactory) -> None:
+    """Test an encrypted frame without authentication (0x20) is decrypted."""
+    frame = _encrypt_frame(b"1-0:1.7.0(0001.250*kW)", SECURITY_ENCRYPTED)
+
+    lines = p1_coordinator(decryptor=_decryptor())._decode_data(frame.hex())
+    assert lines == ["1-0:1.7.0(0001.250*kW)"]
+
+
+@pytest.mark.parametrize(
+    ("frame", "error"),
+    [
+        (
+            _encrypt_frame(TELEGRAM.encode(), key=bytes(16)),
+            "Authentication failed",
+        ),
+        (_encrypt_frame(TELEGRAM.encode())[:12], "Truncated frame header"),
+        (_encrypt_frame(TELEGRAM.encode())[:-1], "announced bytes"),
+        (b"\x01" + _encrypt_frame(TELEGRAM.encode())[1:], "Unexpected frame tag"),
+    ],
+)
+async def test_invalid_frame(
+    p1_coordinator: P1CoordinatorFactory,
+    caplog: pytest.LogCaptureFixture,
+    frame: bytes,
+    error: str,
+) -> None:
+    """Test frames that cannot be decrypted are logged and skipped."""
+    assert p1_coordinator(decryptor=_decryptor())._decode_data(frame.hex()) is None
+    assert error in caplog.text
+
+
+async def test_frame_without_key(
+    p1_coordinator: P1CoordinatorFactory, caplog: pytest.LogCaptureFixture
+) -> None:
+    """Test an encrypted frame is skipped when no key is configured."""
+    assert p1_coordinator()._decode_data(_encrypt_frame(b"").hex()) is None
+    assert "no key configured" in caplog.text
+
+
+async def test_not_hex_encoded(
+    p1_coordinator: P1CoordinatorFactory, caplog: pytest.LogCaptureFixture
+) -> None:
+    """Test a frame that is not hex encoded is skipped."""
+    assert p1_coordinator(decryptor=_decryptor())._decode_data("not hex") is None
+    assert "not hex encoded" in caplog.text
+
+
+async def test_poll_encrypted_zap(
+    p1_coordinator: P1CoordinatorFactory, fake_zap: FakeZap
+) -> None:
+    """Test telegrams from an encrypting meter reach the coordinator data."""
+    fake_zap.payloads[P1_PATH] = {
+        "status": "success",
+        "ts": 1751722190484,
+        "data": _encrypt_frame(TELEGRAM.encode()).hex(),
+    }
+    coordinator = p1_coordinator(fake_zap.url, decryptor=_decryptor())
+
+    await coordinator.async_update()
+
+    assert coordinator.meter_time == "250705142950S"
+    assert coordinator.data["1-0:1.7.0"] == {"value": 1.25, "unit": "kW"}
+    assert coordinator.snapshot is not None
+
+    # A frame failing authentication leaves the last telegram in place
+    fake_zap.payloads[P1_PATH]["data"] = _encrypt_frame(
+        TELEGRAM.replace("1.250", "9.999").encode(), key=bytes(16), frame_counter=2
+    ).hex()
+    await coordinator.async_update()
+
+    assert coordinator.data["1-0:1.7.0"] == {"value": 1.25, "unit": "kW"}
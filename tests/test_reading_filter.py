@@ -0,0 +1,111 @@
+"""Tests for the reading filter."""
+
+import time
+from typing import Any
+
+from homeassistant.components.sensor import SensorStateClass
+from homeassistant.const import UnitOfEnergy, UnitOfPower
+from homeassistant.core import HomeAssistant
+
+from custom_components.sourceful_zap.reading_filter import (
+    COUNTER_REANCHOR,
+    ReadingFilter,
+    counter_store,
+)
+
+IMPORT_ENERGY = "1-0:1.8.0"
+IMPORT_POWER = "1-0:1.7.0"
+DEFINITIONS = {
+    IMPORT_ENERGY: {
+        "unit": UnitOfEnergy.KILO_WATT_HOUR,
+        "state_class": SensorStateClass.TOTAL_INCREASING,
+    },
+    IMPORT_POWER: {
+        "unit": UnitOfPower.KILO_WATT,
+        "state_class": SensorStateClass.MEASUREMENT,
+    },
+}
+
+
+def _apply(reading_filter: ReadingFilter, value: float, now: float) -> float:
+    """Filter one counter reading and return the value passed on."""
+    data: dict[str, Any] = {IMPORT_ENERGY: {"value": value, "unit": "kWh"}}
+    reading_filter.apply(data, now)
+    return data[IMPORT_ENERGY]["value"]
+
+
+async def test_counter_glitches_never_reanchor() -> None:
+    """Test unrelated glitches do not add up to a new counter level."""
+    reading_filter = ReadingFilter(DEFINITIONS, max_power=100)
+    assert _apply(reading_filter, 1000.0, 0) == 1000.0
+
+    for index in range(COUNTER_REANCHOR * 2):
+        glitch = 29310.0 if index % 2 else 900.0 - index
+        assert _apply(reading_filter, glitch, index + 1) == 1000.0
+
+    assert _apply(reading_filter, 1000.01, COUNTER_REANCHOR * 2 + 1) == 1000.01
+
+
+async def test_counter_reanchors_on_consistent_level() -> None:
+    """Test a new counter level is taken over once readings keep following it."""
+    reading_filter = ReadingFilter(DEFINITIONS, max_power=100)
+    _apply(reading_filter, 1000.0, 0)
+
+    for index in range(1, COUNTER_REANCHOR):
+        assert _apply(reading_filter, 5.0 + index * 0.001, index) == 1000.0
+    accepted = 5.0 + COUNTER_REANCHOR * 0.001
+    assert _apply(reading_filter, accepted, COUNTER_REANCHOR) == accepted
+
+    assert reading_filter.total_rejected == COUNTER_REANCHOR - 1
+
+
+async def test_counter_seeded_after_restart(hass: HomeAssistant, hass_storage) -> None:
+    """Test the first reading after a restart is checked against stored counters."""
+    reading_filter = ReadingFilter(
+        DEFINITIONS, max_power=100, store=counter_store(hass, "Zap")
+    )
+    _apply(reading_filter, 1000.0, time.monotonic())
+    await reading_filter._store.async_save(reading_filter._data_to_store())
+
+    restarted = ReadingFilter(
+        DEFINITIONS, max_power=100, store=counter_store(hass, "Zap")
+    )
+    await restarted.async_load()
+
+    assert _apply(restarted, 29310.0, time.monotonic()) == 1000.0
+    assert _apply(restarted, 1000.001, time.monotonic()) == 1000.001
+
+
+async def test_invalid_stored_counters(hass: HomeAssistant, hass_storage) -> None:
+    """Test invalid stored counters are ignored."""
+    hass_storage["sourceful_zap.filter_zap"] = {
+        "version": 1,
+        "key": "sourceful_zap.filter_zap",
+        "data": {"counters": {IMPORT_ENERGY: "garbage"}},
+    }
+    reading_filter = ReadingFilter(
+        DEFINITIONS, max_power=100, store=counter_store(hass, "Zap")
+    )
+    await reading_filter.async_load()
+
+    assert _apply(reading_filter, 29310.0, time.monotonic()) == 29310.0
+
+
+async def test_power_bound_before_window_full() -> None:
+    """Test power above max power is rejected before the window has filled."""
+    reading_filter = ReadingFilter(DEFINITIONS, max_power=100)
+
+    # Nothing to fall back on yet, the reading is left out
+    data: dict[str, Any] = {IMPORT_POWER: {"value": 5000.0, "unit": "kW"}}
+    reading_filter.apply(data, 0)
+    assert IMPORT_POWER not in data
+
+    values = []
+    for now, value in enumerate((2.0, 4.0, -5000.0, 3.0), 1):
+        data = {IMPORT_POWER: {"value": value, "unit": "kW"}}
+        reading_filter.apply(data, now)
+        values.append(data[IMPORT_POWER]["value"])
+
+    # Rejected readings are replaced by the median so far and never kept
+    assert values == [2.0, 4.0, 3.0, 3.0]
+    assert reading_filter.rejected == {IMPORT_POWER: 2}
@@ -0,0 +1,149 @@
+"""Tests for the virtual site meter."""
+
+from datetime import timedelta
+import math
+from unittest.mock import AsyncMock, Mock, patch
+
+from homeassistant.const import CONF_NAME, EVENT_HOMEASSISTANT_STOP
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.dispatcher import async_dispatcher_send
+
+from custom_components.sourceful_zap.const import (
+    CONF_MAINS,
+    CONF_SUBMETERS,
+    CONF_TOLERANCE,
+    DATA_COORDINATORS,
+    SIGNAL_SNAPSHOT,
+)
+from custom_components.sourceful_zap.site_coordinator import SiteMeterCoordinator
+from custom_components.sourceful_zap.site_sensor import async_setup_site_meter
+from custom_components.sourceful_zap.snapshot import P1Snapshot
+
+from .conftest import P1CoordinatorFactory
+
+IMPORT_POWER = "1-0:1.7.0"
+EXPORT_POWER = "1-0:2.7.0"
+IMPORT_ENERGY = "1-0:1.8.0"
+EXPORT_ENERGY = "1-0:2.8.0"
+
+
+def _send(hass: HomeAssistant, name: str, reading_time: float, **values) -> None:
+    """Send a snapshot of a meter taken at reading_time seconds."""
+    async_dispatcher_send(
+        hass,
+        SIGNAL_SNAPSHOT.format(name),
+        P1Snapshot(name, name, int(reading_time * 1000), None, values),
+    )
+
+
+def _site(hass: HomeAssistant) -> tuple[SiteMeterCoordinator, list[None]]:
+    """Return a started site of one main and one submeter and its updates."""
+    site = SiteMeterCoordinator(hass, ["Main"], ["Sub"], 2.0)
+    updates = []
+    site.async_add_listener(lambda: updates.append(None))
+    site.async_start()
+    return site, updates
+
+
+async def test_aligned_set_publishes(hass: HomeAssistant) -> None:
+    """Test the total and remainder are published for an aligned set."""
+    site, updates = _site(hass)
+
+    _send(hass, "Main", 1000.0, **{IMPORT_POWER: 3.0, EXPORT_POWER: 0.5})
+    assert not updates
+    _send(hass, "Sub", 1001.5, **{IMPORT_POWER: 1.25, EXPORT_POWER: 0.5})
+
+    assert len(updates) == 1
+    assert site.total[:2] == (3.0, 0.5)
+    # Remainder is the total minus the submeters
+    assert site.unmetered[:2] == (1.75, 0.0)
+    site.async_stop()
+
+
+async def test_set_outside_tolerance(hass: HomeAssistant) -> None:
+    """Test readings further apart than the tolerance are not combined."""
+    site, updates = _site(hass)
+
+    _send(hass, "Main", 1000.0, **{IMPORT_POWER: 3.0})
+    _send(hass, "Sub", 1005.0, **{IMPORT_POWER: 1.0})
+    assert not updates
+    assert math.isnan(site.total[0])
+
+    # The next main reading lines up with the submeter again
+    _send(hass, "Main", 1006.0, **{IMPORT_POWER: 4.0})
+    assert len(updates) == 1
+    assert site.unmetered[0] == 3.0
+    site.async_stop()
+
+
+async def test_missing_code_is_nan(hass: HomeAssistant) -> None:
+    """Test a code missing from a meter's telegram makes its site values NaN."""
+    site, updates = _site(hass)
+
+    _send(hass, "Main", 1000.0, **{IMPORT_POWER: 3.0, IMPORT_ENERGY: 100.0})
+    _send(hass, "Sub", 1000.0, **{IMPORT_POWER: 1.0})
+
+    assert len(updates) == 1
+    assert site.total[2] == 100.0
+    assert math.isnan(site.unmetered[2])
+    assert math.isnan(site.total[3])
+    site.async_stop()
+
+
+async def test_lagging_meter_polled(hass: HomeAssistant) -> None:
+    """Test a meter whose latest reading is too old is asked to poll now."""
+    main, sub = Mock(), Mock()
+    hass.data[DATA_COORDINATORS] = {"Main": main, "Sub": sub}
+    site, _updates = _site(hass)
+
+    _send(hass, "Main", 1000.0, **{IMPORT_POWER: 3.0})
+    _send(hass, "Sub", 1001.0, **{IMPORT_POWER: 1.0})
+    main.async_request_refresh.assert_not_called()
+    sub.async_request_refresh.assert_not_called()
+
+    _send(hass, "Main", 1010.0, **{IMPORT_POWER: 3.0})
+    sub.async_request_refresh.assert_called_once()
+    main.async_request_refresh.assert_not_called()
+    site.async_stop()
+
+
+async def test_request_refresh_restarts_schedule(
+    hass: HomeAssistant, p1_coordinator: P1CoordinatorFactory
+) -> None:
+    """Test a requested refresh polls now and restarts the poll schedule."""
+    coordinator = p1_coordinator()
+    with patch.object(coordinator, "async_update", AsyncMock()) as update:
+        coordinator.async_start()
+        first_poll = coordinator._unsub_refresh
+        coordinator.async_request_refresh()
+        await hass.async_block_till_done()
+
+        update.assert_awaited_once()
+        assert coordinator._unsub_refresh not in (None, first_poll)
+
+        # Nothing happens while stopped
+        coordinator.async_stop()
+        coordinator.async_request_refresh()
+        await hass.async_block_till_done()
+        update.assert_awaited_once()
+
+
+async def test_stops_with_home_assistant(hass: HomeAssistant) -> None:
+    """Test the site meter stops following the meters on shutdown."""
+    entities = []
+    await async_setup_site_meter(
+        hass,
+        {
+            CONF_NAME: "Site",
+            CONF_MAINS: ["Main"],
+            CONF_SUBMETERS: [],
+            CONF_TOLERANCE: timedelta(seconds=2),
+        },
+        entities.extend,
+    )
+    site = entities[0].coordinator
+    assert site._unsubs
+
+    hass.bus.async_fire(EVENT_HOMEASSISTANT_STOP)
+    await hass.async_block_till_done()
+    assert not site._unsubs
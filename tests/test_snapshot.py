@@ -0,0 +1,48 @@
+"""Tests for telegram snapshots."""
+
+from datetime import UTC, datetime
+
+import pytest
+
+from homeassistant.core import HomeAssistant
+
+from custom_components.sourceful_zap.snapshot import P1Snapshot, parse_meter_time
+
+
+@pytest.fixture(autouse=True)
+async def stockholm_time_zone(hass: HomeAssistant) -> None:
+    """Run the tests in a time zone with DST."""
+    await hass.config.async_set_time_zone("Europe/Stockholm")
+
+
+def _utc(*args: int) -> float:
+    """Return a UTC time as a timestamp."""
+    return datetime(*args, tzinfo=UTC).timestamp()
+
+
+@pytest.mark.parametrize(
+    ("meter_time", "expected"),
+    [
+        ("250705142950S", _utc(2025, 7, 5, 12, 29, 50)),
+        ("250115142950W", _utc(2025, 1, 15, 13, 29, 50)),
+        # Clocks go back at 03:00 CEST, the hour from 02:00 occurs twice
+        ("251026023000S", _utc(2025, 10, 26, 0, 30)),
+        ("251026023000W", _utc(2025, 10, 26, 1, 30)),
+        ("not a time", None),
+    ],
+)
+async def test_parse_meter_time(meter_time: str, expected: float | None) -> None:
+    """Test meter clock readings map to one instant, also when DST ends."""
+    assert parse_meter_time(meter_time) == expected
+
+
+async def test_reading_time_falls_back_to_ts() -> None:
+    """Test the Zap timestamp is used without a usable meter clock."""
+    snapshot = P1Snapshot("Zap", "zap-1", 1751722190484, None, {})
+    assert snapshot.reading_time == 1751722190.484
+
+    snapshot = P1Snapshot("Zap", "zap-1", 1751722190484, "garbage", {})
+    assert snapshot.reading_time == 1751722190.484
+
+    snapshot = P1Snapshot("Zap", "zap-1", 1751722190484, "250705142950S", {})
+    assert snapshot.reading_time == _utc(2025, 7, 5, 12, 29, 50)
@@ -0,0 +1,75 @@
+"""Tests for the system data coordinator."""
+
+from datetime import timedelta
+from unittest.mock import patch
+
+from homeassistant.core import HomeAssistant
+
+from custom_components.sourceful_zap.system_data_coordinator import (
+    REPROBE_INTERVAL,
+    SystemDataCoordinator,
+)
+
+from .conftest import SYSTEM_PATH, FakeZap
+
+
+def _payload(uptime: int, **network) -> dict:
+    """Return a system payload."""
+    return {
+        "uptime_seconds": uptime,
+        "zap": {
+            "deviceId": "zap-1",
+            "firmwareVersion": "0.1.4",
+            "network": {"localIP": "192.168.1.10", **network},
+        },
+    }
+
+
+async def test_missing_field_reprobed(hass: HomeAssistant, fake_zap: FakeZap) -> None:
+    """Test a field missing at the first poll is picked up by a later probe."""
+    coordinator = SystemDataCoordinator(
+        hass, f"{fake_zap.url}{SYSTEM_PATH}", timedelta(seconds=10)
+    )
+    rssi = coordinator.slots["wifi_rssi"]
+
+    fake_zap.payloads[SYSTEM_PATH] = _payload(1)
+    await coordinator.async_update()
+    assert coordinator.values[coordinator.slots["uptime"]] == 1
+    assert coordinator.values[rssi] is None
+
+    # The field shows up, but is only read from the next probe on
+    for uptime in range(2, REPROBE_INTERVAL + 1):
+        fake_zap.payloads[SYSTEM_PATH] = _payload(uptime, rssi=-60)
+        await coordinator.async_update()
+        assert coordinator.values[rssi] is None
+
+    fake_zap.payloads[SYSTEM_PATH] = _payload(REPROBE_INTERVAL + 1, rssi=-61)
+    await coordinator.async_update()
+    assert coordinator.values[rssi] == -61
+
+    fake_zap.payloads[SYSTEM_PATH] = _payload(REPROBE_INTERVAL + 2, rssi=-62)
+    await coordinator.async_update()
+    assert coordinator.values[rssi] == -62
+
+
+async def test_reprobe_interval(hass: HomeAssistant, fake_zap: FakeZap) -> None:
+    """Test missing fields are probed every REPROBE_INTERVAL polls with new data."""
+    coordinator = SystemDataCoordinator(
+        hass, f"{fake_zap.url}{SYSTEM_PATH}", timedelta(seconds=10)
+    )
+    fake_zap.payloads[SYSTEM_PATH] = _payload(0)
+    await coordinator.async_update()
+
+    with patch.object(
+        coordinator,
+        "_reprobe_missing_fields",
+        wraps=coordinator._reprobe_missing_fields,
+    ) as reprobe:
+        for uptime in range(1, REPROBE_INTERVAL * 2 + 1):
+            fake_zap.payloads[SYSTEM_PATH] = _payload(uptime)
+            await coordinator.async_update()
+        # Unchanged payloads (304) are not counted
+        for _ in range(REPROBE_INTERVAL):
+            await coordinator.async_update()
+
+    assert reprobe.call_count == 2
@@ -0,0 +1,109 @@
+"""Tests for the threshold triggers."""
+
+import time
+from unittest.mock import patch
+
+from homeassistant.const import UnitOfElectricCurrent
+from homeassistant.core import Event, HomeAssistant, callback
+
+from custom_components.sourceful_zap.const import EVENT_THRESHOLD
+from custom_components.sourceful_zap.p1_coordinator import P1DataCoordinator
+from custom_components.sourceful_zap.reading_filter import ReadingFilter
+from custom_components.sourceful_zap.threshold_engine import (
+    STATE_CLEARED,
+    STATE_TRIGGERED,
+    ThresholdEngine,
+    ThresholdRule,
+)
+
+from .conftest import P1CoordinatorFactory
+
+CURRENT_L1 = "1-0:31.7.0"
+# Upper bound for the time from telegram arrival to the event, on any CI runner
+MAX_LATENCY = 0.05
+
+
+def _engine(hass: HomeAssistant) -> ThresholdEngine:
+    """Return an engine with a fuse rule on L1."""
+    return ThresholdEngine(
+        hass, "Zap", [ThresholdRule("Main fuse L1", CURRENT_L1, 25, True, 2)]
+    )
+
+
+async def _feed(coordinator: P1DataCoordinator, current: float) -> None:
+    """Run one poll returning a telegram with the given L1 current."""
+    telegram = {"status": "success", "ts": 0, "data": [f"{CURRENT_L1}({current}*A)"]}
+    with patch.object(coordinator.fetcher, "async_fetch_json", return_value=telegram):
+        await coordinator.async_update()
+
+
+def _capture_events(hass: HomeAssistant) -> list[Event]:
+    """Collect threshold events."""
+    events = []
+
+    @callback
+    def record(event: Event) -> None:
+        events.append(event)
+
+    hass.bus.async_listen(EVENT_THRESHOLD, record)
+    return events
+
+
+async def test_rule_hysteresis_and_duration() -> None:
+    """Test a rule only triggers after its duration and clears past hysteresis."""
+    rule = ThresholdRule("Fuse", CURRENT_L1, 25, True, hysteresis=2, duration=2)
+
+    assert rule.evaluate(30, 0) is None
+    assert rule.evaluate(30, 1) is None
+    assert rule.evaluate(30, 2) == STATE_TRIGGERED
+    assert rule.evaluate(24, 3) is None
+    assert rule.evaluate(22, 4) == STATE_CLEARED
+
+
+async def test_step_triggers_before_filter(
+    hass: HomeAssistant, p1_coordinator: P1CoordinatorFactory
+) -> None:
+    """Test a step the reading filter holds back still triggers at once."""
+    reading_filter = ReadingFilter(
+        {CURRENT_L1: {"unit": UnitOfElectricCurrent.AMPERE}}, max_power=100
+    )
+    coordinator = p1_coordinator(
+        threshold_engine=_engine(hass), reading_filter=reading_filter
+    )
+    events = _capture_events(hass)
+
+    for _ in range(7):
+        await _feed(coordinator, 5)
+    await _feed(coordinator, 50)
+    await hass.async_block_till_done()
+
+    # The filter replaced the step by the median, the rule saw the raw value
+    assert reading_filter.total_rejected == 1
+    assert coordinator.data[CURRENT_L1]["value"] == 5
+    assert len(events) == 1
+    assert events[0].data["state"] == STATE_TRIGGERED
+    assert events[0].data["value"] == 50
+
+
+async def test_trigger_latency(
+    hass: HomeAssistant, p1_coordinator: P1CoordinatorFactory
+) -> None:
+    """Benchmark the time from telegram arrival to the event firing."""
+    coordinator = p1_coordinator(threshold_engine=_engine(hass))
+    engine = coordinator.threshold_engine
+    events = _capture_events(hass)
+
+    for _ in range(100):
+        before = time.perf_counter()
+        await _feed(coordinator, 50)
+        await _feed(coordinator, 5)
+        assert engine.last_latency is not None
+        assert engine.last_latency <= time.perf_counter() - before
+    await hass.async_block_till_done()
+
+    assert len(events) == 200
+    assert all(0 <= event.data["latency_ms"] < MAX_LATENCY * 1000 for event in events)
+    assert engine.max_latency < MAX_LATENCY
+    assert round(engine.max_latency * 1000, 3) == max(
+        event.data["latency_ms"] for event in events
+    )
@@ -0,0 +1,122 @@
+"""Tests for the read-through HTTP view."""
+
+import asyncio
+from http import HTTPStatus
+
+import pytest
+
+from homeassistant.core import HomeAssistant
+from homeassistant.setup import async_setup_component
+
+from custom_components.sourceful_zap.const import DATA_COORDINATORS
+from custom_components.sourceful_zap.p1_coordinator import P1DataCoordinator
+
+from .conftest import P1CoordinatorFactory
+
+URL = "/api/sourceful_zap/Zap/p1"
+PAYLOAD = b'{"status": "success", "data": ["1-0:1.7.0(0002.000*kW)"]}'
+
+
+@pytest.fixture
+async def coordinator(
+    hass: HomeAssistant, p1_coordinator: P1CoordinatorFactory
+) -> P1DataCoordinator:
+    """Set up the integration with one Zap and return its coordinator."""
+    assert await async_setup_component(hass, "sourceful_zap", {})
+    coordinator = p1_coordinator()
+    hass.data.setdefault(DATA_COORDINATORS, {})["Zap"] = coordinator
+    return coordinator
+
+
+async def test_requires_auth(
+    coordinator: P1DataCoordinator, hass_client_no_auth
+) -> None:
+    """Test requests without a token are rejected."""
+    coordinator._set_raw_payload(PAYLOAD)
+    client = await hass_client_no_auth()
+
+    response = await client.get(URL)
+    assert response.status == HTTPStatus.UNAUTHORIZED
+
+
+@pytest.mark.parametrize(
+    "url", ["/api/sourceful_zap/Other/p1", "/api/sourceful_zap/Zap/other"]
+)
+async def test_not_found(coordinator: P1DataCoordinator, hass_client, url: str) -> None:
+    """Test unknown Zaps and endpoints are not found."""
+    coordinator._set_raw_payload(PAYLOAD)
+    client = await hass_client()
+
+    response = await client.get(url)
+    assert response.status == HTTPStatus.NOT_FOUND
+
+
+async def test_no_payload_yet(coordinator: P1DataCoordinator, hass_client) -> None:
+    """Test the view is unavailable before the first payload."""
+    client = await hass_client()
+
+    response = await client.get(URL)
+    assert response.status == HTTPStatus.SERVICE_UNAVAILABLE
+
+
+async def test_etag_not_modified(coordinator: P1DataCoordinator, hass_client) -> None:
+    """Test a matching ETag returns 304 until the payload changes."""
+    coordinator._set_raw_payload(PAYLOAD)
+    client = await hass_client()
+
+    response = await client.get(URL)
+    assert response.status == HTTPStatus.OK
+    assert await response.read() == PAYLOAD
+    etag = response.headers["ETag"]
+
+    response = await client.get(URL, headers={"If-None-Match": etag})
+    assert response.status == HTTPStatus.NOT_MODIFIED
+
+    coordinator._set_raw_payload(PAYLOAD)
+    response = await client.get(URL, headers={"If-None-Match": etag})
+    assert response.status == HTTPStatus.OK
+    assert response.headers["ETag"] != etag
+
+
+async def test_wait_released_by_payload(
+    coordinator: P1DataCoordinator, hass_client
+) -> None:
+    """Test a waiting request is answered as soon as a new payload arrives."""
+    coordinator._set_raw_payload(PAYLOAD)
+    client = await hass_client()
+    etag = (await client.get(URL)).headers["ETag"]
+
+    request = asyncio.create_task(
+        client.get(f"{URL}?wait=30", headers={"If-None-Match": etag})
+    )
+    while coordinator._payload_waiter is None:
+        await asyncio.sleep(0)
+    assert not request.done()
+
+    coordinator._set_raw_payload(b'{"status": "success", "data": []}')
+    response = await request
+    assert response.status == HTTPStatus.OK
+    assert await response.read() == b'{"status": "success", "data": []}'
+
+
+async def test_wait_times_out(coordinator: P1DataCoordinator, hass_client) -> None:
+    """Test a waiting request returns 304 when no payload arrives in time."""
+    coordinator._set_raw_payload(PAYLOAD)
+    client = await hass_client()
+    etag = (await client.get(URL)).headers["ETag"]
+
+    response = await client.get(f"{URL}?wait=0.01", headers={"If-None-Match": etag})
+    assert response.status == HTTPStatus.NOT_MODIFIED
+
+
+@pytest.mark.parametrize("wait", ["soon", "nan", "inf", "-inf"])
+async def test_invalid_wait(
+    coordinator: P1DataCoordinator, hass_client, wait: str
+) -> None:
+    """Test a wait that is not a finite number of seconds is rejected."""
+    coordinator._set_raw_payload(PAYLOAD)
+    client = await hass_client()
+    etag = (await client.get(URL)).headers["ETag"]
+
+    response = await client.get(f"{URL}?wait={wait}", headers={"If-None-Match": etag})
+    assert response.status == HTTPStatus.BAD_REQUEST
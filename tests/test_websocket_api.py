@@ -0,0 +1,96 @@
+"""Tests for the snapshot websocket stream."""
+
+import asyncio
+from datetime import timedelta
+from unittest.mock import Mock
+
+import pytest
+from pytest_homeassistant_custom_component.common import async_fire_time_changed
+
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.dispatcher import async_dispatcher_send
+from homeassistant.setup import async_setup_component
+from homeassistant.util import dt as dt_util
+
+from custom_components.sourceful_zap.const import (
+    DATA_COORDINATORS,
+    SIGNAL_SNAPSHOT,
+    WS_TYPE_SUBSCRIBE,
+)
+from custom_components.sourceful_zap.snapshot import P1Snapshot
+
+
+def _snapshot(power: float) -> P1Snapshot:
+    """Return a snapshot of a Zap named Zap."""
+    return P1Snapshot(
+        "Zap", "zap-1", 0, None, {"1-0:1.7.0": power, "1-0:1.8.0": 1000.0}
+    )
+
+
+@pytest.fixture
+async def ws_client(hass: HomeAssistant, hass_ws_client):
+    """Set up the integration with one Zap and return a websocket client."""
+    assert await async_setup_component(hass, "sourceful_zap", {})
+    hass.data.setdefault(DATA_COORDINATORS, {})["Zap"] = Mock()
+    return await hass_ws_client(hass)
+
+
+async def _no_message(client) -> None:
+    """Assert nothing is sent to the client."""
+    with pytest.raises(asyncio.TimeoutError):
+        await client.receive_json(timeout=0.05)
+
+
+async def test_subscribe_unknown_zap(hass: HomeAssistant, ws_client) -> None:
+    """Test subscribing to an unknown Zap fails."""
+    await ws_client.send_json({"id": 1, "type": WS_TYPE_SUBSCRIBE, "name": "Other"})
+    msg = await ws_client.receive_json()
+    assert not msg["success"]
+    assert msg["error"]["code"] == "not_found"
+
+
+async def test_min_interval_coalesces(hass: HomeAssistant, ws_client) -> None:
+    """Test snapshots within the client's interval are coalesced per Zap."""
+    await ws_client.send_json(
+        {
+            "id": 1,
+            "type": WS_TYPE_SUBSCRIBE,
+            "obis_codes": ["1-0:1.7.0"],
+            "min_interval": 10,
+        }
+    )
+    assert (await ws_client.receive_json())["success"]
+
+    async_dispatcher_send(hass, SIGNAL_SNAPSHOT.format("Zap"), _snapshot(1.0))
+    msg = await ws_client.receive_json()
+    assert msg["event"]["snapshots"][0]["values"] == {"1-0:1.7.0": 1.0}
+    assert msg["event"]["dropped"] == 0
+
+    for power in (2.0, 3.0, 4.0):
+        async_dispatcher_send(hass, SIGNAL_SNAPSHOT.format("Zap"), _snapshot(power))
+    await _no_message(ws_client)
+
+    async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=11))
+    msg = await ws_client.receive_json()
+    assert [snapshot["values"] for snapshot in msg["event"]["snapshots"]] == [
+        {"1-0:1.7.0": 4.0}
+    ]
+    assert msg["event"]["dropped"] == 2
+    await _no_message(ws_client)
+
+
+async def test_unsubscribe_cancels_pending(hass: HomeAssistant, ws_client) -> None:
+    """Test nothing is sent after unsubscribing."""
+    await ws_client.send_json({"id": 1, "type": WS_TYPE_SUBSCRIBE, "min_interval": 10})
+    assert (await ws_client.receive_json())["success"]
+    async_dispatcher_send(hass, SIGNAL_SNAPSHOT.format("Zap"), _snapshot(1.0))
+    await ws_client.receive_json()
+
+    async_dispatcher_send(hass, SIGNAL_SNAPSHOT.format("Zap"), _snapshot(2.0))
+    await ws_client.send_json(
+        {"id": 2, "type": "unsubscribe_events", "subscription": 1}
+    )
+    assert (await ws_client.receive_json())["success"]
+
+    async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=11))
+    await _no_message(ws_client)